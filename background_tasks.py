@@ -1,8 +1,7 @@
 import asyncio
-import math
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import List, Set
+from typing import Iterable, List, Optional, Set
 
 from fastapi import FastAPI
 
@@ -10,10 +9,33 @@ from newsfeed.config import (
     ASSESS_CORRECTNESS_WITH_BIGGER_MODEL,
     ASSESS_EFFICIENCY,
     MAX_ITEMS,
-    PERSISTENCE_TIME,
+    PIPELINED_INGESTION,
+)
+from newsfeed.ingestion.filtering import (
+    flush_classification_caches,
+    get_classification_cache_stats,
+    get_classifier_readiness,
+    get_prefilter_stats,
+    save_score_store,
+    save_score_store_if_due,
+    start_classifier_warmup,
+    stop_classifier_warmup,
+)
+from newsfeed.ingestion.http_client import get_http_stats
+from newsfeed.ingestion.inference_pool import shutdown_inference_pools
+from newsfeed.ingestion.pipeline import IngestionPipeline
+from newsfeed.ingestion.snippets import get_batch_token_stats
+from newsfeed.log_utils import (
+    log_accepted,
+    log_efficiency,
+    log_error,
+    log_resource_usage,
 )
-from newsfeed.log_utils import log_accepted, log_efficiency, log_resource_usage
 from newsfeed.models import NewsItem
+from newsfeed.ranking import RankingIndex, recency_lambda
+
+# Shortest sleep of the ingestion loop between scheduler checks (seconds)
+MIN_POLL_SLEEP = 1.0
 
 
 class BackgroundTaskManager:
@@ -22,54 +44,128 @@ class BackgroundTaskManager:
     def __init__(
         self,
         ingestion_manager,
-        accepted_items: List[NewsItem],
+        accepted_items: Iterable[NewsItem],
         accepted_item_ids: Set[str],
         all_items: List[NewsItem] = None,
+        classification_service=None,
     ):
         self.ingestion_manager = ingestion_manager
+        self.classification_service = classification_service
+        # Accepted items ranked by final_score (a list is indexed on arrival)
+        if not isinstance(accepted_items, RankingIndex):
+            accepted_items = RankingIndex(accepted_items)
+        accepted_items.recency_lambda = recency_lambda(ingestion_manager.interval)
         self.accepted_items = accepted_items
         self.accepted_item_ids = accepted_item_ids
         self.all_items = all_items if all_items is not None else []
         self.shutdown_flag = False
+        self.initial_fetch_done = False
+        # Items added and start time of the current pipelined merge burst
+        self._burst_added = 0
+        self._burst_reported_at = time.perf_counter()
+        # Staged fetch -> normalize -> classify -> merge ingestion
+        self.pipeline = (
+            IngestionPipeline(
+                ingestion_manager, self.merge_items, seen_ids=accepted_item_ids
+            )
+            if PIPELINED_INGESTION
+            else None
+        )
 
-    def update_recency_final_scores(self):
-        """Update recency weights and final scores for all accepted items"""
-        if not self.accepted_items:
-            return
-
-        reference_time = datetime.now(timezone.utc)
-        persistence_time = PERSISTENCE_TIME * self.ingestion_manager.interval
-        recency_lambda = 1 / persistence_time if persistence_time > 0 else 0.0
-
-        for item in self.accepted_items:
-            if item.relevance_score is not None:
-                delta_seconds = (reference_time - item.published_at).total_seconds()
-                item.recency_weight = math.exp(-recency_lambda * delta_seconds)
-                item.final_score = item.relevance_score * item.recency_weight
-            else:
-                item.recency_weight = None
-                item.final_score = None
-
-        # Trim accepted_items to MAX_ITEMS by final_score
-        if len(self.accepted_items) > MAX_ITEMS:
-            self.accepted_items.sort(
-                key=lambda x: (x.final_score if x.final_score is not None else -1),
-                reverse=True,
+    def log_filter_stats(self, step: str):
+        """Log prefilter and classification cache counters (traffic that skipped the model)"""
+        prefilter = get_prefilter_stats()
+        log_efficiency(
+            f"Prefilter ({prefilter['mode']}): {prefilter['fast_track']} fast-track, "
+            f"{prefilter['reject']} reject, {prefilter['deferred']} undecided; "
+            f"{prefilter['skipped']} skipped the model "
+            f"(skip rate {prefilter['skip_rate']:.1%}), "
+            f"{prefilter['fast_tracked']} accepted on the fast track; "
+            f"{prefilter['disagreed']} contradicted by the model",
+            step=step,
+        )
+        stats = get_classification_cache_stats()
+        log_efficiency(
+            f"Classification cache: {stats['memory_hits']} memory hits, "
+            f"{stats['disk_hits']} disk hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evictions (hit rate {stats['hit_rate']:.1%})",
+            step=step,
+        )
+        tokens = get_batch_token_stats()
+        log_efficiency(
+            f"Classifier batches: {tokens['tokens_per_item']:.1f} tokens/item, "
+            f"padding waste {tokens['padding_waste']:.1%} over {tokens['batches']} batches",
+            step=step,
+        )
+        for source_name, http in get_http_stats().items():
+            log_efficiency(
+                f"HTTP {source_name}: {http['requests']} requests, "
+                f"{http['bytes'] / 1024:.1f} KiB downloaded, "
+                f"304 rate {http['not_modified_rate']:.1%}, "
+                f"connection reuse {http['connection_reuse_rate']:.1%}",
+                step=step,
+            )
+        if self.pipeline is not None:
+            for stage, pipeline in self.pipeline.stats().items():
+                depth = (
+                    f"{pipeline['in_flight']} in flight"
+                    if stage == "fetch"
+                    else f"queue depth {pipeline['queue_depth']}"
+                )
+                log_efficiency(
+                    f"Pipeline {stage}: {pipeline['processed']} processed, {depth}, "
+                    f"latency mean {pipeline['latency_ms_mean']:.1f} ms / p95 {pipeline['latency_ms_p95']:.1f} ms",
+                    step=step,
+                )
+        scheduler = self.ingestion_manager.scheduler
+        if scheduler is not None:
+            for source_name, poll in scheduler.stats().items():
+                log_efficiency(
+                    f"Polling {source_name}: every {poll['interval']:.0f}s "
+                    f"({poll['items_per_minute']:.2f} items/min, "
+                    f"{poll['failures']} consecutive failures, next in {poll['next_poll_in']:.0f}s)",
+                    step=step,
+                )
+        for source_name, breaker in self.ingestion_manager.breaker_stats().items():
+            log_efficiency(
+                f"Circuit {source_name}: {breaker['state']}, {breaker['trips']} trips, "
+                f"{breaker['consecutive_failures']} consecutive failures "
+                f"(cool-down {breaker['cooldown']:.0f}s, reopens in {breaker['reopens_in']:.0f}s)",
+                step=step,
+            )
+        if self.classification_service is not None:
+            service = self.classification_service.stats()
+            log_efficiency(
+                f"Micro-batching: {service['requests']} requests in {service['batches']} batches "
+                f"(mean size {service['mean_batch_size']:.1f}, queue depth {service['queue_depth']}, "
+                f"wait p50 {service['wait_ms']['p50']:.1f} ms / p95 {service['wait_ms']['p95']:.1f} ms)",
+                step=step,
             )
-            del self.accepted_items[MAX_ITEMS:]
-            # Update the set of IDs
-            self.accepted_item_ids.clear()
-            self.accepted_item_ids.update(item.id for item in self.accepted_items)
+
+    def trim_accepted_items(self):
+        """Keep the MAX_ITEMS best-ranked accepted items (drops the lowest final_score)"""
+        for item in self.accepted_items.trim(MAX_ITEMS):
+            self.accepted_item_ids.discard(item.id)
 
     async def background_ingest_async(self):
         """Async version of background ingestion"""
         while not self.shutdown_flag:
-            print("Starting continuous background ingestion cycle.")
+            # Wait for the earliest per-source deadline (INTERVAL without the scheduler)
+            due_sources = self.ingestion_manager.due_sources()
+            if not due_sources:
+                await asyncio.sleep(
+                    max(
+                        MIN_POLL_SLEEP, self.ingestion_manager.seconds_until_next_poll()
+                    )
+                )
+                continue
+
+            print(
+                f"Starting continuous background ingestion cycle ({len(due_sources)} sources due)."
+            )
             ingestion_latency = None
 
             if ASSESS_EFFICIENCY:
-                import time
-
                 ingestion_start = time.perf_counter()
 
             # Run the blocking I/O in a thread pool
@@ -79,7 +175,7 @@ class BackgroundTaskManager:
                 result = await loop.run_in_executor(
                     None,
                     lambda: self.ingestion_manager.continuous_fetch_sources(
-                        store_filtered=True
+                        store_filtered=True, sources=due_sources
                     ),
                 )
                 new_items_from_sources, filtered_items_from_sources = result
@@ -87,7 +183,10 @@ class BackgroundTaskManager:
                 self.all_items.extend(filtered_items_from_sources)
             else:
                 new_items_from_sources = await loop.run_in_executor(
-                    None, self.ingestion_manager.continuous_fetch_sources
+                    None,
+                    lambda: self.ingestion_manager.continuous_fetch_sources(
+                        sources=due_sources
+                    ),
                 )
                 filtered_items_from_sources = []
 
@@ -99,7 +198,9 @@ class BackgroundTaskManager:
                     newly_added_count += 1
                     log_accepted(item, step="background_ingest")
 
-            self.update_recency_final_scores()
+            self.trim_accepted_items()
+            self.initial_fetch_done = True
+            await loop.run_in_executor(None, save_score_store_if_due)
 
             if ASSESS_EFFICIENCY:
                 ingestion_end = time.perf_counter()
@@ -120,6 +221,7 @@ class BackgroundTaskManager:
                 log_efficiency(
                     f"Items processed: {newly_added_count} new items", step="Ingestion"
                 )
+                self.log_filter_stats("Ingestion")
                 log_resource_usage("Ingestion")
 
             print(
@@ -127,15 +229,14 @@ class BackgroundTaskManager:
                 f"Total accumulated items: {len(self.accepted_items)}."
             )
 
-            # Wait for the interval
-            await asyncio.sleep(self.ingestion_manager.interval)
+            await asyncio.sleep(
+                max(MIN_POLL_SLEEP, self.ingestion_manager.seconds_until_next_poll())
+            )
 
     async def initial_fetch_async(self):
         """Perform initial fetch of news items"""
         startup_latency = None
         if ASSESS_EFFICIENCY:
-            import time
-
             startup_start = time.perf_counter()
 
         self.ingestion_manager.start()
@@ -165,7 +266,7 @@ class BackgroundTaskManager:
                 self.accepted_item_ids.add(item.id)
                 initial_added_count += 1
 
-        self.update_recency_final_scores()
+        self.trim_accepted_items()
 
         if ASSESS_EFFICIENCY:
             startup_end = time.perf_counter()
@@ -180,6 +281,7 @@ class BackgroundTaskManager:
             log_efficiency(
                 f"Items processed: {initial_added_count} items", step="Startup"
             )
+            self.log_filter_stats("Startup")
             log_resource_usage("Startup")
 
         print(
@@ -189,6 +291,82 @@ class BackgroundTaskManager:
 
         return initial_added_count
 
+    async def merge_items(
+        self, new_items: List[NewsItem], filtered_items: List[NewsItem]
+    ):
+        """Merge stage of the pipeline: add accepted items and refresh scores"""
+        if ASSESS_CORRECTNESS_WITH_BIGGER_MODEL:
+            self.all_items.extend(new_items)
+            self.all_items.extend(filtered_items)
+        for item in new_items:
+            if item.id not in self.accepted_item_ids:
+                self.accepted_items.append(item)
+                self.accepted_item_ids.add(item.id)
+                self._burst_added += 1
+                log_accepted(item, step="background_ingest")
+        self.trim_accepted_items()
+        self.initial_fetch_done = True
+        if self.pipeline is not None and self.pipeline.queues["merge"].empty():
+            # End of a burst: persist the score vectors (when due) and report
+            await asyncio.get_running_loop().run_in_executor(
+                None, save_score_store_if_due
+            )
+            self.log_burst_efficiency()
+
+    def log_burst_efficiency(self):
+        """
+        Latency (first fetch submitted -> last item merged), throughput and
+        item count of the merge burst that just ended, like a serial cycle
+        """
+        now = time.perf_counter()
+        started = self.pipeline.take_burst_start()
+        # Fetches submitted before the previous report: count from that report
+        started = self._burst_reported_at if started is None else started
+        added, self._burst_added = self._burst_added, 0
+        self._burst_reported_at = now
+        if not ASSESS_EFFICIENCY:
+            return
+        latency = now - started
+        throughput = added / latency if latency > 0 else 0.0
+        log_efficiency(f"Latency: {latency:.4f} seconds", step="Ingestion")
+        log_efficiency(f"Throughput: {throughput:.2f} items/s", step="Ingestion")
+        log_efficiency(f"Items processed: {added} new items", step="Ingestion")
+        self.log_filter_stats("Ingestion")
+        log_resource_usage("Ingestion")
+
+    async def run_ingestion_async(self):
+        """Initial fetch followed by continuous background ingestion"""
+        try:
+            await self.initial_fetch_async()
+            self.initial_fetch_done = True
+        except Exception as e:
+            # Not ready until a later fetch cycle succeeds
+            log_error(
+                f"Initial fetch failed: {e}; readiness waits for the first successful ingestion cycle",
+                source="MAIN",
+                exc_info=True,
+            )
+        if self.pipeline is not None:
+            await self.pipeline.run()
+        else:
+            await self.background_ingest_async()
+
+    def classifier_backend_names(self) -> List[Optional[str]]:
+        """Classifier backends used by the configured sources (None = default)"""
+        return [None] + [
+            getattr(source, "classifier_backend", None)
+            for source in self.ingestion_manager.sources
+        ]
+
+    def readiness(self) -> dict:
+        """Ready once every classifier backend is warmed up and the first fetch is done"""
+        classifiers = get_classifier_readiness(self.classifier_backend_names())
+        return {
+            "ready": self.initial_fetch_done and all(classifiers.values()),
+            "classifiers": classifiers,
+            "initial_fetch_done": self.initial_fetch_done,
+        }
+
     def create_lifespan_context(self):
         """Create the lifespan context manager for FastAPI"""
 
@@ -197,12 +375,15 @@ class BackgroundTaskManager:
             # Startup
             print("Application startup initiated.")
 
-            # Perform initial fetch
-            await self.initial_fetch_async()
+            # Load the classifier(s) in the background; the app serves requests
+            # (and /healthz/ready reports progress) while the model loads
+            start_classifier_warmup(self.classifier_backend_names())
 
-            # Start background task
-            task = asyncio.create_task(self.background_ingest_async())
-            print("Application startup complete. Continuous ingestion scheduled.")
+            # Initial fetch and continuous ingestion run as one background task
+            task = asyncio.create_task(self.run_ingestion_async())
+            print(
+                "Application startup complete. Initial fetch and ingestion scheduled."
+            )
 
             yield
 
@@ -215,6 +396,12 @@ class BackgroundTaskManager:
             except asyncio.CancelledError:
                 pass
             self.ingestion_manager.stop()
+            stop_classifier_warmup()
+            if self.classification_service is not None:
+                await self.classification_service.stop()
+            shutdown_inference_pools()
+            flush_classification_caches()
+            save_score_store()
             print("Application shutdown complete.")
 
         return lifespan
@@ -1,19 +1,248 @@
 # config.py
+import os
 
 # Minimum score threshold for the zero-shot relevance filter.
 # Items with a relevant label score below this value will be filtered out.
 MIN_SCORE = 0.08
 
+# Number of items scored per zero-shot forward pass when a whole ingestion
+# cycle is classified at once (each item expands to one NLI pair per label).
+CLASSIFIER_BATCH_SIZE = 8
+# Classifier input = title + first CLASSIFIER_SNIPPET_SENTENCES body sentences,
+# cut at CLASSIFIER_SNIPPET_MAX_TOKENS tokens of the classifier's tokenizer
+CLASSIFIER_SNIPPET_SENTENCES = 2
+CLASSIFIER_SNIPPET_MAX_TOKENS = 128
+
+# Relevance classifier backends. Every entry shares one interface (batch of
+# texts + labels -> score matrix), so deployments can trade accuracy for
+# throughput without touching filtering.py. For "zero_shot" entries, `runtime` is
+#   "torch"      - fp32 PyTorch (GPU if available)
+#   "torch_int8" - PyTorch dynamic int8 quantization of the Linear layers (CPU)
+#   "onnx_int8"  - ONNX Runtime graph with dynamic int8 quantization (CPU);
+#                  needs `pip install optimum[onnxruntime]`, falls back to torch_int8
+#                  (the fingerprint of the classification cache follows)
+# "stub" scores labels by keyword match and loads no model (tests, dry runs).
+# A source can pick its own backend with a "classifier" key in NEWS_SOURCES.
+CLASSIFIER_BACKENDS = {
+    "bart": {"type": "zero_shot", "model": "facebook/bart-large-mnli"},
+    "bart_int8": {
+        "type": "zero_shot",
+        "model": "facebook/bart-large-mnli",
+        "runtime": "torch_int8",
+    },
+    "bart_onnx": {
+        "type": "zero_shot",
+        "model": "facebook/bart-large-mnli",
+        "runtime": "onnx_int8",
+    },
+    "distilbart": {"type": "zero_shot", "model": "valhalla/distilbart-mnli-12-1"},
+    "minilm": {"type": "zero_shot", "model": "cross-encoder/nli-MiniLM2-L6-H768"},
+    "stub": {"type": "stub"},
+}
+DEFAULT_CLASSIFIER_BACKEND = "bart"
+# Where exported/quantized ONNX graphs are kept between restarts
+ONNX_EXPORT_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache", "onnx"
+)
+
+# Classification cache: number of score vectors kept in the in-memory LRU and
+# the SQLite file backing it across restarts (set the path to None to keep the
+# cache in memory only).
+CLASSIFICATION_CACHE_SIZE = 4096
+CLASSIFICATION_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache", "classification_cache.sqlite3"
+)
+# Rows kept per backend in the SQLite file (oldest dropped first)
+CLASSIFICATION_CACHE_DISK_SIZE = 100000
+# Cache writes committed to SQLite per transaction (also flushed after each
+# classified batch and at shutdown)
+CACHE_COMMIT_EVERY = 64
+
+# Classifier worker processes (0 = run inference in-process). Each worker loads
+# the model once; batches are sharded across workers.
+INFERENCE_WORKERS = 0
+# torch intra-op threads per worker (workers * threads should not exceed cores)
+INFERENCE_THREADS_PER_WORKER = 1
+# Max batches in flight across the pool before submissions block
+INFERENCE_QUEUE_SIZE = 16
+
+# Micro-batching classification service: a batch is dispatched when
+# CLASSIFIER_BATCH_SIZE requests are pending or the oldest one has waited this long
+MICRO_BATCH_MAX_WAIT_MS = 25
+# Run the relevance filter on items posted to /ingest (False = accept them as-is)
+CLASSIFY_INGESTED_ITEMS = False
+
+# Filter decisions kept in memory for /debug/filter-log (oldest overwritten)
+FILTER_LOG_CAPACITY = 10000
+# Optional JSON-lines spill of every filter decision (None = disabled),
+# rotated at FILTER_LOG_SPILL_MAX_BYTES with FILTER_LOG_SPILL_BACKUPS old files
+FILTER_LOG_SPILL_PATH = None
+FILTER_LOG_SPILL_MAX_BYTES = 10 * 1024 * 1024
+FILTER_LOG_SPILL_BACKUPS = 3
+
+# Larger instruction-tuned model used to assess the filter (ASSESS_CORRECTNESS_WITH_BIGGER_MODEL)
+ASSESSOR_MODEL = "tiiuae/falcon-7b-instruct"
+# Articles per assessor forward pass
+ASSESSOR_BATCH_SIZE = 8
+# On-disk cache of assessor verdicts keyed by article content hash
+ASSESSMENT_CACHE_SIZE = 4096
+ASSESSMENT_CACHE_DISK_SIZE = 100000
+ASSESSMENT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache", "assessment_cache.sqlite3"
+)
+
+# Per-label zero-shot scores of classified items, for offline threshold sweeps
+# (python -m newsfeed.evaluate_thresholds). None = keep in memory only.
+SCORE_STORE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache", "score_store.npz"
+)
+SCORE_STORE_MAX_ITEMS = 50000
+# Seconds between saves of the score store during ingestion (also saved at
+# shutdown)
+SCORE_STORE_SAVE_INTERVAL = 300
+
 # Maximum number of news items to keep in memory (accepted_items).
 # When this limit is exceeded, items with the lowest final_score are removed.
 MAX_ITEMS = 100
 
+# Rule-based prefilter in front of the zero-shot classifier. Items matching only
+# the negative lexicon are "reject" candidates; items matching only strong
+# positive terms (the RELEVANT_LABELS themselves plus the terms below) are
+# "fast_track" candidates. PREFILTER_MODE:
+#   "off"     - no lexicon scan
+#   "report"  - the lexicon decision is only logged and counted next to the
+#               model's (measure the lexicon on live traffic before enforcing it)
+#   "enforce" - rejects skip inference; fast-tracked items are accepted even
+#               below MIN_SCORE, ranked by their model score
+PREFILTER_MODE = "report"
+# Extra fast-track term -> relevant label it maps to (terms ending in
+# punctuation, like "CVE-", match as prefixes)
+PREFILTER_FAST_TRACK_TERMS = {
+    "CVE-": "Vulnerability",
+    "zero-day": "Vulnerability",
+    "0-day": "Vulnerability",
+    "remote code execution": "Vulnerability",
+    "actively exploited": "Vulnerability",
+    "ransomware": "Security Incident",
+    "data breach": "Security Incident",
+}
+# Fragments of RELEVANT_LABELS too generic to fast-track on their own
+PREFILTER_IGNORED_LABEL_TERMS = ["Issue", "System"]
+PREFILTER_NEGATIVE_TERMS = [
+    "hiring",
+    "job opening",
+    "job posting",
+    "career advice",
+    "salary",
+    "meme",
+    "shitpost",
+    "AMA",
+    "product launch",
+    "launches",
+    "unveils",
+    "giveaway",
+    "meetup",
+    "Review:",
+    "Top 5",
+    "Top 10",
+]
+
 # Interval (in seconds) between each background ingestion (fetch) cycle.
 INTERVAL = 30  # seconds
 
 # Number of posts to fetch per source during the initial ingestion.
 NUMBER_INITIAL_POST_PER_SOURCE = 5
 
+# Sources fetched in parallel by the IngestionManager
+SOURCE_FETCH_CONCURRENCY = 8
+# Seconds a source fetch may take (HTTP timeout and hard cap per cycle)
+SOURCE_FETCH_TIMEOUT = 10
+# Threads kept on top of SOURCE_FETCH_CONCURRENCY for abandoned fetches (timed
+# out but still blocked); while that many are stuck, fetches that find no free
+# thread are skipped
+SOURCE_FETCH_MAX_ABANDONED = SOURCE_FETCH_CONCURRENCY
+# Keep-alive connections kept per host by the shared HTTP client
+HTTP_POOL_MAXSIZE = SOURCE_FETCH_CONCURRENCY
+# User-Agent sent by the shared HTTP client (Reddit rejects generic agents)
+HTTP_USER_AGENT = "newsfeed-bot/0.1"
+# URLs whose ETag / Last-Modified the shared HTTP client keeps for
+# conditional GETs (least recently used dropped first)
+HTTP_VALIDATOR_CACHE_SIZE = 1024
+# Bytes read per chunk when a response body is streamed into a parser
+HTTP_STREAM_CHUNK_SIZE = 16 * 1024
+# Parse RSS feeds incrementally (stopping at the last seen entry) instead of
+# running feedparser over the whole document
+RSS_STREAMING_PARSE = True
+
+# Reddit listing page size (Reddit caps `limit` at 100)
+REDDIT_PAGE_SIZE = 100
+# Pages followed per fetch when a burst of new posts arrived
+REDDIT_MAX_PAGES = 5
+# Empty incremental polls between checks that the `before` cursor still works
+REDDIT_CURSOR_CHECK_EVERY = 5
+# Read subreddits in combined `r/a+b+c/new.json` listings (one request per group)
+REDDIT_COALESCE = True
+# Subreddits per combined listing. A group shares one listing (at most
+# REDDIT_PAGE_SIZE posts per page), so keep a group's posts per INTERVAL well
+# under REDDIT_PAGE_SIZE * REDDIT_MAX_PAGES
+REDDIT_GROUP_SIZE = 25
+
+# Adaptive per-source polling (False: every source every INTERVAL seconds)
+ADAPTIVE_POLLING = True
+# Bounds of a source's polling interval (seconds)
+POLL_MIN_INTERVAL = 10
+POLL_MAX_INTERVAL = 300
+# New items per poll the adaptive interval aims for
+POLL_TARGET_ITEMS = 3
+# Weight of the latest observation in a source's post-rate EWMA
+POLL_EWMA_ALPHA = 0.3
+# Longest backoff after 429/5xx or failed fetches (seconds)
+POLL_BACKOFF_MAX = 900
+# HTTP requests per minute allowed across all sources
+POLL_REQUEST_BUDGET = 30
+# Wait for X-Ratelimit-Reset when fewer requests than this remain
+RATELIMIT_MIN_REMAINING = 5
+
+# Run continuous ingestion as pipelined fetch -> normalize -> classify -> merge
+# stages (False: one serial fetch+classify cycle at a time)
+PIPELINED_INGESTION = True
+# Capacity of each queue between pipeline stages (backpressure on fetchers)
+PIPELINE_QUEUE_SIZE = 8
+
+# Per-source circuit breakers: stop polling a source that keeps failing
+CIRCUIT_BREAKER = True
+# Consecutive failed fetches that open a source's circuit
+BREAKER_FAILURE_THRESHOLD = 3
+# Seconds an open circuit waits before a half-open probe (doubles per failed probe)
+BREAKER_COOLDOWN = 60
+# Longest cool-down of an open circuit (seconds)
+BREAKER_MAX_COOLDOWN = 1800
+# Seconds a half-open probe fetch may take before it counts as failed
+BREAKER_PROBE_TIMEOUT = 5
+# Wall-time budget of one fetch cycle across all sources (seconds); fetches
+# still running or queued when it runs out are skipped this cycle
+SOURCE_CYCLE_BUDGET = 2 * SOURCE_FETCH_TIMEOUT
+
+# Seconds a serialized /retrieve snapshot is reused while the feed is
+# unchanged (its final_score values are refreshed afterwards)
+FEED_SNAPSHOT_MAX_AGE = 60
+# Distinct (limit, fields) /retrieve snapshots kept per feed version
+FEED_SNAPSHOT_VARIANTS = 32
+# Feed changes (item added / evicted) kept for /retrieve/changes; older
+# since_version values get a full snapshot
+CHANGE_LOG_SIZE = 1000
+
+# /stream push events buffered per client before the drop policy applies
+STREAM_CLIENT_BUFFER = 256
+# What happens to a client whose buffer is full:
+#   "drop_oldest" - discard its oldest buffered events and send it a "dropped"
+#                   event (catch up with /retrieve/changes?since_version=)
+#   "disconnect"  - close its stream; an EventSource reconnects with
+#                   Last-Event-ID and resumes from the change log
+STREAM_DROP_POLICY = "drop_oldest"
+# Seconds between keep-alive comments on an idle stream
+STREAM_HEARTBEAT = 15
+
 # Persistence time for recency decay, in seconds.
 # For example, 86400 = 1 day.
 PERSISTENCE_TIME = 86400
@@ -25,6 +254,9 @@ ASSESS_CORRECTNESS_WITH_BIGGER_MODEL = False
 ASSESS_EFFICIENCY = True
 
 NEWS_SOURCES = [
+    # Optional "classifier": "<name in CLASSIFIER_BACKENDS>" overrides the default
+    # backend for one source, e.g. a cheap model for high-volume subreddits
+    # (an unknown name stops the app at startup).
     {"type": "reddit", "subreddit": "sysadmin"},
     {"type": "reddit", "subreddit": "outages"},
     {"type": "reddit", "subreddit": "cybersecurity"},
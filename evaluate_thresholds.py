@@ -0,0 +1,171 @@
+"""
+Sweep MIN_SCORE and the relevant label set on stored zero-shot scores, with
+no model calls.
+
+    python -m newsfeed.evaluate_thresholds                       # labelled test set
+    python -m newsfeed.evaluate_thresholds --store cache/score_store.npz
+    python -m newsfeed.evaluate_thresholds --thresholds 0.05:0.5:0.01
+
+With the labelled test set, its items are scored once (served from the
+classification cache on later runs) and kept in a ScoreStore; with --store,
+rows of a saved store that were scored by the chosen backend and have a
+ground-truth label (LLM verdicts attached by show_news.py) are used.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from newsfeed.config import DEFAULT_CLASSIFIER_BACKEND, MIN_SCORE
+from newsfeed.ingestion.filtering import (
+    RELEVANT_LABEL_SUFFIX,
+    RELEVANT_LABELS,
+    ZERO_SHOT_LABELS,
+    build_classifier_text,
+    score_texts,
+)
+from newsfeed.ingestion.score_store import (
+    UNKNOWN,
+    ScoreStore,
+    label_subset_masks,
+    sweep_thresholds,
+)
+from newsfeed.models import NewsItem
+
+DEFAULT_DATASET = os.path.join(
+    os.path.dirname(__file__), "tests", "test_cases_relevant.json"
+)
+
+console = Console()
+
+
+def store_from_dataset(path: str, backend=None) -> ScoreStore:
+    """Score a labelled JSON dataset once and return it as a ScoreStore"""
+    with open(path) as f:
+        cases = json.load(f)
+    items = [NewsItem(**case) for case in cases]
+    texts = [build_classifier_text(item, backend=backend) for item in items]
+    store = ScoreStore(ZERO_SHOT_LABELS)
+    for case, item, scores in zip(cases, items, score_texts(texts, backend=backend)):
+        if scores is not None:
+            store.add(
+                item.id,
+                scores,
+                case["relevant"],
+                backend=backend or DEFAULT_CLASSIFIER_BACKEND,
+            )
+    return store
+
+
+def labelled_rows(store: ScoreStore, backend=None) -> np.ndarray:
+    """Rows scored by `backend` (None = default backend) that have a ground-truth label"""
+    return (store.ground_truth != UNKNOWN) & (
+        store.backends == (backend or DEFAULT_CLASSIFIER_BACKEND)
+    )
+
+
+def parse_thresholds(spec: str) -> np.ndarray:
+    start, stop, step = (float(x) for x in spec.split(":"))
+    return np.round(np.arange(start, stop + step / 2, step), 6)
+
+
+def candidate_subsets():
+    """Current RELEVANT_LABELS plus every leave-one-label-out variant"""
+    full = [label + RELEVANT_LABEL_SUFFIX for label in RELEVANT_LABELS]
+    subsets = [("all relevant labels", full)]
+    for label in RELEVANT_LABELS:
+        subsets.append(
+            (
+                f"without {label}",
+                [x for x in full if x != label + RELEVANT_LABEL_SUFFIX],
+            )
+        )
+    return subsets
+
+
+def missing_labels(store: ScoreStore, subsets) -> list:
+    """Labels the candidate subsets need that the store has no scores for"""
+    needed = dict.fromkeys(label for _, labels in subsets for label in labels)
+    return [label for label in needed if label not in store.labels]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--store", help="Saved ScoreStore (.npz) to evaluate")
+    parser.add_argument("--dataset", default=DEFAULT_DATASET)
+    parser.add_argument("--backend", default=None, help="Classifier backend name")
+    parser.add_argument("--thresholds", default="0.02:0.9:0.02")
+    parser.add_argument("--save", help="Write the dataset scores to this .npz")
+    args = parser.parse_args()
+
+    if args.store:
+        store = ScoreStore.load(args.store)
+        labelled = labelled_rows(store, args.backend)
+    else:
+        store = store_from_dataset(args.dataset, backend=args.backend)
+        if args.save:
+            store.save(args.save)
+        labelled = store.ground_truth != UNKNOWN
+
+    if not labelled.any():
+        console.print(
+            "[yellow]No scored items with a ground-truth label"
+            f" for backend '{args.backend or DEFAULT_CLASSIFIER_BACKEND}'.[/yellow]"
+        )
+        return
+    scores = store.scores[labelled]
+    y_true = store.ground_truth[labelled] == 1
+
+    thresholds = parse_thresholds(args.thresholds)
+    subsets = candidate_subsets()
+    missing = missing_labels(store, subsets)
+    if missing:
+        # e.g. a store saved before ZERO_SHOT_LABELS were edited in config
+        console.print(
+            "[red]The store has no scores for these relevant labels: "
+            f"{', '.join(missing)}. Re-score it with the current labels.[/red]"
+        )
+        sys.exit(1)
+    masks = label_subset_masks(store.labels, [labels for _, labels in subsets])
+    metrics = sweep_thresholds(scores, y_true, masks, thresholds)
+
+    table = Table(
+        title=f"Threshold sweep on {len(y_true)} items ({int(y_true.sum())} relevant)",
+        box=box.SIMPLE_HEAVY,
+    )
+    for column in ("Threshold", "Precision", "Recall", "F1"):
+        table.add_column(column)
+    for t, threshold in enumerate(thresholds):
+        style = "bold green" if np.isclose(threshold, MIN_SCORE) else None
+        table.add_row(
+            f"{threshold:.2f}",
+            f"{metrics['precision'][0, t]:.2f}",
+            f"{metrics['recall'][0, t]:.2f}",
+            f"{metrics['f1'][0, t]:.2f}",
+            style=style,
+        )
+    console.print(table)
+
+    best = Table(title="Best threshold per label set (by F1)", box=box.SIMPLE_HEAVY)
+    for column in ("Label set", "Threshold", "Precision", "Recall", "F1"):
+        best.add_column(column)
+    for s, (name, _) in enumerate(subsets):
+        t = int(np.argmax(metrics["f1"][s]))
+        best.add_row(
+            name,
+            f"{thresholds[t]:.2f}",
+            f"{metrics['precision'][s, t]:.2f}",
+            f"{metrics['recall'][s, t]:.2f}",
+            f"{metrics['f1'][s, t]:.2f}",
+        )
+    console.print(best)
+
+
+if __name__ == "__main__":
+    main()
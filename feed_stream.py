@@ -0,0 +1,249 @@
+import asyncio
+import json
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from newsfeed.config import (
+    STREAM_CLIENT_BUFFER,
+    STREAM_DROP_POLICY,
+    STREAM_HEARTBEAT,
+)
+from newsfeed.log_utils import log_info
+from newsfeed.models import NewsItem
+from newsfeed.ranking import RankingIndex
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+# (version, SSE frame, top_relevant_label, source) of one added item
+StreamEvent = Tuple[int, bytes, Optional[str], str]
+
+
+def sse_frame(event: str, data, event_id: Optional[int] = None) -> bytes:
+    """One Server-Sent Events message; `data` is sent as single-line JSON"""
+    if not isinstance(data, str):
+        data = json.dumps(data, separators=(",", ":"))
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {data}\n\n".encode()
+
+
+def item_frame(item: NewsItem, event_id: Optional[int] = None) -> bytes:
+    return sse_frame("item", item.model_dump_json(), event_id)
+
+
+class StreamClient:
+    """One /stream subscriber: its filters and its bounded event buffer"""
+
+    def __init__(
+        self,
+        labels: Optional[Iterable[str]] = None,
+        sources: Optional[Iterable[str]] = None,
+        buffer_size: int = STREAM_CLIENT_BUFFER,
+    ):
+        self.labels = tuple(label.lower() for label in labels) if labels else None
+        self.sources = tuple(sources) if sources else None
+        self.buffer: Deque[bytes] = deque()
+        self.buffer_size = max(1, buffer_size)
+        # Replayed events, sent before anything in the buffer
+        self.replay: List[bytes] = []
+        # Version the client is up to date with: live events <= after are skipped
+        self.after = 0
+        # Events dropped since the client was last told about it
+        self.dropped = 0
+        self.closed = False
+        self.wakeup = asyncio.Event()
+
+    def matches(self, label: Optional[str], source: str) -> bool:
+        """
+        Labels match by case-insensitive prefix ("outage" matches the zero-shot
+        label "Outage (critical and urgent ...)"); sources match exactly or as
+        a parent ("reddit" matches "reddit/sysadmin").
+        """
+        if self.labels is not None and not (
+            label and label.lower().startswith(self.labels)
+        ):
+            return False
+        if self.sources is not None and not any(
+            source == name or source.startswith(name + "/") for name in self.sources
+        ):
+            return False
+        return True
+
+
+class FeedBroadcaster:
+    """
+    Pushes every item added to a RankingIndex to /stream clients as
+    Server-Sent Events, with the feed version as event id.
+
+    The index listener serializes the item once and schedules a single
+    fan-out callback on the event loop, so accepting an item costs the same
+    however many clients are connected. The fan-out appends the shared frame
+    to the buffer of each client whose filters match. A client whose buffer
+    holds buffer_size events is a slow consumer: its oldest events are dropped
+    (it then gets a "dropped" event) or, with the "disconnect" policy, its
+    stream is closed so it reconnects and resumes from the change log.
+    """
+
+    def __init__(
+        self,
+        index: RankingIndex,
+        buffer_size: int = STREAM_CLIENT_BUFFER,
+        drop_policy: str = STREAM_DROP_POLICY,
+        heartbeat: float = STREAM_HEARTBEAT,
+    ):
+        if drop_policy not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"Unknown stream drop policy: {drop_policy!r}")
+        self.index = index
+        self.buffer_size = buffer_size
+        self.drop_policy = drop_policy
+        self.heartbeat = heartbeat
+        # Only touched on the event loop
+        self._clients: Set[StreamClient] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {
+            "connections": 0,
+            "published": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "disconnected": 0,
+        }
+        index.add_listener(self._publish)
+
+    def _publish(self, version: int, item: NewsItem):
+        """Index listener: runs under the index lock, on any thread"""
+        loop = self._loop
+        if not self._clients or loop is None or loop.is_closed():
+            return
+        event = (
+            version,
+            item_frame(item, version),
+            item.top_relevant_label,
+            item.source,
+        )
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        try:
+            if running is loop:
+                loop.call_soon(self._fan_out, event)
+            else:
+                loop.call_soon_threadsafe(self._fan_out, event)
+        except RuntimeError:
+            # The loop closed in between: nobody is left to push to
+            pass
+
+    def _fan_out(self, event: StreamEvent):
+        version, frame, label, source = event
+        self._stats["published"] += 1
+        for client in self._clients:
+            if client.closed or version <= client.after:
+                continue
+            if client.matches(label, source):
+                self._push(client, frame)
+
+    def _push(self, client: StreamClient, frame: bytes):
+        if len(client.buffer) >= client.buffer_size:
+            if self.drop_policy == DISCONNECT:
+                client.closed = True
+                client.buffer.clear()
+                self._stats["disconnected"] += 1
+                log_info(
+                    f"Closed a slow /stream client ({client.buffer_size} events behind)",
+                    source="STREAM",
+                )
+                client.wakeup.set()
+                return
+            client.buffer.popleft()
+            client.dropped += 1
+            self._stats["dropped"] += 1
+        client.buffer.append(frame)
+        client.wakeup.set()
+
+    def subscribe(
+        self,
+        labels: Optional[Iterable[str]] = None,
+        sources: Optional[Iterable[str]] = None,
+        since_version: Optional[int] = None,
+    ) -> StreamClient:
+        """
+        Register a client (call on the event loop). With since_version, the
+        items added after it that match the filters are replayed first, best
+        first; if the change log no longer reaches back that far, a "reset"
+        event and the whole matching feed are sent instead. A "sync" event
+        with the current version as id ends the replay.
+        """
+        self._loop = asyncio.get_running_loop()
+        client = StreamClient(labels, sources, self.buffer_size)
+        # Registered before the version is read: newer items reach it via _fan_out
+        self._clients.add(client)
+        self._stats["connections"] += 1
+
+        replay: List[NewsItem] = []
+        changes = None
+        if since_version is not None:
+            changes = self.index.changes_since(since_version)
+        if changes is not None:
+            replay, _, client.after = changes
+        elif since_version is not None:
+            replay, client.after = self.index.top_with_version()
+            client.replay.append(sse_frame("reset", {"version": client.after}))
+        else:
+            client.after = self.index.version
+
+        replay = [
+            item
+            for item in replay
+            if client.matches(item.top_relevant_label, item.source)
+        ]
+        client.replay.extend(item_frame(item) for item in replay)
+        client.replay.append(
+            sse_frame(
+                "sync",
+                {"version": client.after, "replayed": len(replay)},
+                event_id=client.after,
+            )
+        )
+        return client
+
+    def unsubscribe(self, client: StreamClient):
+        client.closed = True
+        self._clients.discard(client)
+
+    async def events(self, client: StreamClient) -> AsyncIterator[bytes]:
+        """
+        The SSE byte stream of a subscribed client: everything buffered is
+        sent as one chunk, with a keep-alive comment every `heartbeat` seconds
+        while idle. Unsubscribes the client when the stream ends.
+        """
+        try:
+            if client.replay:
+                frames, client.replay = client.replay, []
+                yield b"".join(frames)
+            while not client.closed:
+                if not client.buffer and not client.dropped:
+                    client.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(client.wakeup.wait(), self.heartbeat)
+                    except asyncio.TimeoutError:
+                        yield b": keep-alive\n\n"
+                    continue
+                frames = []
+                if client.dropped:
+                    frames.append(sse_frame("dropped", {"dropped": client.dropped}))
+                    client.dropped = 0
+                self._stats["delivered"] += len(client.buffer)
+                frames.extend(client.buffer)
+                client.buffer.clear()
+                yield b"".join(frames)
+        finally:
+            self.unsubscribe(client)
+
+    def stats(self) -> Dict:
+        clients = list(self._clients)
+        return {
+            **self._stats,
+            "clients": len(clients),
+            "buffered": sum(len(client.buffer) for client in clients),
+            "drop_policy": self.drop_policy,
+        }
@@ -1,75 +1,134 @@
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+from xml.etree.ElementTree import ParseError
 
 import feedparser
 
+from newsfeed.config import RSS_STREAMING_PARSE
 from newsfeed.models import NewsItem
 
 from .base_source import BaseSource
+from .http_client import get_http_client
+from .rss_stream import iter_rss_entries
 
 logger = logging.getLogger(__name__)
 
 
 class ArsTechnicaSource(BaseSource):
-    def __init__(self, source_name: str = "ars-technica"):
+    def __init__(
+        self, source_name: str = "ars-technica", streaming: bool = RSS_STREAMING_PARSE
+    ):
         self.source_name = source_name
         self.feed_url = "http://feeds.arstechnica.com/arstechnica/index"
+        # Incremental parse with early stop (False: feedparser on the whole feed)
+        self.streaming = streaming
+        self.http = get_http_client()
         logger.info(f"ArsTechnicaSource initialized for feed: {self.feed_url}")
 
+    def _feedparser_entries(
+        self,
+        content: bytes,
+        since_timestamp: Optional[datetime],
+        posts_limit: Optional[int],
+    ) -> Iterator[Dict[str, object]]:
+        feed = feedparser.parse(content)
+
+        if feed.bozo:
+            logger.warning(
+                f"Feedparser encountered errors for {self.source_name}: {feed.bozo_exception}"
+            )
+
+        produced = 0
+        for entry in feed.entries:  # Iterate all entries to find recent ones
+            # Convert time.struct_time to timezone-aware UTC datetime
+            published_time_struct = entry.published_parsed
+            utc_dt = datetime(
+                published_time_struct.tm_year,
+                published_time_struct.tm_mon,
+                published_time_struct.tm_mday,
+                published_time_struct.tm_hour,
+                published_time_struct.tm_min,
+                published_time_struct.tm_sec,
+                tzinfo=timezone.utc,
+            )
+
+            # Apply filtering based on since_timestamp for continuous fetch
+            if since_timestamp and utc_dt <= since_timestamp:
+                continue  # Skip this post if it's not strictly newer
+
+            yield {
+                "id": entry.get("id", entry.get("link")),
+                "title": entry.get("title", ""),
+                "summary": entry.get("summary", ""),
+                "published": utc_dt,
+            }
+            produced += 1
+
+            # Apply posts_limit only for initial fetch (when since_timestamp is None)
+            if posts_limit is not None and produced >= posts_limit:
+                break  # Stop if we've collected enough for initial limit
+
+    def _to_item(self, entry: Dict[str, object]) -> NewsItem:
+        return NewsItem(
+            id=entry["id"],
+            source=self.source_name,
+            title=entry["title"],
+            body=entry["summary"],
+            published_at=entry["published"],
+        )
+
     def fetch_news(
         self,
         posts_limit: Optional[int] = None,
         since_timestamp: Optional[datetime] = None,
     ) -> List[NewsItem]:
         items = []
+        chunks = None
+        # Bytes handed to the streaming parser, kept for a feedparser fallback
+        received: List[bytes] = []
+        # posts_limit only applies to the initial fetch (no since_timestamp)
+        limit = None if since_timestamp else posts_limit
         try:
             logger.info(f"Fetching from Ars Technica: {self.feed_url}")
-            feed = feedparser.parse(self.feed_url)
-
-            if feed.bozo:
-                logger.warning(
-                    f"Feedparser encountered errors for {self.source_name}: {feed.bozo_exception}"
+            response = self.http.get(
+                self.feed_url,
+                source_name=self.source_name,
+                timeout=self.request_timeout,
+                stream=self.streaming,
+            )
+            if response is None:
+                logger.info(f"{self.source_name} unchanged since last fetch (304).")
+                return items
+            if self.streaming:
+                chunks = self.http.iter_content(response, self.source_name)
+                entries = iter_rss_entries(
+                    _recorded(chunks, received), since_timestamp, limit
                 )
-
-            fetched_count = 0
-            for entry in feed.entries:  # Iterate all entries to find recent ones
-                # Convert time.struct_time to timezone-aware UTC datetime
-                published_time_struct = entry.published_parsed
-                utc_dt = datetime(
-                    published_time_struct.tm_year,
-                    published_time_struct.tm_mon,
-                    published_time_struct.tm_mday,
-                    published_time_struct.tm_hour,
-                    published_time_struct.tm_min,
-                    published_time_struct.tm_sec,
-                    tzinfo=timezone.utc,
+            else:
+                entries = self._feedparser_entries(
+                    response.content, since_timestamp, limit
                 )
 
-                # Apply filtering based on since_timestamp for continuous fetch
-                if since_timestamp and utc_dt <= since_timestamp:
-                    continue  # Skip this post if it's not strictly newer
-
-                news_item = NewsItem(
-                    id=entry.get("id", entry.get("link")),
-                    source=self.source_name,
-                    title=entry.get("title", ""),
-                    body=entry.get("summary", ""),
-                    published_at=utc_dt,
+            try:
+                items = [self._to_item(entry) for entry in entries]
+            except ParseError as e:
+                # ElementTree is strict (e.g. HTML entities like &nbsp; are
+                # errors). Returning the entries before the error would move the
+                # cursor past the rest: parse the whole response with
+                # feedparser instead, which tolerates such feeds
+                logger.warning(
+                    f"Streaming parse of {self.source_name} failed ({e}); "
+                    "parsing the whole feed with feedparser"
                 )
-                items.append(news_item)
-                fetched_count += 1
-
-                # Apply posts_limit only for initial fetch (when since_timestamp is None)
-                if (
-                    posts_limit is not None
-                    and len(items) >= posts_limit
-                    and not since_timestamp
-                ):
-                    break  # Stop if we've collected enough for initial limit
+                body = b"".join(received) + b"".join(chunks)
+                items = [
+                    self._to_item(entry)
+                    for entry in self._feedparser_entries(body, since_timestamp, limit)
+                ]
 
             logger.info(
-                f"Successfully processed {fetched_count} items from {self.source_name} ({len(items)} passing filter/limit)."
+                f"Successfully processed {len(items)} new items from {self.source_name}."
             )
             return items
 
@@ -78,4 +137,17 @@ class ArsTechnicaSource(BaseSource):
                 f"Error fetching from Ars Technica source {self.source_name} ({self.feed_url}): {e}",
                 exc_info=True,
             )
+            # The body was not turned into items: download it again next time
+            self.http.forget(self.source_name)
             return []
+        finally:
+            if chunks is not None:
+                # Stops the download if parsing ended early
+                chunks.close()
+
+
+def _recorded(chunks: Iterator[bytes], received: List[bytes]) -> Iterator[bytes]:
+    """Pass chunks through, appending each one to `received`"""
+    for chunk in chunks:
+        received.append(chunk)
+        yield chunk
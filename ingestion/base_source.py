@@ -1,9 +1,19 @@
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, List, Optional
+
+from newsfeed.config import SOURCE_FETCH_TIMEOUT
 
 
 class BaseSource(ABC):
+    # Name of the relevance classifier backend (key of CLASSIFIER_BACKENDS) used
+    # for this source's items; None means DEFAULT_CLASSIFIER_BACKEND.
+    classifier_backend: Optional[str] = None
+    # Seconds a single HTTP request of this source may take
+    request_timeout: float = SOURCE_FETCH_TIMEOUT
+
     @abstractmethod
     def fetch_news(
         self,
@@ -17,3 +27,53 @@ class BaseSource(ABC):
         since_timestamp: If provided, fetch posts published after this timestamp.
         """
         pass
+
+
+class FetchToken:
+    """
+    Token of one fetch run by the IngestionManager. The manager cancels it when
+    it abandons the fetch (timeout or cycle budget): the thread keeps running,
+    but its items are dropped, so it must no longer advance source state.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cancelled = False
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+
+    def commit(self, apply: Callable[[], None]) -> bool:
+        """Run apply() unless the fetch was abandoned; True if it ran"""
+        with self._lock:
+            if self.cancelled:
+                return False
+            apply()
+            return True
+
+
+_fetch_context = threading.local()
+
+
+@contextmanager
+def running_fetch(token: FetchToken):
+    """Make `token` the token of the fetch running in this thread"""
+    _fetch_context.token = token
+    try:
+        yield token
+    finally:
+        _fetch_context.token = None
+
+
+def commit_fetch(apply: Callable[[], None]) -> bool:
+    """
+    Apply a fetch's state change (cursors, HTTP validators) unless the fetch
+    running in this thread was abandoned by the manager; True if applied.
+    Outside a managed fetch the change is always applied.
+    """
+    token = getattr(_fetch_context, "token", None)
+    if token is None:
+        apply()
+        return True
+    return token.commit(apply)
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from collections import Counter, deque
+from typing import Optional
+
+from newsfeed.config import (
+    CLASSIFIER_BATCH_SIZE,
+    MICRO_BATCH_MAX_WAIT_MS,
+    MIN_SCORE,
+)
+from newsfeed.ingestion.filtering import zero_shot_it_relevance_filter_batch
+from newsfeed.log_utils import log_error
+from newsfeed.models import NewsItem
+
+# Number of recent per-request wait times kept for the wait statistics
+WAIT_SAMPLE_SIZE = 1024
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class MicroBatchClassifier:
+    """
+    Asyncio-facing relevance classification with dynamic micro-batching.
+    Callers `await classify(item)`; pending requests are grouped and sent to
+    the relevance filter as one batch as soon as either `max_batch_size`
+    requests are waiting or the oldest one has waited `max_wait_ms`.
+    Inference runs in the default executor so the event loop stays free.
+
+    classify() returns the same (binary_label, max_score, top_label, log)
+    tuple as zero_shot_it_relevance_filter_batch does for one item.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = CLASSIFIER_BATCH_SIZE,
+        max_wait_ms: float = MICRO_BATCH_MAX_WAIT_MS,
+        min_score: float = MIN_SCORE,
+        backend: Optional[str] = None,
+    ):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.min_score = min_score
+        self.backend = backend
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop = None
+        self.requests = 0
+        self.batches = 0
+        self.batch_size_histogram: Counter = Counter()
+        self._wait_ms = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        # (Re)start on first use and whenever we are called from a new event loop
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def classify(self, item: NewsItem):
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self.requests += 1
+        await self._queue.put((item, future, time.perf_counter()))
+        return await future
+
+    async def stop(self):
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+        self._worker = None
+
+    async def _next_batch(self):
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            dispatched_at = time.perf_counter()
+            for _, _, enqueued_at in batch:
+                self._wait_ms.append((dispatched_at - enqueued_at) * 1000)
+            self.batches += 1
+            self.batch_size_histogram[len(batch)] += 1
+
+            items = [item for item, _, _ in batch]
+            try:
+                decisions = await self._loop.run_in_executor(
+                    None,
+                    lambda: zero_shot_it_relevance_filter_batch(
+                        items,
+                        min_score=self.min_score,
+                        batch_size=len(items),
+                        backend=self.backend,
+                    ),
+                )
+            except Exception as e:
+                log_error(
+                    f"Micro-batch of {len(items)} items failed: {e}",
+                    source="MicroBatchClassifier",
+                    exc_info=True,
+                )
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future, _), decision in zip(batch, decisions):
+                if not future.done():
+                    future.set_result(decision)
+
+    def stats(self) -> dict:
+        waits = sorted(self._wait_ms)
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": (
+                self.requests_batched / self.batches if self.batches else 0.0
+            ),
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "wait_ms": {
+                "mean": sum(waits) / len(waits) if waits else 0.0,
+                "p50": _percentile(waits, 0.5),
+                "p95": _percentile(waits, 0.95),
+                "max": waits[-1] if waits else 0.0,
+            },
+        }
+
+    @property
+    def requests_batched(self) -> int:
+        return sum(size * count for size, count in self.batch_size_histogram.items())
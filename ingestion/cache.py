@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from newsfeed.log_utils import log_error, log_info
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize and collapse whitespace so trivial variants share a key"""
+    text = unicodedata.normalize("NFKC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def content_hash(*parts: str) -> str:
+    """Stable sha256 over the given parts (order matters)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")  # unit separator, so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class ContentHashCache:
+    """
+    Two-tier cache keyed by content hash: a bounded in-memory LRU in front of a
+    persistent SQLite table that survives restarts.
+
+    Disk writes are buffered and committed commit_every puts at a time (or on
+    flush()); each commit then drops the namespace's oldest rows beyond
+    disk_capacity (None = unbounded).
+
+    Every cache lives in a `namespace` and carries a `fingerprint` describing
+    whatever produced the values (model, labels, prompt, ...). Rows of the same
+    namespace written under a different fingerprint are purged on open, so
+    changing e.g. the label set invalidates the cache automatically.
+    Values must be JSON-serialisable.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        fingerprint: str,
+        capacity: int = 4096,
+        path: Optional[str] = None,
+        disk_capacity: Optional[int] = None,
+        commit_every: int = 64,
+    ):
+        self.namespace = namespace
+        self.fingerprint = fingerprint
+        self.capacity = max(0, capacity)
+        self.path = path
+        self.disk_capacity = disk_capacity
+        self.commit_every = max(1, commit_every)
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        # key -> JSON value written to the disk tier on the next commit
+        self._pending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if path:
+            self._open_disk_tier(path)
+
+    def _open_disk_tier(self, path: str):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " fingerprint TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            purged = self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND fingerprint != ?",
+                (self.namespace, self.fingerprint),
+            ).rowcount
+            self._conn.commit()
+            if purged:
+                log_info(
+                    f"Invalidated {purged} stale '{self.namespace}' cache entries (fingerprint changed).",
+                    source="Cache",
+                )
+        except sqlite3.Error as e:
+            log_error(
+                f"Could not open cache store at {path}, using memory only: {e}",
+                source="Cache",
+            )
+            self._conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+            if key in self._pending:
+                self.disk_hits += 1
+                return json.loads(self._pending[key])
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value FROM cache WHERE namespace = ? AND key = ? AND fingerprint = ?",
+                    (self.namespace, key, self.fingerprint),
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._remember(key, value)
+            if self._conn is not None:
+                self._pending[key] = json.dumps(value)
+                if len(self._pending) >= self.commit_every:
+                    self._commit()
+
+    def flush(self):
+        """Commit the buffered disk writes"""
+        with self._lock:
+            self._commit()
+
+    def _commit(self):
+        if self._conn is None or not self._pending:
+            return
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (namespace, key, fingerprint, value)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    (self.namespace, key, self.fingerprint, value)
+                    for key, value in self._pending.items()
+                ],
+            )
+            if self.disk_capacity is not None:
+                # Rows are re-inserted on replace, so the lowest rowids are the oldest
+                self.disk_evictions += self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND rowid IN ("
+                    " SELECT rowid FROM cache WHERE namespace = ?"
+                    " ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (self.namespace, self.namespace, max(0, self.disk_capacity)),
+                ).rowcount
+            self._conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Cache write failed: {e}", source="Cache")
+        self._pending.clear()
+
+    def _remember(self, key: str, value: Any):
+        if self.capacity == 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry of this namespace from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ?", (self.namespace,)
+                )
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "memory_size": len(self._memory),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._memory)
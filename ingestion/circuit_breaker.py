@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from newsfeed.config import (
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_COOLDOWN,
+)
+from newsfeed.log_utils import log_info
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker of one source.
+
+    - closed: every fetch is allowed; failure_threshold consecutive failures
+      (errors, timeouts, HTTP errors or no response) open the circuit.
+    - open: fetches are refused until the cool-down has elapsed.
+    - half-open: a single probe fetch is allowed. Success closes the circuit
+      and resets the cool-down; failure opens it again with the cool-down
+      doubled (capped at max_cooldown).
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        max_cooldown: float = BREAKER_MAX_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.source_name = source_name
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0  # consecutive
+        self.trips = 0
+        self.cooldown = cooldown
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _cooled_down(self, now: float) -> bool:
+        return now - self.opened_at >= self.cooldown
+
+    def ready(self) -> bool:
+        """Would allow() let a fetch through now? (does not change the state)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN:
+                return not self._probing
+            return self._cooled_down(self.clock())
+
+    def allow(self) -> bool:
+        """Admit a fetch (moving an open circuit whose cool-down ended to half-open)"""
+        with self._lock:
+            if self.state == OPEN and self._cooled_down(self.clock()):
+                self.state = HALF_OPEN
+                self._probing = False
+                log_info(
+                    f"Circuit half-open for {self.source_name}: probing",
+                    source="CircuitBreaker",
+                )
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def release(self):
+        """An admitted fetch did not run: free the half-open probe slot"""
+        with self._lock:
+            self._probing = False
+
+    @property
+    def probing(self) -> bool:
+        return self.state == HALF_OPEN
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                log_info(
+                    f"Circuit closed for {self.source_name}", source="CircuitBreaker"
+                )
+            self.state = CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                # The probe failed: wait twice as long before the next one
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.state == OPEN or self.failures < self.failure_threshold:
+                return
+            self.state = OPEN
+            self.trips += 1
+            self.opened_at = self.clock()
+            self._probing = False
+            log_info(
+                f"Circuit opened for {self.source_name} after {self.failures} "
+                f"consecutive failures, retrying in {self.cooldown:.0f}s",
+                source="CircuitBreaker",
+            )
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            reopens_in = (
+                max(0.0, self.opened_at + self.cooldown - self.clock())
+                if self.state == OPEN
+                else 0.0
+            )
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "trips": self.trips,
+                "cooldown": self.cooldown,
+                "reopens_in": reopens_in,
+            }
@@ -0,0 +1,258 @@
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from transformers import AutoTokenizer
+
+from newsfeed.config import CLASSIFIER_BACKENDS, DEFAULT_CLASSIFIER_BACKEND
+from newsfeed.ingestion.cache import content_hash
+from newsfeed.ingestion.quantization import (
+    available_runtime,
+    load_zero_shot_pipeline,
+)
+from newsfeed.log_utils import log_error, log_info
+
+DEFAULT_HYPOTHESIS_TEMPLATE = "This news is about {}."
+# Seconds to wait before retrying a model load that failed
+LOAD_RETRY_SECONDS = 60
+# Dummy input of the warm-up inference
+WARMUP_TEXT = "Warm-up: service status update."
+
+
+class ClassifierBackend(ABC):
+    """
+    Common interface of every relevance classifier: score a batch of texts
+    against a list of labels and return a score matrix with one row per text
+    and one column per label (in the order given).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        # Set once the backend is loaded and has run its warm-up inference
+        self.ready = threading.Event()
+
+    @property
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """Identifies what produces the scores (used to key/invalidate caches)"""
+
+    @abstractmethod
+    def load(self) -> bool:
+        """Make the backend ready for inference. Returns False if it cannot be used."""
+
+    @abstractmethod
+    def score(self, texts: List[str], labels: List[str]) -> List[List[float]]:
+        pass
+
+    @property
+    def tokenizer(self):
+        """Tokenizer of the underlying model (None = no model tokenizer)"""
+        return None
+
+    def load_tokenizer(self) -> bool:
+        """Load the tokenizer without the model (False if there is none)"""
+        return False
+
+    def warm_up(self, labels: List[str]) -> bool:
+        """
+        Load the backend and run one inference on dummy input, so the first real
+        batch does not pay for lazy initialisation. Sets `ready` on success.
+        """
+        if not self.load():
+            return False
+        start_time = time.time()
+        self.score([WARMUP_TEXT], labels)
+        self.ready.set()
+        log_info(
+            f"Classifier backend '{self.name}' warmed up in {time.time() - start_time:.1f} seconds",
+            source="Filtering",
+        )
+        return True
+
+
+class ZeroShotPipelineBackend(ClassifierBackend):
+    """
+    Any NLI checkpoint run through the transformers zero-shot pipeline
+    (BART-large-MNLI, DistilBART-MNLI, MiniLM-MNLI, ...), on one of the
+    runtimes of newsfeed.ingestion.quantization (torch, torch_int8, onnx_int8).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        runtime: str = "torch",
+        hypothesis_template: str = DEFAULT_HYPOTHESIS_TEMPLATE,
+    ):
+        super().__init__(name)
+        self.model = model
+        self.runtime = runtime
+        # Runtime the pipeline was actually loaded on (None until loaded)
+        self.loaded_runtime: Optional[str] = None
+        self.hypothesis_template = hypothesis_template
+        self._pipeline = None
+        self._tokenizer = None
+        self._tokenizer_failed = False
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def fingerprint(self) -> str:
+        runtime = self.loaded_runtime or available_runtime(self.runtime)
+        return content_hash(self.model, runtime, self.hypothesis_template)
+
+    def load(self) -> bool:
+        if self._pipeline is not None:
+            return True
+        with self._lock:
+            if self._pipeline is None and time.time() >= self._retry_at:
+                log_info(
+                    f"Initializing classifier backend '{self.name}' ({self.model}, {self.runtime}); "
+                    "first-time load may take 10-30 seconds...",
+                    source="Filtering",
+                )
+                try:
+                    start_time = time.time()
+                    pipeline, runtime = load_zero_shot_pipeline(
+                        self.model, self.hypothesis_template, backend=self.runtime
+                    )
+                    if runtime != self.runtime:
+                        log_error(
+                            f"Classifier backend '{self.name}' runs on {runtime} instead of {self.runtime}.",
+                            source="Filtering",
+                        )
+                    self.loaded_runtime = runtime
+                    self._pipeline = pipeline
+                    log_info(
+                        f"Classifier backend '{self.name}' loaded successfully in {time.time() - start_time:.1f} seconds",
+                        source="Filtering",
+                    )
+                except Exception as e:
+                    log_error(
+                        f"Failed to load classifier backend '{self.name}': {e}",
+                        source="Filtering",
+                    )
+                    self._retry_at = time.time() + LOAD_RETRY_SECONDS
+        return self._pipeline is not None
+
+    @property
+    def tokenizer(self):
+        """
+        Never downloads anything: None (callers count words) until the
+        pipeline or load_tokenizer() has provided the model's tokenizer.
+        """
+        if self._pipeline is not None:
+            return self._pipeline.tokenizer
+        return self._tokenizer
+
+    def load_tokenizer(self) -> bool:
+        """
+        Load the tokenizer alone (e.g. in the parent of the inference worker
+        pool, which never loads the model). Call it from startup or warm-up
+        code, not from the ingestion path: it may fetch files from the Hub.
+        """
+        if self._pipeline is not None or self._tokenizer is not None:
+            return True
+        if self._tokenizer_failed:
+            return False
+        try:
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model)
+        except Exception as e:
+            log_error(
+                f"Could not load tokenizer of '{self.name}' ({e}); counting words instead.",
+                source="Filtering",
+            )
+            self._tokenizer_failed = True
+        return self._tokenizer is not None
+
+    def score(self, texts: List[str], labels: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        outputs = self._pipeline(
+            list(texts),
+            candidate_labels=labels,
+            multi_label=True,
+            # each text expands to one NLI pair per label
+            batch_size=len(texts) * len(labels),
+        )
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        matrix = []
+        for output in outputs:
+            by_label = dict(zip(output["labels"], output["scores"]))
+            matrix.append([float(by_label[label]) for label in labels])
+        return matrix
+
+
+class StubBackend(ClassifierBackend):
+    """
+    Model-free backend for tests and dry runs: a label scores `match_score`
+    when its name (text before any parenthesised suffix, split on "/") appears
+    in the text, `default_score` otherwise.
+    """
+
+    def __init__(
+        self, name: str, match_score: float = 0.9, default_score: float = 0.01
+    ):
+        super().__init__(name)
+        self.match_score = match_score
+        self.default_score = default_score
+
+    @property
+    def fingerprint(self) -> str:
+        return content_hash("stub", str(self.match_score), str(self.default_score))
+
+    def load(self) -> bool:
+        return True
+
+    def _label_pattern(self, label: str):
+        name = label.split(" (", 1)[0]
+        parts = [re.escape(part.strip()) for part in name.split("/") if part.strip()]
+        return re.compile(r"\b(?:" + "|".join(parts) + r")", re.IGNORECASE)
+
+    def score(self, texts: List[str], labels: List[str]) -> List[List[float]]:
+        patterns = [self._label_pattern(label) for label in labels]
+        return [
+            [
+                self.match_score if pattern.search(text or "") else self.default_score
+                for pattern in patterns
+            ]
+            for text in texts
+        ]
+
+
+BACKEND_TYPES = {
+    "zero_shot": ZeroShotPipelineBackend,
+    "stub": StubBackend,
+}
+
+_backends: Dict[str, ClassifierBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def create_classifier_backend(name: str, cfg: dict) -> ClassifierBackend:
+    cfg = dict(cfg)
+    backend_type = cfg.pop("type", "zero_shot")
+    if backend_type not in BACKEND_TYPES:
+        raise ValueError(f"Unknown classifier backend type: {backend_type}")
+    return BACKEND_TYPES[backend_type](name=name, **cfg)
+
+
+def get_classifier_backend(name: Optional[str] = None) -> ClassifierBackend:
+    """
+    Return the (process-wide, lazily created) backend registered under `name`
+    in CLASSIFIER_BACKENDS, or the DEFAULT_CLASSIFIER_BACKEND when name is None.
+    """
+    name = name or DEFAULT_CLASSIFIER_BACKEND
+    backend = _backends.get(name)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(name)
+            if backend is None:
+                if name not in CLASSIFIER_BACKENDS:
+                    raise ValueError(f"Unknown classifier backend: {name}")
+                backend = create_classifier_backend(name, CLASSIFIER_BACKENDS[name])
+                _backends[name] = backend
+    return backend
@@ -0,0 +1,189 @@
+import json
+import logging
+import math
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+DECISIONS = ("pass", "filtered")
+# Entry keys stored in dedicated columns; "log" is only kept in the spill file
+_COLUMN_KEYS = (
+    "filter",
+    "id",
+    "stage",
+    "decision",
+    "log",
+    "top_relevant_label",
+    "top_relevant_score",
+    "all_scores",
+)
+
+
+class FilterLog:
+    """
+    Fixed-capacity ring buffer of filter decisions (replaces the unbounded
+    FILTER_LOGS list). Records are stored column-wise in preallocated arrays:
+    the top label is an index into `labels` and the per-label scores are one
+    float32 row, instead of a list of (label string, score) tuples per item.
+    Once full, the oldest record is overwritten.
+
+    Every record gets a monotonically increasing sequence number, so readers
+    can poll `query(since=next_since)` and only touch the new slots. With
+    `spill_path` set, every record is also written as a JSON line to a
+    rotating file, which keeps the full history (including log messages)
+    outside the process.
+
+    `append(dict)` and iteration keep the interface of the old list.
+    """
+
+    def __init__(
+        self,
+        labels: List[str],
+        capacity: int,
+        spill_path: Optional[str] = None,
+        spill_max_bytes: int = 10 * 1024 * 1024,
+        spill_backups: int = 3,
+    ):
+        self.labels = list(labels)
+        self.capacity = max(1, capacity)
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+        # Interned stage/filter names
+        self._names: List[str] = []
+        self._name_codes: Dict[str, int] = {}
+
+        self._seq = np.zeros(self.capacity, dtype=np.int64)
+        self._time = np.zeros(self.capacity, dtype=np.float64)
+        self._filter = np.full(self.capacity, -1, dtype=np.int16)
+        self._stage = np.full(self.capacity, -1, dtype=np.int16)
+        self._decision = np.full(self.capacity, -1, dtype=np.int8)
+        self._top_label = np.full(self.capacity, -1, dtype=np.int16)
+        self._top_score = np.full(self.capacity, np.nan, dtype=np.float32)
+        self._scores = np.full((self.capacity, len(self.labels)), np.nan, np.float32)
+        self._ids: List[Optional[str]] = [None] * self.capacity
+        # Rarely used fields (matched terms, summary counts)
+        self._extra: List[Optional[dict]] = [None] * self.capacity
+
+        self._next_seq = 1
+        self._first_seq = 1
+        self._lock = threading.Lock()
+
+        self._spill = None
+        if spill_path:
+            self._spill = logging.getLogger(f"filter_log_spill.{id(self)}")
+            self._spill.setLevel(logging.INFO)
+            self._spill.propagate = False
+            self._spill.addHandler(
+                RotatingFileHandler(
+                    spill_path, maxBytes=spill_max_bytes, backupCount=spill_backups
+                )
+            )
+
+    def _code(self, name: Optional[str]) -> int:
+        if name is None:
+            return -1
+        code = self._name_codes.get(name)
+        if code is None:
+            code = self._name_codes[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def append(self, entry: dict):
+        """Store one decision given as a dict (the old FILTER_LOGS entry format)"""
+        extra = {k: v for k, v in entry.items() if k not in _COLUMN_KEYS}
+        top_label = entry.get("top_relevant_label")
+        label_code = self._label_index.get(top_label, -1)
+        if top_label is not None and label_code < 0:
+            extra["top_relevant_label"] = top_label
+
+        now = time.time()
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            slot = seq % self.capacity
+            self._seq[slot] = seq
+            self._time[slot] = now
+            self._filter[slot] = self._code(entry.get("filter"))
+            self._stage[slot] = self._code(entry.get("stage"))
+            decision = entry.get("decision")
+            self._decision[slot] = DECISIONS.index(decision) if decision else -1
+            self._top_label[slot] = label_code
+            score = entry.get("top_relevant_score")
+            self._top_score[slot] = np.nan if score is None else score
+            row = self._scores[slot]
+            row.fill(np.nan)
+            for label, value in entry.get("all_scores") or ():
+                index = self._label_index.get(label)
+                if index is not None:
+                    row[index] = value
+            self._ids[slot] = entry.get("id")
+            self._extra[slot] = extra or None
+
+        if self._spill is not None:
+            self._spill.info(
+                json.dumps({"seq": seq, "time": now, **entry}, default=str)
+            )
+
+    def _record(self, slot: int) -> dict:
+        record = {"seq": int(self._seq[slot]), "time": float(self._time[slot])}
+        for key, codes in (("filter", self._filter), ("stage", self._stage)):
+            if codes[slot] >= 0:
+                record[key] = self._names[codes[slot]]
+        if self._ids[slot] is not None:
+            record["id"] = self._ids[slot]
+        if self._decision[slot] >= 0:
+            record["decision"] = DECISIONS[self._decision[slot]]
+        if self._top_label[slot] >= 0:
+            record["top_relevant_label"] = self.labels[self._top_label[slot]]
+        if not math.isnan(self._top_score[slot]):
+            record["top_relevant_score"] = float(self._top_score[slot])
+        row = self._scores[slot]
+        if not np.isnan(row).all():
+            record["all_scores"] = {
+                self.labels[i]: float(row[i]) for i in np.flatnonzero(~np.isnan(row))
+            }
+        if self._extra[slot]:
+            record.update(self._extra[slot])
+        return record
+
+    def query(
+        self,
+        since: int = 0,
+        decision: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], int]:
+        """
+        Records with sequence number > since (oldest first), optionally only
+        those with the given decision; only the slots newer than `since` are
+        read. Returns (records, next_since): the sequence number to pass as
+        `since` on the next poll.
+        """
+        decision_code = DECISIONS.index(decision) if decision else None
+        records = []
+        with self._lock:
+            next_since = self._next_seq - 1
+            for seq in range(max(since + 1, self._oldest_seq()), self._next_seq):
+                slot = seq % self.capacity
+                if decision_code is not None and self._decision[slot] != decision_code:
+                    continue
+                records.append(self._record(slot))
+                if limit is not None and len(records) >= limit:
+                    next_since = seq
+                    break
+        return records, next_since
+
+    def _oldest_seq(self) -> int:
+        return max(self._next_seq - self.capacity, self._first_seq)
+
+    def clear(self):
+        with self._lock:
+            # Sequence numbers keep increasing so polling cursors stay valid
+            self._first_seq = self._next_seq
+
+    def __len__(self) -> int:
+        return self._next_seq - self._oldest_seq()
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.query()[0])
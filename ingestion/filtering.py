@@ -1,68 +1,73 @@
 import logging
-import re
+import os
+import threading
 import time
 import warnings
+from itertools import islice
 
-import torch
 from sklearn.metrics import confusion_matrix, precision_score, recall_score
-from transformers import (
-    AutoModelForCausalLM,
-    AutoTokenizer,
-    BitsAndBytesConfig,
-    pipeline,
-)
 from transformers.utils import logging as hf_logging
 
-from newsfeed.config import MIN_SCORE
-from newsfeed.log_utils import log_accepted, log_info, log_refused
+from newsfeed.config import (
+    CACHE_COMMIT_EVERY,
+    CLASSIFICATION_CACHE_DISK_SIZE,
+    CLASSIFICATION_CACHE_PATH,
+    CLASSIFICATION_CACHE_SIZE,
+    CLASSIFIER_BATCH_SIZE,
+    CLASSIFIER_SNIPPET_MAX_TOKENS,
+    CLASSIFIER_SNIPPET_SENTENCES,
+    FILTER_LOG_CAPACITY,
+    FILTER_LOG_SPILL_BACKUPS,
+    FILTER_LOG_SPILL_MAX_BYTES,
+    FILTER_LOG_SPILL_PATH,
+    MIN_SCORE,
+    PREFILTER_MODE,
+    PREFILTER_NEGATIVE_TERMS,
+    SCORE_STORE_MAX_ITEMS,
+    SCORE_STORE_PATH,
+    SCORE_STORE_SAVE_INTERVAL,
+)
+from newsfeed.ingestion.cache import ContentHashCache, content_hash, normalize_text
+from newsfeed.ingestion.classifier_backends import (
+    LOAD_RETRY_SECONDS,
+    WARMUP_TEXT,
+    get_classifier_backend,
+)
+from newsfeed.ingestion.filter_log import FilterLog
+from newsfeed.ingestion.inference_pool import get_inference_pool
+from newsfeed.ingestion.llm_assessor import get_llm_assessor
+from newsfeed.ingestion.prefilter import (
+    FAST_TRACK,
+    PREFILTER_ENFORCE,
+    PREFILTER_OFF,
+    PREFILTER_STATS,
+    REJECT,
+    RulePrefilter,
+    build_positive_terms,
+)
+from newsfeed.ingestion.score_store import ScoreStore
+from newsfeed.ingestion.snippets import (
+    TokenCounter,
+    build_snippet,
+    iter_sentences,
+    record_batch_tokens,
+)
+from newsfeed.log_utils import log_accepted, log_refused
 
 warnings.filterwarnings("ignore", category=UserWarning)
 hf_logging.set_verbosity_error()
 
 logger = logging.getLogger(__name__)
 
-# Structured log storage for filter decisions and metrics
-FILTER_LOGS = []
-
-# Robust lazy loading for zero-shot classifier with thread safety and logging
-_zero_shot_classifier = None
-_classifier_loading = False
-
 
-def get_zero_shot_classifier():
-    global _zero_shot_classifier, _classifier_loading
-
-    if _classifier_loading:
-        while _classifier_loading:
-            time.sleep(0.1)
-        return _zero_shot_classifier
-
-    if _zero_shot_classifier is None:
-        _classifier_loading = True
-        log_info(
-            "Initializing zero-shot classifier (first-time load, this may take 10-30 seconds)...",
-            source="Filtering",
-        )
-        try:
-            start_time = time.time()
-            zero_shot_device = 0 if torch.cuda.is_available() else -1
-            _zero_shot_classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                hypothesis_template="This news is about {}.",
-                device=zero_shot_device,
-            )
-            log_info(
-                f"Zero-shot classifier loaded successfully in {time.time() - start_time:.1f} seconds",
-                source="Filtering",
-            )
-        except Exception as e:
-            logger.error(f"Failed to load zero-shot classifier: {e}")
-            _zero_shot_classifier = None
-        finally:
-            _classifier_loading = False
-
-    return _zero_shot_classifier
+def get_zero_shot_classifier(backend=None):
+    """
+    Return the classifier backend `backend` (a name in CLASSIFIER_BACKENDS,
+    default DEFAULT_CLASSIFIER_BACKEND) once it is loaded, or None if it
+    could not be loaded.
+    """
+    classifier = get_classifier_backend(backend)
+    return classifier if classifier.load() else None
 
 
 # Helper to append suffix to relevant labels
@@ -93,6 +98,173 @@ ZERO_SHOT_LABELS = [label + RELEVANT_LABEL_SUFFIX for label in RELEVANT_LABELS]
     NOT_RELEVANT_LABELS
 )
 
+# Bounded, queryable store of filter decisions and metrics
+FILTER_LOGS = FilterLog(
+    labels=ZERO_SHOT_LABELS,
+    capacity=FILTER_LOG_CAPACITY,
+    spill_path=FILTER_LOG_SPILL_PATH,
+    spill_max_bytes=FILTER_LOG_SPILL_MAX_BYTES,
+    spill_backups=FILTER_LOG_SPILL_BACKUPS,
+)
+
+
+def _warm_up_backend(name, stop_event):
+    classifier = get_classifier_backend(name)
+    while not stop_event.is_set():
+        pool = get_inference_pool(classifier.name)
+        if pool is not None:
+            # Snippets are cut with the model's tokenizer once it is here
+            classifier.load_tokenizer()
+            # One dummy batch per worker process; the model is never loaded here
+            if pool.score([WARMUP_TEXT] * pool.num_workers, ZERO_SHOT_LABELS, 1):
+                classifier.ready.set()
+                return
+        elif classifier.warm_up(ZERO_SHOT_LABELS):
+            return
+        stop_event.wait(LOAD_RETRY_SECONDS)
+
+
+_warmup_stop = threading.Event()
+
+
+def start_classifier_warmup(backends=(None,)):
+    """
+    Load and warm up the given classifier backends (names in CLASSIFIER_BACKENDS,
+    None = default) in a daemon thread, retrying failed loads, so startup never
+    blocks on the model. Progress is visible through get_classifier_readiness.
+    """
+    _warmup_stop.clear()
+
+    def run():
+        for name in dict.fromkeys(backends):
+            _warm_up_backend(name, _warmup_stop)
+
+    thread = threading.Thread(target=run, name="classifier-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def stop_classifier_warmup():
+    _warmup_stop.set()
+
+
+def get_classifier_readiness(backends=(None,)):
+    """Map backend name -> True once it is loaded and warmed up"""
+    readiness = {}
+    for name in backends:
+        classifier = get_classifier_backend(name)
+        readiness[classifier.name] = classifier.ready.is_set()
+    return readiness
+
+
+# Full score vector of every item classified by the model (threshold sweeps)
+_score_store = None
+_score_store_lock = threading.Lock()
+_score_store_saved_at = time.monotonic()
+
+
+def get_score_store():
+    """Process-wide ScoreStore, resumed from SCORE_STORE_PATH when it exists"""
+    global _score_store
+    with _score_store_lock:
+        if _score_store is None:
+            if SCORE_STORE_PATH and os.path.exists(SCORE_STORE_PATH):
+                try:
+                    store = ScoreStore.load(SCORE_STORE_PATH, SCORE_STORE_MAX_ITEMS)
+                    if store.labels == ZERO_SHOT_LABELS:
+                        _score_store = store
+                except Exception as e:
+                    logger.warning(f"Could not load score store: {e}")
+            if _score_store is None:
+                _score_store = ScoreStore(ZERO_SHOT_LABELS, SCORE_STORE_MAX_ITEMS)
+        return _score_store
+
+
+def save_score_store():
+    global _score_store_saved_at
+    _score_store_saved_at = time.monotonic()
+    if SCORE_STORE_PATH and _score_store is not None:
+        _score_store.save(SCORE_STORE_PATH)
+
+
+def save_score_store_if_due():
+    """Save the score store once SCORE_STORE_SAVE_INTERVAL seconds have passed"""
+    if time.monotonic() - _score_store_saved_at >= SCORE_STORE_SAVE_INTERVAL:
+        save_score_store()
+
+
+# Caches of zero-shot score vectors (one per backend) keyed by a hash of the
+# normalized classifier text. The fingerprint covers everything that changes
+# the scores, so editing the label set, the hypothesis template, the model or
+# its runtime invalidates old entries.
+_classification_caches = {}
+
+
+def get_classification_cache(backend=None):
+    classifier = get_classifier_backend(backend)
+    fingerprint = content_hash(classifier.fingerprint, *ZERO_SHOT_LABELS)
+    cache = _classification_caches.get(classifier.name)
+    # The fingerprint can change once the backend is loaded (runtime fallback)
+    if cache is None or cache.fingerprint != fingerprint:
+        if cache is not None:
+            cache.flush()
+        cache = ContentHashCache(
+            namespace=f"zero_shot:{classifier.name}",
+            fingerprint=fingerprint,
+            capacity=CLASSIFICATION_CACHE_SIZE,
+            path=CLASSIFICATION_CACHE_PATH,
+            disk_capacity=CLASSIFICATION_CACHE_DISK_SIZE,
+            commit_every=CACHE_COMMIT_EVERY,
+        )
+        _classification_caches[classifier.name] = cache
+    return cache
+
+
+def flush_classification_caches():
+    """Commit the buffered disk writes of every classification cache"""
+    for cache in list(_classification_caches.values()):
+        cache.flush()
+
+
+def get_classification_cache_stats():
+    """Hit/miss/eviction counters of the zero-shot classification caches (all backends)"""
+    totals = {
+        "memory_hits": 0,
+        "disk_hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "memory_size": 0,
+    }
+    for cache in list(_classification_caches.values()):
+        for key, value in cache.stats().items():
+            if key in totals:
+                totals[key] += value
+    lookups = totals["memory_hits"] + totals["disk_hits"] + totals["misses"]
+    hits = totals["memory_hits"] + totals["disk_hits"]
+    totals["hit_rate"] = hits / lookups if lookups else 0.0
+    return totals
+
+
+# Lexical prefilter cascade in front of the zero-shot classifier
+RULE_PREFILTER = RulePrefilter(
+    build_positive_terms(RELEVANT_LABELS), PREFILTER_NEGATIVE_TERMS
+)
+
+
+def get_prefilter_stats():
+    """
+    How many items the prefilter fast-tracked, rejected or deferred, how many
+    of those lexicon decisions the model contradicted, and the share of
+    scanned items that actually skipped the model (enforced rejects only, so
+    0 unless PREFILTER_MODE is "enforce")
+    """
+    stats = dict(PREFILTER_STATS)
+    total = stats[FAST_TRACK] + stats[REJECT] + stats["deferred"]
+    enforced = PREFILTER_MODE == PREFILTER_ENFORCE
+    stats["skip_rate"] = stats["skipped"] / total if total and enforced else 0.0
+    stats["mode"] = PREFILTER_MODE
+    return stats
+
 
 # Helper to check if a label is relevant (has the suffix and is not in NOT_RELEVANT_LABELS)
 def is_relevant_label(label):
@@ -102,38 +274,183 @@ def is_relevant_label(label):
 def get_first_n_sentences(text, n=2):
     if not text:
         return ""
-    # Simple sentence splitter: split on period, exclamation, or question mark followed by space or end of string
-    sentences = re.split(r"(?<=[.!?]) +", text)
-    return " ".join(sentences[:n])
+    # Sentences are split lazily, so only the start of a long body is scanned
+    return " ".join(islice(iter_sentences(text), n))
 
 
-def zero_shot_it_relevance_filter(
-    news_item, min_score=MIN_SCORE, fallback_to_body=True
-):
-    zero_shot_classifier = get_zero_shot_classifier()
-    if not zero_shot_classifier:
-        log_info = f"[PASS] {news_item.id}: Zero-shot classifier unavailable, passing by default."
-        FILTER_LOGS.append(
-            {
-                "filter": "zero_shot",
-                "id": news_item.id,
-                "decision": "pass",
-                "log": log_info,
-            }
+def get_token_counter(backend=None):
+    """
+    Token counter using the tokenizer of the given classifier backend, or
+    counting words while the backend has not loaded it yet (never fetched here).
+    """
+    return TokenCounter(get_classifier_backend(backend).tokenizer)
+
+
+def build_classifier_text(news_item, backend=None):
+    """
+    Text fed to the zero-shot classifier: title + first sentences of body,
+    within CLASSIFIER_SNIPPET_MAX_TOKENS tokens of the backend's tokenizer
+    (words until the backend is loaded).
+    """
+    return build_snippet(
+        news_item.title,
+        news_item.body,
+        get_token_counter(backend),
+        max_tokens=CLASSIFIER_SNIPPET_MAX_TOKENS,
+        n_sentences=CLASSIFIER_SNIPPET_SENTENCES,
+    )
+
+
+def _scores_to_result(scores):
+    """Score vector in ZERO_SHOT_LABELS order -> pipeline-shaped output"""
+    ranked = sorted(zip(ZERO_SHOT_LABELS, scores), key=lambda x: x[1], reverse=True)
+    return {
+        "labels": [label for label, _ in ranked],
+        "scores": [score for _, score in ranked],
+    }
+
+
+def _result_to_scores(result):
+    """Pipeline-shaped output -> score vector in ZERO_SHOT_LABELS order"""
+    by_label = dict(zip(result["labels"], result["scores"]))
+    return [by_label[label] for label in ZERO_SHOT_LABELS]
+
+
+def score_texts(texts, batch_size=CLASSIFIER_BATCH_SIZE, backend=None):
+    """
+    Zero-shot score vectors (ZERO_SHOT_LABELS order) of raw classifier texts,
+    through the classification cache; None where the classifier is unavailable.
+    """
+    results = _classify_texts(texts, batch_size=batch_size, backend=backend)
+    return [None if result is None else _result_to_scores(result) for result in results]
+
+
+def _classify_texts(texts, batch_size=CLASSIFIER_BATCH_SIZE, backend=None):
+    """
+    Scores texts against ZERO_SHOT_LABELS with the given classifier backend,
+    serving repeats from its classification cache and running the model only
+    on the misses.
+    Returns one pipeline-shaped result per text, or None where the text could
+    not be scored because the classifier is unavailable.
+    """
+    cache = get_classification_cache(backend)
+    keys = [content_hash(normalize_text(text)) for text in texts]
+    results = [None] * len(texts)
+    missing = {}  # key -> indices of texts sharing that key
+    for index, key in enumerate(keys):
+        cached = cache.get(key) if key not in missing else None
+        if cached is not None:
+            results[index] = _scores_to_result(cached)
+        else:
+            missing.setdefault(key, []).append(index)
+
+    if not missing:
+        return results
+
+    batch_size = max(1, batch_size)
+    # Length buckets: batch texts of similar token length to minimise padding
+    counter = get_token_counter(backend)
+    lengths = {
+        key: counter.count(texts[indices[0]]) for key, indices in missing.items()
+    }
+    missing_keys = sorted(missing, key=lambda key: lengths[key])
+    missing_texts = [texts[missing[key][0]] for key in missing_keys]
+    for start in range(0, len(missing_keys), batch_size):
+        record_batch_tokens(
+            [lengths[key] for key in missing_keys[start : start + batch_size]]
         )
-        log_accepted(news_item, step="zero_shot_it_relevance_filter")
-        return 1, 1.0, None, log_info
 
-    context = ""
-    body_snippet = get_first_n_sentences(news_item.body, n=2)
-    text_title = context + (news_item.title or "")
-    if body_snippet:
-        text_title += " " + body_snippet
+    pool = get_inference_pool(get_classifier_backend(backend).name)
+    if pool is not None:
+        # Shard across the worker processes, one batch per task
+        score_matrix = pool.score(missing_texts, ZERO_SHOT_LABELS, batch_size)
+        if score_matrix is None:
+            return results
+    else:
+        zero_shot_classifier = get_zero_shot_classifier(backend)
+        if not zero_shot_classifier:
+            return results
+        score_matrix = []
+        for start in range(0, len(missing_texts), batch_size):
+            score_matrix.extend(
+                zero_shot_classifier.score(
+                    missing_texts[start : start + batch_size], ZERO_SHOT_LABELS
+                )
+            )
+
+    for key, scores in zip(missing_keys, score_matrix):
+        cache.put(key, scores)
+        for index in missing[key]:
+            results[index] = _scores_to_result(scores)
+    # One SQLite commit per classified batch
+    cache.flush()
+
+    return results
+
 
-    result_title = zero_shot_classifier(
-        text_title, candidate_labels=ZERO_SHOT_LABELS, multi_label=True
+def _pass_by_default(news_item):
+    log_info = (
+        f"[PASS] {news_item.id}: Zero-shot classifier unavailable, passing by default."
+    )
+    FILTER_LOGS.append(
+        {
+            "filter": "zero_shot",
+            "id": news_item.id,
+            "stage": "classifier_unavailable",
+            "decision": "pass",
+            "log": log_info,
+        }
     )
+    log_accepted(news_item, step="zero_shot_it_relevance_filter")
+    return 1, 1.0, None, log_info
 
+
+def _run_prefilter(text, mode):
+    """(decision, label, matched_terms) of the rule prefilter, or None when off"""
+    if mode == PREFILTER_OFF:
+        return None
+    return RULE_PREFILTER.decide(text)
+
+
+def _reject_by_prefilter(news_item, matched_terms):
+    """Enforced prefilter reject: the item never reaches the model"""
+    PREFILTER_STATS["skipped"] += 1
+    log_info_prefilter = (
+        f"[FILTERED] {news_item.id} | {news_item.title}: "
+        f"Prefilter reject on terms {matched_terms}"
+    )
+    FILTER_LOGS.append(
+        {
+            "filter": "prefilter",
+            "id": news_item.id,
+            "stage": "prefilter",
+            "decision": "filtered",
+            "log": log_info_prefilter,
+            "matched_terms": matched_terms,
+            "top_relevant_label": None,
+            "top_relevant_score": 0.0,
+        }
+    )
+    news_item.relevance_score = 0.0
+    news_item.top_relevant_label = None
+    log_refused(news_item, step="prefilter")
+    return 0, 0.0, None, log_info_prefilter
+
+
+def _apply_zero_shot_result(
+    news_item,
+    result_title,
+    min_score,
+    prefilter=None,
+    mode=PREFILTER_MODE,
+    backend=None,
+):
+    """
+    Turn one pipeline output into the filter decision tuple (and log it).
+    `prefilter` is the rule prefilter's (decision, label, matched_terms) for
+    the item: in "enforce" mode a fast-track accepts it whatever the model
+    says (its relevance stays the model's score); otherwise it is only logged.
+    """
     relevant_scores_title = [
         (label, score)
         for label, score in zip(result_title["labels"], result_title["scores"])
@@ -141,7 +458,16 @@ def zero_shot_it_relevance_filter(
     ]
 
     max_score = max([score for _, score in relevant_scores_title], default=0.0)
-    is_relevant = any(score >= min_score for _, score in relevant_scores_title)
+    model_relevant = any(score >= min_score for _, score in relevant_scores_title)
+    is_relevant = model_relevant
+    prefilter_decision, _, matched_terms = prefilter or (None, None, [])
+    if prefilter_decision is not None and model_relevant != (
+        prefilter_decision == FAST_TRACK
+    ):
+        PREFILTER_STATS["disagreed"] += 1
+    if mode == PREFILTER_ENFORCE and prefilter_decision == FAST_TRACK:
+        PREFILTER_STATS["fast_tracked"] += 1
+        is_relevant = True
     binary_label = 1 if is_relevant else 0
     top_relevant_title = (
         max(relevant_scores_title, key=lambda x: x[1])
@@ -150,6 +476,11 @@ def zero_shot_it_relevance_filter(
     )
     top_label = top_relevant_title[0]
     news_item.top_relevant_label = top_label
+    get_score_store().add(
+        news_item.id,
+        _result_to_scores(result_title),
+        backend=get_classifier_backend(backend).name,
+    )
 
     log_info_title = (
         f"{'[PASS]' if is_relevant else '[FILTERED]'} {news_item.id} | {news_item.title}: "
@@ -166,6 +497,8 @@ def zero_shot_it_relevance_filter(
             "top_relevant_label": top_label,
             "top_relevant_score": top_relevant_title[1],
             "all_scores": list(zip(result_title["labels"], result_title["scores"])),
+            "prefilter": prefilter_decision,
+            "matched_terms": matched_terms,
         }
     )
 
@@ -181,6 +514,75 @@ def zero_shot_it_relevance_filter(
     return binary_label, max_score, top_label, log_info_title
 
 
+def zero_shot_it_relevance_filter(
+    news_item,
+    min_score=MIN_SCORE,
+    fallback_to_body=True,
+    prefilter_mode=PREFILTER_MODE,
+    backend=None,
+):
+    text_title = build_classifier_text(news_item, backend=backend)
+
+    prefilter = _run_prefilter(text_title, prefilter_mode)
+    if prefilter_mode == PREFILTER_ENFORCE and prefilter[0] == REJECT:
+        return _reject_by_prefilter(news_item, prefilter[2])
+
+    result_title = _classify_texts([text_title], batch_size=1, backend=backend)[0]
+    if result_title is None:
+        return _pass_by_default(news_item)
+
+    return _apply_zero_shot_result(
+        news_item, result_title, min_score, prefilter, prefilter_mode, backend
+    )
+
+
+def zero_shot_it_relevance_filter_batch(
+    news_items,
+    min_score=MIN_SCORE,
+    batch_size=CLASSIFIER_BATCH_SIZE,
+    prefilter_mode=PREFILTER_MODE,
+    backend=None,
+):
+    """
+    Batched version of zero_shot_it_relevance_filter for a whole ingestion cycle.
+    Items are scored `batch_size` at a time (each item expands to one NLI pair per
+    label, so a forward pass sees batch_size * len(ZERO_SHOT_LABELS) pairs).
+    Items already in the classification cache, or rejected by the rule
+    prefilter in "enforce" mode, skip inference entirely. `backend` names the
+    classifier in CLASSIFIER_BACKENDS (None = DEFAULT_CLASSIFIER_BACKEND).
+    Returns one (binary_label, max_score, top_label, log) tuple per item, in order.
+    """
+    if not news_items:
+        return []
+
+    texts = [build_classifier_text(item, backend=backend) for item in news_items]
+    decisions = [None] * len(news_items)
+    prefilters = [_run_prefilter(text, prefilter_mode) for text in texts]
+    model_indices = []
+    for index, (item, prefilter) in enumerate(zip(news_items, prefilters)):
+        if prefilter_mode == PREFILTER_ENFORCE and prefilter[0] == REJECT:
+            decisions[index] = _reject_by_prefilter(item, prefilter[2])
+        else:
+            model_indices.append(index)
+
+    results = _classify_texts(
+        [texts[index] for index in model_indices],
+        batch_size=batch_size,
+        backend=backend,
+    )
+    for index, result in zip(model_indices, results):
+        item = news_items[index]
+        decisions[index] = (
+            _pass_by_default(item)
+            if result is None
+            else _apply_zero_shot_result(
+                item, result, min_score, prefilters[index], prefilter_mode, backend
+            )
+        )
+
+    return decisions
+
+
 def log_filtering_summary(stage_name, items_with_logs, threshold):
     passed = [item for item, (score, logs) in items_with_logs if score > threshold]
     filtered = [item for item, (score, logs) in items_with_logs if score <= threshold]
@@ -199,76 +601,17 @@ def assess_with_bigger_model(news_items):
     """
     Assess the relevance of news items using a larger instruction-tuned language model via transformers.
     Returns a dict mapping news_item.id to the model's label ('RELEVANT' or 'NOT_RELEVANT').
+    The model stays loaded between calls and verdicts are cached on disk (see LLMAssessor).
+    The verdicts become the ground truth of the items' rows in the score store,
+    for threshold sweeps with `evaluate_thresholds --store`.
     """
-    results = {}
     if not news_items:
-        return results
-    # Load model and tokenizer once
-    model_name = "tiiuae/falcon-7b-instruct"  # Instruction-tuned LLM
-    try:
-        quantization_config = BitsAndBytesConfig(load_in_4bit=True)
-        model = AutoModelForCausalLM.from_pretrained(
-            model_name, quantization_config=quantization_config, device_map="auto"
-        )
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
-        generator = pipeline("text-generation", model=model, tokenizer=tokenizer)
-    except Exception as e:
-        logger.error(f"Failed to load the larger model: {e}")
-        for item in news_items:
-            results[item.id] = "NOT_RELEVANT"
-        return results
-    prompt_template = (
-        "You are an enterprise IT risk analyst.\n\n"
-        "TASK\n------\n"
-        "Read the article delimited by <article></article>.\n"
-        "Return exactly one word from this list—nothing else:\n\n"
-        "RELEVANT     (major cloud outage, CVSS ≥ 7 vuln, 0-day exploit, ransomware in the wild)\n"
-        "NOT_RELEVANT (consumer tech, general business news, HR moves, marketing releases)\n\n"
-        "EXAMPLES\n--------\n"
-        "<article>\nTitle: Major AWS Outage Disrupts Global Services\nBody: Amazon Web Services suffered a major outage today, impacting thousands of businesses worldwide. Critical infrastructure and cloud-hosted applications were unavailable for several hours.\n</article>\nLabel: RELEVANT\n\n"
-        "<article>\nTitle: Apple Releases New iPhone 16\nBody: Apple has announced the launch of its latest smartphone, the iPhone 16, featuring a new camera and improved battery life.\n</article>\nLabel: NOT_RELEVANT\n\n"
-        "<article>\nTitle: Minor Bug Found in Internal HR Portal\nBody: A small bug was discovered in the company HR portal, causing a minor display issue for some users. The bug does not affect payroll or sensitive data.\n</article>\nLabel: NOT_RELEVANT\n\n"
-        "Now, classify the following article:\n\n"
-        "<article>\n{article}\n</article>\nLabel:"
+        return {}
+    verdicts = get_llm_assessor().assess(news_items)
+    get_score_store().set_ground_truth(
+        {item_id: label == "RELEVANT" for item_id, label in verdicts.items()}
     )
-    for item in news_items:
-        article_text = item.title or ""
-        if item.body:
-            article_text += " " + item.body[:300]
-        else:
-            article_text = article_text[:300]
-        prompt = prompt_template.format(article=article_text)
-        try:
-            output = generator(prompt, max_new_tokens=10, do_sample=False)[0][
-                "generated_text"
-            ]
-            # Parse only the relevant part of the output
-            relevant_output = output
-            if "Now, classify the following article" in relevant_output:
-                relevant_output = relevant_output.split(
-                    "Now, classify the following article", 1
-                )[-1]
-            if "Label:" in relevant_output:
-                relevant_output = relevant_output.split("Label:", 1)[-1]
-            # Extract the label from the relevant part (look for RELEVANT or NOT_RELEVANT)
-            label = None
-            output_upper = relevant_output.upper()
-            if re.search(r"\bNOT_RELEVANT\b", output_upper):
-                label = "NOT_RELEVANT"
-            elif re.search(r"\bRELEVANT\b", output_upper):
-                label = "RELEVANT"
-            else:
-                logger.warning(
-                    f"Unexpected label from the larger model: {output} for item {item.id}"
-                )
-                label = "NOT_RELEVANT"
-
-            results[item.id] = label
-
-        except Exception as e:
-            logger.error(f"Larger model inference failed for item {item.id}: {e}")
-            results[item.id] = "NOT_RELEVANT"
-    return results
+    return verdicts
 
 
 def evaluate_pipeline_vs_model(pipeline_labels, model_labels):
@@ -0,0 +1,259 @@
+import json
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from newsfeed.config import (
+    HTTP_POOL_MAXSIZE,
+    HTTP_STREAM_CHUNK_SIZE,
+    HTTP_USER_AGENT,
+    HTTP_VALIDATOR_CACHE_SIZE,
+    SOURCE_FETCH_TIMEOUT,
+)
+from newsfeed.ingestion.base_source import commit_fetch
+
+# orjson is optional (pip install orjson); it decodes large listings several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ETag, Last-Modified and source name of a URL's last 200 response
+Validators = Tuple[Optional[str], Optional[str], str]
+
+
+def loads(data):
+    """Decode JSON bytes/str with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _header_seconds(headers, name: str) -> Optional[float]:
+    """Numeric header value (e.g. Retry-After in seconds), None if absent or not a number"""
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class HttpClient:
+    """
+    Keep-alive HTTP client shared by all sources.
+
+    - One requests.Session with a pooled adapter, so connections to the same
+      host are reused across fetch cycles (and across the concurrent fetches).
+    - Conditional GETs: the ETag / Last-Modified of the last 200 response of a
+      URL are sent back as If-None-Match / If-Modified-Since, and get() returns
+      None on 304 Not Modified so the caller can skip parsing. Validators are
+      kept for the `validator_capacity` most recently used URLs: cursor URLs
+      (Reddit's before=t3_...) change every poll and would otherwise pile up.
+    - Per-source counters: requests, 304s, body bytes and new connections.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        validator_capacity: int = HTTP_VALIDATOR_CACHE_SIZE,
+    ):
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = HTTP_USER_AGENT
+        self.adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        # Least recently used URL first
+        self._validators: "OrderedDict[str, Validators]" = OrderedDict()
+        self.validator_capacity = max(0, validator_capacity)
+        self._pool_connections: Dict[object, int] = {}
+        self._last: Dict[str, Dict[str, Optional[float]]] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {
+                "requests": 0,
+                "not_modified": 0,
+                "bytes": 0,
+                "new_connections": 0,
+            }
+        )
+        self._lock = threading.Lock()
+
+    def _new_connections(self, response: requests.Response) -> int:
+        """
+        Connections the response's host pool opened since it was last seen
+        (approximate when several sources fetch from one host concurrently).
+        Call with the lock held.
+        """
+        pool = getattr(response.raw, "_pool", None)
+        if pool is None:
+            return 0
+        opened = getattr(pool, "num_connections", 0)
+        new_connections = opened - self._pool_connections.get(pool, 0)
+        self._pool_connections[pool] = opened
+        return new_connections
+
+    def get(
+        self,
+        url: str,
+        source_name: str,
+        timeout: float = SOURCE_FETCH_TIMEOUT,
+        conditional: bool = True,
+        stream: bool = False,
+    ) -> Optional[requests.Response]:
+        """
+        GET url on behalf of source_name. Returns None if the server answered
+        304 Not Modified, the response otherwise (HTTP errors are raised).
+        With stream=True the body is not read: consume it with iter_content().
+        """
+        headers = {}
+        if conditional:
+            with self._lock:
+                etag, last_modified, _ = self._validators.get(url, (None, None, None))
+                if url in self._validators:
+                    self._validators.move_to_end(url)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self.session.get(
+                url, headers=headers, timeout=timeout, stream=stream
+            )
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._last[source_name] = {"status": None}
+            raise
+        not_modified = response.status_code == 304
+        # Reads the whole body (outside the lock)
+        size = 0 if not_modified or stream else len(response.content)
+
+        with self._lock:
+            stats = self._stats[source_name]
+            stats["requests"] += 1
+            stats["new_connections"] += max(0, self._new_connections(response))
+            stats["bytes"] += size
+            self._last[source_name] = {
+                "status": response.status_code,
+                "retry_after": _header_seconds(response.headers, "Retry-After"),
+                "ratelimit_remaining": _header_seconds(
+                    response.headers, "X-Ratelimit-Remaining"
+                ),
+                "ratelimit_reset": _header_seconds(
+                    response.headers, "X-Ratelimit-Reset"
+                ),
+            }
+            if not_modified:
+                stats["not_modified"] += 1
+                return None
+            if not response.ok:
+                response.close()
+            response.raise_for_status()
+            if conditional:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    # Not for an abandoned fetch: its body is never ingested
+                    commit_fetch(
+                        lambda: self._remember_validators(
+                            url, etag, last_modified, source_name
+                        )
+                    )
+        return response
+
+    def _remember_validators(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        source_name: str,
+    ):
+        """Store a URL's validators, dropping the least recently used ones (lock held)"""
+        self._validators[url] = (etag, last_modified, source_name)
+        self._validators.move_to_end(url)
+        while len(self._validators) > self.validator_capacity:
+            self._validators.popitem(last=False)
+
+    def iter_content(
+        self,
+        response: requests.Response,
+        source_name: str,
+        chunk_size: int = HTTP_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Body chunks of a streamed response, counted in the source's bytes.
+        Closing the generator early closes the response (the rest of the body
+        is not downloaded, and that connection is not reused).
+        """
+        try:
+            for chunk in response.iter_content(chunk_size):
+                with self._lock:
+                    self._stats[source_name]["bytes"] += len(chunk)
+                yield chunk
+        finally:
+            response.close()
+
+    def last_response(self, source_name: str) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Status (None if no response arrived), Retry-After and Reddit's
+        X-Ratelimit-Remaining/-Reset of the source's latest request
+        """
+        with self._lock:
+            return self._last.get(source_name)
+
+    def forget(self, source_name: str):
+        """
+        Drop the validators of a source's URLs, so its next fetch downloads the
+        full body (used when a fetched body could not be turned into items).
+        """
+        with self._lock:
+            for url in [
+                url
+                for url, (_, _, owner) in self._validators.items()
+                if owner == source_name
+            ]:
+                del self._validators[url]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-source counters plus the 304 rate and connection reuse rate"""
+        with self._lock:
+            report = {}
+            for source_name, stats in self._stats.items():
+                requests_made = stats["requests"]
+                report[source_name] = {
+                    **stats,
+                    "not_modified_rate": (
+                        stats["not_modified"] / requests_made if requests_made else 0.0
+                    ),
+                    "connection_reuse_rate": (
+                        1 - min(stats["new_connections"], requests_made) / requests_made
+                        if requests_made
+                        else 0.0
+                    ),
+                }
+            return report
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide HTTP client, created on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def get_http_stats() -> Dict[str, Dict[str, float]]:
+    return get_http_client().stats()
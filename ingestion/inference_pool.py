@@ -0,0 +1,124 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import torch
+
+from newsfeed.config import (
+    INFERENCE_QUEUE_SIZE,
+    INFERENCE_THREADS_PER_WORKER,
+    INFERENCE_WORKERS,
+)
+from newsfeed.ingestion.classifier_backends import get_classifier_backend
+from newsfeed.log_utils import log_error, log_info
+
+# Backend loaded once per worker process by _init_worker
+_worker_backend = None
+
+
+def _init_worker(backend_name: str, num_threads: int):
+    global _worker_backend
+    torch.set_num_threads(max(1, num_threads))
+    try:
+        _worker_backend = get_classifier_backend(backend_name)
+        _worker_backend.load()
+    except Exception as e:
+        log_error(
+            f"Inference worker could not set up backend '{backend_name}': {e}",
+            source="InferencePool",
+        )
+        _worker_backend = None
+
+
+def _score_in_worker(texts: List[str], labels: List[str]):
+    if _worker_backend is None or not _worker_backend.load():
+        return None
+    return _worker_backend.score(texts, labels)
+
+
+class InferenceWorkerPool:
+    """
+    Dedicated process pool for one classifier backend. Every worker loads the
+    model once (in its initializer) and runs with its own torch intra-op thread
+    count, so inference scales across cores instead of sharing one GIL-bound
+    executor thread. Work is sharded into batches; at most `queue_size` shards
+    are in flight, further submissions block until a worker frees a slot.
+    """
+
+    def __init__(
+        self,
+        backend_name: str,
+        num_workers: int = INFERENCE_WORKERS,
+        threads_per_worker: int = INFERENCE_THREADS_PER_WORKER,
+        queue_size: int = INFERENCE_QUEUE_SIZE,
+    ):
+        self.backend_name = backend_name
+        self.num_workers = max(1, num_workers)
+        self._slots = threading.BoundedSemaphore(max(1, queue_size))
+        # spawn: forking a process that already holds torch thread pools is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(backend_name, threads_per_worker),
+        )
+        log_info(
+            f"Started {self.num_workers} inference workers for backend '{backend_name}' "
+            f"({threads_per_worker} torch threads each, queue size {queue_size}).",
+            source="InferencePool",
+        )
+
+    def score(
+        self, texts: List[str], labels: List[str], shard_size: int
+    ) -> Optional[List[List[float]]]:
+        """
+        Score texts across the workers, `shard_size` texts per task. Returns the
+        score matrix in input order, or None if the backend is unavailable.
+        """
+        shard_size = max(1, shard_size)
+        futures = []
+        for start in range(0, len(texts), shard_size):
+            self._slots.acquire()
+            try:
+                future = self._executor.submit(
+                    _score_in_worker, texts[start : start + shard_size], labels
+                )
+            except Exception:
+                self._slots.release()
+                raise
+            future.add_done_callback(lambda _: self._slots.release())
+            futures.append(future)
+
+        matrix: List[List[float]] = []
+        for future in futures:
+            rows = future.result()
+            if rows is None:
+                return None
+            matrix.extend(rows)
+        return matrix
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pools: Dict[str, InferenceWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_inference_pool(backend_name: str) -> Optional[InferenceWorkerPool]:
+    """Worker pool for a backend, or None when INFERENCE_WORKERS is 0 (in-process)"""
+    if INFERENCE_WORKERS <= 0:
+        return None
+    with _pools_lock:
+        pool = _pools.get(backend_name)
+        if pool is None:
+            pool = _pools[backend_name] = InferenceWorkerPool(backend_name)
+        return pool
+
+
+def shutdown_inference_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
@@ -0,0 +1,270 @@
+import copy
+import threading
+import time
+from typing import Dict, List, Optional
+
+import torch
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+
+from newsfeed.config import (
+    ASSESSMENT_CACHE_DISK_SIZE,
+    ASSESSMENT_CACHE_PATH,
+    ASSESSMENT_CACHE_SIZE,
+    ASSESSOR_BATCH_SIZE,
+    ASSESSOR_MODEL,
+    CACHE_COMMIT_EVERY,
+)
+from newsfeed.ingestion.cache import ContentHashCache, content_hash, normalize_text
+from newsfeed.log_utils import log_error, log_info
+
+RELEVANT = "RELEVANT"
+NOT_RELEVANT = "NOT_RELEVANT"
+# Characters of the body included in the article shown to the assessor
+ARTICLE_MAX_CHARS = 300
+# Seconds to wait before retrying a model load that failed
+LOAD_RETRY_SECONDS = 300
+
+# Few-shot instructions shared by every prompt; its KV cache is computed once
+PROMPT_PREFIX = (
+    "You are an enterprise IT risk analyst.\n\n"
+    "TASK\n------\n"
+    "Read the article delimited by <article></article>.\n"
+    "Return exactly one word from this list—nothing else:\n\n"
+    "RELEVANT     (major cloud outage, CVSS ≥ 7 vuln, 0-day exploit, ransomware in the wild)\n"
+    "NOT_RELEVANT (consumer tech, general business news, HR moves, marketing releases)\n\n"
+    "EXAMPLES\n--------\n"
+    "<article>\nTitle: Major AWS Outage Disrupts Global Services\nBody: Amazon Web Services suffered a major outage today, impacting thousands of businesses worldwide. Critical infrastructure and cloud-hosted applications were unavailable for several hours.\n</article>\nLabel: RELEVANT\n\n"
+    "<article>\nTitle: Apple Releases New iPhone 16\nBody: Apple has announced the launch of its latest smartphone, the iPhone 16, featuring a new camera and improved battery life.\n</article>\nLabel: NOT_RELEVANT\n\n"
+    "<article>\nTitle: Minor Bug Found in Internal HR Portal\nBody: A small bug was discovered in the company HR portal, causing a minor display issue for some users. The bug does not affect payroll or sensitive data.\n</article>\nLabel: NOT_RELEVANT\n\n"
+    "Now, classify the following article:\n\n"
+    "<article>\n"
+)
+# Per-item part of the prompt
+PROMPT_SUFFIX = "{article}\n</article>\nLabel:"
+
+
+def build_article_text(news_item) -> str:
+    article_text = news_item.title or ""
+    if news_item.body:
+        article_text += " " + news_item.body[:ARTICLE_MAX_CHARS]
+    else:
+        article_text = article_text[:ARTICLE_MAX_CHARS]
+    return article_text
+
+
+def _expand_cache(prefix_cache, batch_size: int):
+    """Copy of the prefix KV cache repeated for every row of a batch"""
+    if hasattr(prefix_cache, "batch_repeat_interleave"):
+        cache = copy.deepcopy(prefix_cache)
+        cache.batch_repeat_interleave(batch_size)
+        return cache
+    # Legacy tuple-of-tuples cache
+    return tuple(
+        tuple(tensor.repeat_interleave(batch_size, dim=0) for tensor in layer)
+        for layer in prefix_cache
+    )
+
+
+class LLMAssessor:
+    """
+    Long-lived instruction-tuned LLM used as a relevance judge (ground truth
+    for evaluating the zero-shot filter).
+
+    - The model is loaded once and kept resident.
+    - The few-shot prefix is run through the model once; its KV cache is
+      copied for every batch, so only the per-article suffix is computed.
+    - Articles are scored in right-padded batches with a single forward pass:
+      the verdict is the greedy choice between the two allowed answers at the
+      token where " RELEVANT" and " NOT_RELEVANT" diverge.
+    - Verdicts are cached on disk by content hash (model + prompt + article),
+      so re-running an evaluation only pays for new items.
+    """
+
+    def __init__(
+        self,
+        model_name: str = ASSESSOR_MODEL,
+        batch_size: int = ASSESSOR_BATCH_SIZE,
+        quantize_4bit: bool = True,
+        cache_path: Optional[str] = ASSESSMENT_CACHE_PATH,
+    ):
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.quantize_4bit = quantize_4bit
+        self.cache = ContentHashCache(
+            namespace=f"llm_assessor:{model_name}",
+            fingerprint=content_hash(model_name, PROMPT_PREFIX, PROMPT_SUFFIX),
+            capacity=ASSESSMENT_CACHE_SIZE,
+            path=cache_path,
+            disk_capacity=ASSESSMENT_CACHE_DISK_SIZE,
+            commit_every=CACHE_COMMIT_EVERY,
+        )
+        self.model = None
+        self.tokenizer = None
+        self._prefix_cache = None
+        self._prefix_length = 0
+        self._forced_ids: List[int] = []
+        self._branch_ids = (None, None)
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def cache_key(self, news_item) -> str:
+        return content_hash(normalize_text(build_article_text(news_item)))
+
+    def load(self) -> bool:
+        with self._lock:
+            if self.model is None and time.time() >= self._retry_at:
+                log_info(
+                    f"Loading assessor model {self.model_name} (kept resident)...",
+                    source="LLMAssessor",
+                )
+                try:
+                    start_time = time.time()
+                    kwargs = {}
+                    if self.quantize_4bit:
+                        kwargs = {
+                            "quantization_config": BitsAndBytesConfig(
+                                load_in_4bit=True
+                            ),
+                            "device_map": "auto",
+                        }
+                    model = AutoModelForCausalLM.from_pretrained(
+                        self.model_name, **kwargs
+                    )
+                    model.eval()
+                    tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                    if tokenizer.pad_token_id is None:
+                        tokenizer.pad_token = tokenizer.eos_token
+                    self._prepare(model, tokenizer)
+                    self.model, self.tokenizer = model, tokenizer
+                    log_info(
+                        f"Assessor model loaded in {time.time() - start_time:.1f} seconds",
+                        source="LLMAssessor",
+                    )
+                except Exception as e:
+                    log_error(
+                        f"Failed to load the larger model: {e}", source="LLMAssessor"
+                    )
+                    self._retry_at = time.time() + LOAD_RETRY_SECONDS
+        return self.model is not None
+
+    def _prepare(self, model, tokenizer):
+        """Compute the prefix KV cache and the answer tokens to compare"""
+        prefix_ids = tokenizer(PROMPT_PREFIX, return_tensors="pt").input_ids
+        with torch.no_grad():
+            output = model(input_ids=prefix_ids.to(model.device), use_cache=True)
+        self._prefix_cache = output.past_key_values
+        self._prefix_length = prefix_ids.shape[1]
+
+        relevant = tokenizer(" " + RELEVANT, add_special_tokens=False).input_ids
+        not_relevant = tokenizer(" " + NOT_RELEVANT, add_special_tokens=False).input_ids
+        common = 0
+        while (
+            common < min(len(relevant), len(not_relevant))
+            and relevant[common] == not_relevant[common]
+        ):
+            common += 1
+        if common == min(len(relevant), len(not_relevant)):
+            raise ValueError("Answer labels are not distinguishable by the tokenizer")
+        # Tokens both answers start with are forced; the verdict is taken where they diverge
+        self._forced_ids = relevant[:common]
+        self._branch_ids = (relevant[common], not_relevant[common])
+
+    def branch_logits(self, articles: List[str]) -> torch.Tensor:
+        """Logits of the (RELEVANT, NOT_RELEVANT) branch tokens, one row per article"""
+        suffixes = [
+            self.tokenizer(
+                PROMPT_SUFFIX.format(article=article), add_special_tokens=False
+            ).input_ids
+            + self._forced_ids
+            for article in articles
+        ]
+        lengths = torch.tensor([len(ids) for ids in suffixes])
+        batch_size, width = len(suffixes), int(lengths.max())
+
+        input_ids = torch.full(
+            (batch_size, width), self.tokenizer.pad_token_id, dtype=torch.long
+        )
+        # Prefix positions are always visible; suffixes are right-padded
+        attention_mask = torch.zeros(
+            (batch_size, self._prefix_length + width), dtype=torch.long
+        )
+        attention_mask[:, : self._prefix_length] = 1
+        for row, ids in enumerate(suffixes):
+            input_ids[row, : len(ids)] = torch.tensor(ids)
+            attention_mask[
+                row, self._prefix_length : self._prefix_length + len(ids)
+            ] = 1
+
+        device = self.model.device
+        with torch.no_grad():
+            logits = self.model(
+                input_ids=input_ids.to(device),
+                attention_mask=attention_mask.to(device),
+                past_key_values=_expand_cache(self._prefix_cache, batch_size),
+                use_cache=True,
+            ).logits
+        last = logits[torch.arange(batch_size), (lengths - 1).to(device)]
+        return last[:, list(self._branch_ids)].float().cpu()
+
+    def assess(self, news_items) -> Dict[str, str]:
+        """Map news_item.id -> RELEVANT / NOT_RELEVANT"""
+        results: Dict[str, str] = {}
+        missing: Dict[str, list] = {}  # cache key -> items sharing that article
+        for item in news_items:
+            key = self.cache_key(item)
+            cached = self.cache.get(key) if key not in missing else None
+            if cached is not None:
+                results[item.id] = cached
+            else:
+                missing.setdefault(key, []).append(item)
+
+        if missing and not self.load():
+            for items in missing.values():
+                for item in items:
+                    results[item.id] = NOT_RELEVANT
+            return results
+
+        # Similar-length articles share a batch to limit padding
+        keys = sorted(missing, key=lambda k: len(build_article_text(missing[k][0])))
+        start_time = time.perf_counter()
+        for start in range(0, len(keys), self.batch_size):
+            batch_keys = keys[start : start + self.batch_size]
+            articles = [build_article_text(missing[key][0]) for key in batch_keys]
+            try:
+                logits = self.branch_logits(articles)
+            except Exception as e:
+                log_error(
+                    f"Larger model inference failed for a batch of {len(articles)}: {e}",
+                    source="LLMAssessor",
+                )
+                for key in batch_keys:
+                    for item in missing[key]:
+                        results[item.id] = NOT_RELEVANT
+                continue
+            for key, (relevant, not_relevant) in zip(batch_keys, logits.tolist()):
+                verdict = RELEVANT if relevant > not_relevant else NOT_RELEVANT
+                self.cache.put(key, verdict)
+                for item in missing[key]:
+                    results[item.id] = verdict
+        self.cache.flush()
+
+        if missing:
+            log_info(
+                f"Assessed {len(missing)} new articles in {time.perf_counter() - start_time:.1f}s; "
+                f"{len(news_items) - sum(len(v) for v in missing.values())} served from cache",
+                source="LLMAssessor",
+            )
+        return results
+
+
+_assessor: Optional[LLMAssessor] = None
+_assessor_lock = threading.Lock()
+
+
+def get_llm_assessor() -> LLMAssessor:
+    """Process-wide assessor, created on first use"""
+    global _assessor
+    with _assessor_lock:
+        if _assessor is None:
+            _assessor = LLMAssessor()
+        return _assessor
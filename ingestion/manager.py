@@ -1,19 +1,34 @@
 import logging
 import math
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from newsfeed.config import (
+    ADAPTIVE_POLLING,
+    ASSESS_EFFICIENCY,
+    BREAKER_PROBE_TIMEOUT,
+    CIRCUIT_BREAKER,
+    CLASSIFIER_BATCH_SIZE,
     INTERVAL,
     MIN_SCORE,
     NUMBER_INITIAL_POST_PER_SOURCE,
     PERSISTENCE_TIME,
+    SOURCE_CYCLE_BUDGET,
+    SOURCE_FETCH_CONCURRENCY,
+    SOURCE_FETCH_MAX_ABANDONED,
+    SOURCE_FETCH_TIMEOUT,
 )
-from newsfeed.ingestion.filtering import zero_shot_it_relevance_filter
-from newsfeed.log_utils import log_error, log_info
+from newsfeed.ingestion.circuit_breaker import CircuitBreaker
+from newsfeed.ingestion.filtering import zero_shot_it_relevance_filter_batch
+from newsfeed.ingestion.http_client import get_http_client
+from newsfeed.ingestion.scheduler import PollScheduler
+from newsfeed.log_utils import log_efficiency, log_error, log_info
 from newsfeed.models import NewsItem
 
-from .base_source import BaseSource
+from .base_source import BaseSource, FetchToken, running_fetch
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +50,12 @@ class IngestionManager:
         sources: List[BaseSource],
         interval: int = INTERVAL,
         number_initial_post_per_source: int = NUMBER_INITIAL_POST_PER_SOURCE,
+        fetch_concurrency: int = SOURCE_FETCH_CONCURRENCY,
+        fetch_timeout: float = SOURCE_FETCH_TIMEOUT,
+        adaptive_polling: bool = ADAPTIVE_POLLING,
+        circuit_breaker: bool = CIRCUIT_BREAKER,
+        cycle_budget: float = SOURCE_CYCLE_BUDGET,
+        max_abandoned: int = SOURCE_FETCH_MAX_ABANDONED,
     ):
         self.sources = sources
         self.interval = interval  # seconds for continuous fetch
@@ -42,6 +63,31 @@ class IngestionManager:
         self.last_fetched_timestamps: Dict[str, datetime] = {}
         self._timer = None
         self._running = False
+        self.fetch_concurrency = fetch_concurrency
+        self.fetch_timeout = fetch_timeout
+        self.cycle_budget = cycle_budget
+        self._fetch_executor: Optional[ThreadPoolExecutor] = None
+        # Fetch threads: fetch_concurrency running plus room for abandoned ones
+        self._fetch_threads = max(1, fetch_concurrency) + max(0, max_abandoned)
+        # Sources with an abandoned fetch since their last fetch started
+        self._abandoned_fetches: Set[str] = set()
+        # Abandoned fetches whose thread may still be running
+        self._abandoned_futures: Set[Future] = set()
+        # Per-source polling deadlines (None: every source every interval)
+        self.scheduler: Optional[PollScheduler] = (
+            PollScheduler([self._source_name(s) for s in sources], interval=interval)
+            if adaptive_polling
+            else None
+        )
+        # Per-source circuit breakers (None: every due source is fetched)
+        self.breakers: Optional[Dict[str, CircuitBreaker]] = (
+            {
+                self._source_name(s): CircuitBreaker(self._source_name(s))
+                for s in sources
+            }
+            if circuit_breaker
+            else None
+        )
         log_info(
             f"IngestionManager initialized with {len(sources)} sources, interval={interval}s, initial_limit={number_initial_post_per_source}.",
             source="IngestionManager",
@@ -58,80 +104,321 @@ class IngestionManager:
         self._running = False
         if self._timer:
             self._timer.cancel()
+        if self._fetch_executor is not None:
+            self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._fetch_executor = None
         log_info("IngestionManager stopped.", source="IngestionManager")
 
+    def due_sources(self) -> List[BaseSource]:
+        """Sources to poll now (all of them without the adaptive scheduler)"""
+        if self.scheduler is None:
+            return [s for s in self.sources if self._breaker_ready(s)]
+        # Sources with an open circuit are not admitted (nor charged a request)
+        due = set(self.scheduler.due(blocked=self._blocked_sources()))
+        return [s for s in self.sources if self._source_name(s) in due]
+
+    def seconds_until_next_poll(self) -> float:
+        if self.scheduler is None:
+            return self.interval
+        blocked = self._blocked_sources()
+        wait = self.scheduler.seconds_until_next_poll(blocked=blocked)
+        for name in blocked:
+            wait = min(wait, self.breakers[name].stats()["reopens_in"])
+        return wait
+
+    @staticmethod
+    def _source_name(source: BaseSource) -> str:
+        return getattr(source, "source_name", str(source))
+
+    def _breaker(self, source: BaseSource) -> Optional[CircuitBreaker]:
+        if self.breakers is None:
+            return None
+        name = self._source_name(source)
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(name)
+        return self.breakers[name]
+
+    def _breaker_ready(self, source: BaseSource) -> bool:
+        breaker = self._breaker(source)
+        return breaker is None or breaker.ready()
+
+    def _blocked_sources(self) -> Set[str]:
+        """Names of the sources whose circuit breaker refuses a fetch now"""
+        return {
+            self._source_name(s) for s in self.sources if not self._breaker_ready(s)
+        }
+
+    def breaker_stats(self) -> Dict[str, Dict[str, float]]:
+        """State, consecutive failures, trips and cool-down of each source's circuit"""
+        if self.breakers is None:
+            return {}
+        return {name: breaker.stats() for name, breaker in self.breakers.items()}
+
+    def _get_fetch_executor(self) -> ThreadPoolExecutor:
+        if self._fetch_executor is None:
+            self._fetch_executor = ThreadPoolExecutor(
+                max_workers=self._fetch_threads,
+                thread_name_prefix="source-fetch",
+            )
+        return self._fetch_executor
+
+    def _fetch_concurrently(
+        self,
+        fetch: Callable[[BaseSource], List[NewsItem]],
+        sources: Optional[List[BaseSource]] = None,
+    ) -> List[Tuple[BaseSource, Optional[List[NewsItem]], Optional[BaseException]]]:
+        """
+        Run fetch(source) for every source on a thread pool, at most
+        fetch_concurrency at once. A fetch still running fetch_timeout seconds
+        after it started (BREAKER_PROBE_TIMEOUT for a half-open probe), or when
+        the cycle_budget of the whole call runs out, is abandoned for this cycle:
+        its items are dropped and its FetchToken is cancelled, so the thread,
+        which cannot be interrupted, leaves the source's cursors and HTTP
+        validators unchanged when it returns. Abandoned threads no longer count
+        towards fetch_concurrency but take one of max_abandoned spare threads;
+        fetches finding no free thread, or not started when the budget runs
+        out, are skipped. Each outcome is reported to the source's circuit
+        breaker. Per-source wall time goes to the efficiency log.
+        Returns (source, items, error) per source, in source order.
+        """
+        sources = self.sources if sources is None else sources
+        http = get_http_client()
+        cycle_deadline = time.perf_counter() + self.cycle_budget
+        timeouts = []
+        for source in sources:
+            breaker = self._breaker(source)
+            timeouts.append(
+                min(self.fetch_timeout, BREAKER_PROBE_TIMEOUT)
+                if breaker is not None and breaker.probing
+                else self.fetch_timeout
+            )
+        started: Dict[int, float] = {}
+        elapsed: Dict[int, float] = {}
+        http_failed: Set[int] = set()
+        outcomes: Dict[int, Tuple] = {}
+
+        def run(index: int, source: BaseSource, token: FetchToken):
+            source_name = self._source_name(source)
+            previous = http.last_response(source_name)
+            try:
+                with running_fetch(token):
+                    return fetch(source)
+            finally:
+                elapsed[index] = time.perf_counter() - started[index]
+                # Sources swallow request errors: look at the HTTP outcome too
+                response = http.last_response(source_name)
+                if response is not previous and (
+                    response["status"] is None or response["status"] >= 400
+                ):
+                    http_failed.add(index)
+
+        def skip(index: int, reason: str):
+            outcomes[index] = (None, TimeoutError(f"{reason}, skipped this cycle"))
+
+        executor = self._get_fetch_executor()
+        queued = list(range(len(sources)))
+        running: Dict[Future, Tuple[int, FetchToken]] = {}
+        while queued or running:
+            self._abandoned_futures = {
+                f for f in self._abandoned_futures if not f.done()
+            }
+            free = min(
+                max(1, self.fetch_concurrency) - len(running),
+                self._fetch_threads - len(self._abandoned_futures) - len(running),
+            )
+            while queued and free > 0 and time.perf_counter() < cycle_deadline:
+                index = queued.pop(0)
+                source_name = self._source_name(sources[index])
+                if source_name in self._abandoned_fetches:
+                    # The abandoned fetch may have stored validators before it
+                    # was abandoned: a 304 now would hide the items it dropped
+                    self._abandoned_fetches.discard(source_name)
+                    http.forget(source_name)
+                token = FetchToken()
+                started[index] = time.perf_counter()
+                running[executor.submit(run, index, sources[index], token)] = (
+                    index,
+                    token,
+                )
+                free -= 1
+            if not running:
+                reason = (
+                    f"cycle time budget of {self.cycle_budget:.1f}s used up"
+                    if time.perf_counter() >= cycle_deadline
+                    else f"{len(self._abandoned_futures)} abandoned fetches hold "
+                    "every spare thread"
+                )
+                for index in queued:
+                    skip(index, reason)
+                break
+
+            # Wake up at the earliest deadline among the running fetches
+            deadline = min(
+                min(started[index] + timeouts[index], cycle_deadline)
+                for index, _ in running.values()
+            )
+            done, _ = wait(
+                set(running),
+                timeout=max(0.0, deadline - time.perf_counter()),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                index, _ = running.pop(future)
+                error = future.exception()
+                items = None if error is not None else future.result()
+                outcomes[index] = (items, error)
+            now = time.perf_counter()
+            out_of_budget = now >= cycle_deadline
+            for future, (index, token) in list(running.items()):
+                timed_out = now - started[index] >= timeouts[index]
+                if not (out_of_budget or timed_out):
+                    continue
+                token.cancel()
+                del running[future]
+                self._abandoned_futures.add(future)
+                self._abandoned_fetches.add(self._source_name(sources[index]))
+                elapsed[index] = now - started[index]
+                if timed_out:
+                    skip(index, f"no response within {timeouts[index]:.1f}s")
+                else:
+                    skip(
+                        index, f"cycle time budget of {self.cycle_budget:.1f}s used up"
+                    )
+
+        results = []
+        for index, source in enumerate(sources):
+            items, error = outcomes[index]
+            results.append((source, items, error))
+            breaker = self._breaker(source)
+            if breaker is not None:
+                if index not in started:
+                    # Never ran: neither a success nor a failure
+                    breaker.release()
+                elif error is not None or index in http_failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if ASSESS_EFFICIENCY:
+                status = "error" if error is not None else f"{len(items or [])} items"
+                if index in http_failed and error is None:
+                    status = "HTTP error"
+                log_efficiency(
+                    f"{self._source_name(source)}: {elapsed.get(index, 0.0):.3f} seconds ({status})",
+                    step="Source fetch",
+                )
+        return results
+
+    def classify_items(
+        self, items: List[NewsItem], backend: Optional[str] = None
+    ) -> Tuple[List[NewsItem], List[NewsItem]]:
+        """
+        Runs the relevance filter over every item collected in a cycle in one
+        batched call and stamps score/label/recency on each item.
+        backend: classifier backend name (None = DEFAULT_CLASSIFIER_BACKEND).
+        Returns (accepted_items, filtered_items).
+        """
+        accepted: List[NewsItem] = []
+        filtered: List[NewsItem] = []
+        if not items:
+            return accepted, filtered
+
+        try:
+            decisions = zero_shot_it_relevance_filter_batch(
+                items,
+                min_score=MIN_SCORE,
+                batch_size=CLASSIFIER_BATCH_SIZE,
+                backend=backend,
+            )
+        except Exception as e:
+            log_error(
+                f"Error while classifying {len(items)} items: {e}",
+                source="IngestionManager",
+                exc_info=True,
+            )
+            return accepted, filtered
+        now = datetime.now(timezone.utc)
+        for item, (binary_label, max_score, top_label, _) in zip(items, decisions):
+            # Store score and label on the item for log_refused to use
+            item.relevance_score = max_score
+            item.top_relevant_label = top_label
+
+            if binary_label:
+                item.recency_weight = compute_recency_weight(item.published_at, now)
+                item.final_score = (
+                    item.relevance_score * item.recency_weight
+                    if item.relevance_score is not None
+                    and item.recency_weight is not None
+                    else None
+                )
+                accepted.append(item)
+                # log_accepted is already called in the relevance filter
+            else:
+                filtered.append(item)
+                # log_refused is already called in the relevance filter
+        return accepted, filtered
+
+    def _classify_pending(
+        self, pending_items: Dict[Optional[str], List[NewsItem]]
+    ) -> Tuple[List[NewsItem], List[NewsItem]]:
+        """Classify the items of a cycle, one batched call per classifier backend"""
+        all_new_items: List[NewsItem] = []
+        all_filtered_items: List[NewsItem] = []
+        for backend, items in pending_items.items():
+            accepted, filtered = self.classify_items(items, backend)
+            all_new_items.extend(accepted)
+            all_filtered_items.extend(filtered)
+        return all_new_items, all_filtered_items
+
     def initial_fetch_sources(
         self, store_filtered: bool = False
     ) -> List[NewsItem] | Tuple[List[NewsItem], List[NewsItem]]:
         """
         Performs the initial fetch for all sources, getting the most recent 'number_initial_post_per_source' items.
         Updates last_fetched_timestamps for each source based on the initial fetch.
+        All fetched items are classified together in one batched filter call.
         """
         log_info(
             "Manager performing initial ingestion fetch.", source="IngestionManager"
         )
-        all_new_items: List[NewsItem] = []
-        all_filtered_items: List[NewsItem] = []
+        # Items fetched this cycle, grouped by the classifier backend of their source
+        pending_items: Dict[Optional[str], List[NewsItem]] = defaultdict(list)
 
-        for source in self.sources:
-            source_name = getattr(source, "source_name", str(source))
-            try:
-                log_info(
-                    f"Performing initial fetch from source: {source_name} (limit={self.number_initial_post_per_source})",
+        def fetch(source):
+            log_info(
+                f"Performing initial fetch from source: {self._source_name(source)} (limit={self.number_initial_post_per_source})",
+                source="IngestionManager",
+            )
+            return source.fetch_news(posts_limit=self.number_initial_post_per_source)
+
+        for source, fetched_items, error in self._fetch_concurrently(fetch):
+            source_name = self._source_name(source)
+            if error is not None:
+                log_error(
+                    f"Error during initial fetch from source {source_name}: {error}",
                     source="IngestionManager",
+                    exc_info=error,
                 )
-                fetched_items = source.fetch_news(
-                    posts_limit=self.number_initial_post_per_source
+                continue
+            if fetched_items:
+                sorted_items = sorted(
+                    fetched_items, key=lambda x: x.published_at, reverse=True
                 )
-
-                if fetched_items:
-                    sorted_items = sorted(
-                        fetched_items, key=lambda x: x.published_at, reverse=True
-                    )
-                    newest_timestamp = sorted_items[0].published_at
-                    self.last_fetched_timestamps[source_name] = newest_timestamp
-                    log_info(
-                        f"Initially fetched {len(fetched_items)} items from {source_name}. Newest timestamp: {newest_timestamp}",
-                        source="IngestionManager",
-                    )
-
-                    now = datetime.now(timezone.utc)
-                    for item in fetched_items:
-                        binary_label, max_score, top_label, log_info_filter = (
-                            zero_shot_it_relevance_filter(item, min_score=MIN_SCORE)
-                        )
-
-                        # Store score and label on the item for log_refused to use
-                        item.relevance_score = max_score
-                        item.top_relevant_label = top_label
-
-                        if binary_label:
-                            item.recency_weight = compute_recency_weight(
-                                item.published_at, now
-                            )
-                            item.final_score = (
-                                item.relevance_score * item.recency_weight
-                                if item.relevance_score is not None
-                                and item.recency_weight is not None
-                                else None
-                            )
-                            all_new_items.append(item)
-                            # log_accepted is already called in zero_shot_it_relevance_filter
-                        else:
-                            all_filtered_items.append(item)
-                            # log_refused is already called in zero_shot_it_relevance_filter
-                else:
-                    log_info(
-                        f"No items fetched during initial fetch from {source_name}.",
-                        source="IngestionManager",
-                    )
-            except Exception as e:
-                log_error(
-                    f"Error during initial fetch from source {source_name}: {e}",
+                newest_timestamp = sorted_items[0].published_at
+                self.last_fetched_timestamps[source_name] = newest_timestamp
+                log_info(
+                    f"Initially fetched {len(fetched_items)} items from {source_name}. Newest timestamp: {newest_timestamp}",
+                    source="IngestionManager",
+                )
+                pending_items[source.classifier_backend].extend(fetched_items)
+            else:
+                log_info(
+                    f"No items fetched during initial fetch from {source_name}.",
                     source="IngestionManager",
-                    exc_info=True,
                 )
 
+        # Classify everything fetched this cycle in one batched pass per backend
+        all_new_items, all_filtered_items = self._classify_pending(pending_items)
+
         log_info(
             f"Manager initial ingestion fetch completed. Total items: {len(all_new_items)} accepted, {len(all_filtered_items)} filtered.",
             source="IngestionManager",
@@ -141,90 +428,139 @@ class IngestionManager:
             return all_new_items, all_filtered_items
         return all_new_items
 
-    def continuous_fetch_sources(
-        self, store_filtered: bool = False
-    ) -> List[NewsItem] | Tuple[List[NewsItem], List[NewsItem]]:
+    def fetch_sources(
+        self, sources: Optional[List[BaseSource]] = None
+    ) -> List[
+        Tuple[BaseSource, Optional[List[NewsItem]], Optional[BaseException], int]
+    ]:
         """
-        Performs continuous fetch for all sources, getting items newer than the last fetched timestamp.
-        Updates last_fetched_timestamps for each source.
+        Continuous-fetch stage only: fetch the sources (all by default)
+        concurrently, without filtering or classifying. Sources whose circuit
+        breaker refuses the fetch are left out.
+        Returns (source, items, error, HTTP requests made) per fetched source.
         """
-        log_info(
-            "Manager performing continuous ingestion fetch.", source="IngestionManager"
-        )
-        all_new_items: List[NewsItem] = []
-        all_filtered_items: List[NewsItem] = []
+        sources = self.sources if sources is None else sources
+        allowed = []
+        for source in sources:
+            breaker = self._breaker(source)
+            if breaker is None or breaker.allow():
+                allowed.append(source)
+            else:
+                log_info(
+                    f"Skipping {self._source_name(source)}: circuit open",
+                    source="IngestionManager",
+                )
+        if not allowed:
+            return []
+
+        def fetch(source):
+            since_timestamp = self.last_fetched_timestamps.get(
+                self._source_name(source)
+            )
+            log_info(
+                f"Performing continuous fetch from source: {self._source_name(source)} (since: {since_timestamp or 'beginning'})",
+                source="IngestionManager",
+            )
+            return source.fetch_news(since_timestamp=since_timestamp)
+
+        http = get_http_client()
+        requests_before = {
+            name: stats["requests"] for name, stats in http.stats().items()
+        }
+        results = self._fetch_concurrently(fetch, allowed)
+        requests_after = http.stats()
+        return [
+            (
+                source,
+                fetched_items,
+                error,
+                requests_after.get(self._source_name(source), {}).get("requests", 0)
+                - requests_before.get(self._source_name(source), 0),
+            )
+            for source, fetched_items, error in results
+        ]
+
+    def accept_fetch_result(
+        self,
+        source: BaseSource,
+        fetched_items: Optional[List[NewsItem]],
+        error: Optional[BaseException],
+        requests: int = 1,
+    ) -> List[NewsItem]:
+        """
+        Keep the items newer than the source's last fetched timestamp, advance
+        that timestamp and report the poll to the scheduler.
+        Returns the new items (not classified yet).
+        """
+        source_name = self._source_name(source)
+        since_timestamp = self.last_fetched_timestamps.get(source_name)
+        truly_new_items = [
+            item
+            for item in fetched_items or []
+            if since_timestamp is None or item.published_at > since_timestamp
+        ]
+        if self.scheduler is not None:
+            self.scheduler.record(
+                source_name,
+                len(truly_new_items),
+                failed=error is not None,
+                response=get_http_client().last_response(source_name),
+                requests=requests,
+            )
+        if error is not None:
+            log_error(
+                f"Error during continuous fetch from source {source_name}: {error}",
+                source="IngestionManager",
+                exc_info=error,
+            )
+            return []
+        if fetched_items:
+            if truly_new_items:
+                sorted_new_items = sorted(
+                    truly_new_items, key=lambda x: x.published_at, reverse=True
+                )
+                newest_timestamp = sorted_new_items[0].published_at
+                self.last_fetched_timestamps[source_name] = newest_timestamp
 
-        for source in self.sources:
-            source_name = getattr(source, "source_name", str(source))
-            since_timestamp = self.last_fetched_timestamps.get(source_name)
-            try:
                 log_info(
-                    f"Performing continuous fetch from source: {source_name} (since: {since_timestamp or 'beginning'})",
+                    f"Continuously fetched {len(truly_new_items)} new items from {source_name}. Newest timestamp: {newest_timestamp}",
                     source="IngestionManager",
                 )
-                fetched_items = source.fetch_news(since_timestamp=since_timestamp)
-
-                if fetched_items:
-                    truly_new_items = [
-                        item
-                        for item in fetched_items
-                        if since_timestamp is None
-                        or item.published_at > since_timestamp
-                    ]
-
-                    if truly_new_items:
-                        sorted_new_items = sorted(
-                            truly_new_items, key=lambda x: x.published_at, reverse=True
-                        )
-                        newest_timestamp = sorted_new_items[0].published_at
-                        self.last_fetched_timestamps[source_name] = newest_timestamp
-                        now = datetime.now(timezone.utc)
-
-                        for item in truly_new_items:
-                            binary_label, max_score, top_label, log_info_filter = (
-                                zero_shot_it_relevance_filter(item, min_score=MIN_SCORE)
-                            )
-
-                            # Store score and label on the item for log_refused to use
-                            item.relevance_score = max_score
-                            item.top_relevant_label = top_label
-
-                            if binary_label:
-                                item.recency_weight = compute_recency_weight(
-                                    item.published_at, now
-                                )
-                                item.final_score = (
-                                    item.relevance_score * item.recency_weight
-                                    if item.relevance_score is not None
-                                    and item.recency_weight is not None
-                                    else None
-                                )
-                                all_new_items.append(item)
-                                # log_accepted is already called in zero_shot_it_relevance_filter
-                            else:
-                                all_filtered_items.append(item)
-                                # log_refused is already called in zero_shot_it_relevance_filter
-
-                        log_info(
-                            f"Continuously fetched {len(truly_new_items)} new items from {source_name}. Newest timestamp: {newest_timestamp}",
-                            source="IngestionManager",
-                        )
-                    else:
-                        log_info(
-                            f"No new items found from {source_name} during continuous fetch.",
-                            source="IngestionManager",
-                        )
-                else:
-                    log_info(
-                        f"No items returned from {source_name} during continuous fetch.",
-                        source="IngestionManager",
-                    )
-            except Exception as e:
-                log_error(
-                    f"Error during continuous fetch from source {source_name}: {e}",
+            else:
+                log_info(
+                    f"No new items found from {source_name} during continuous fetch.",
                     source="IngestionManager",
-                    exc_info=True,
                 )
+        else:
+            log_info(
+                f"No items returned from {source_name} during continuous fetch.",
+                source="IngestionManager",
+            )
+        return truly_new_items
+
+    def continuous_fetch_sources(
+        self,
+        store_filtered: bool = False,
+        sources: Optional[List[BaseSource]] = None,
+    ) -> List[NewsItem] | Tuple[List[NewsItem], List[NewsItem]]:
+        """
+        Performs continuous fetch for all sources (or the given ones), getting items newer than the last fetched timestamp.
+        Updates last_fetched_timestamps for each source, and the polling scheduler.
+        All new items are classified together in one batched filter call.
+        """
+        log_info(
+            "Manager performing continuous ingestion fetch.", source="IngestionManager"
+        )
+        # Items fetched this cycle, grouped by the classifier backend of their source
+        pending_items: Dict[Optional[str], List[NewsItem]] = defaultdict(list)
+
+        for source, fetched_items, error, requests in self.fetch_sources(sources):
+            pending_items[source.classifier_backend].extend(
+                self.accept_fetch_result(source, fetched_items, error, requests)
+            )
+
+        # Classify everything fetched this cycle in one batched pass per backend
+        all_new_items, all_filtered_items = self._classify_pending(pending_items)
 
         log_info(
             f"Manager continuous ingestion fetch completed. Total new items: {len(all_new_items)} accepted, {len(all_filtered_items)} filtered.",
@@ -0,0 +1,255 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from newsfeed.config import (
+    CLASSIFIER_BATCH_SIZE,
+    PIPELINE_QUEUE_SIZE,
+    SOURCE_FETCH_CONCURRENCY,
+)
+from newsfeed.log_utils import log_error, log_info
+from newsfeed.models import NewsItem
+
+from .base_source import BaseSource
+
+STAGES = ("fetch", "normalize", "classify", "merge")
+# Latency samples kept per stage
+LATENCY_WINDOW = 512
+# Shortest sleep of the fetch stage between scheduler checks (seconds)
+MIN_POLL_SLEEP = 1.0
+
+
+class StageStats:
+    """Processed count and recent latencies of one pipeline stage"""
+
+    def __init__(self):
+        self.processed = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, seconds: float):
+        self.processed += 1
+        self.latencies.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        latencies = np.array(self.latencies) * 1000
+        return {
+            "processed": self.processed,
+            "latency_ms_mean": float(latencies.mean()) if latencies.size else 0.0,
+            "latency_ms_p95": (
+                float(np.percentile(latencies, 95)) if latencies.size else 0.0
+            ),
+        }
+
+
+class IngestionPipeline:
+    """
+    Continuous ingestion as four stages connected by bounded asyncio queues:
+
+        fetch -> normalize -> classify -> merge
+
+    - fetch: each due source is fetched in a worker thread (at most
+      fetch_concurrency at once); its raw result is queued as soon as it
+      arrives, so classification of one source overlaps the download of others.
+    - normalize: keeps items newer than the source's cursor (advancing it and
+      reporting to the scheduler), drops items already accepted or in flight,
+      and cuts per-backend batches of up to batch_size items.
+    - classify: runs the relevance filter on a batch in a worker thread.
+    - merge: hands (accepted, filtered) to `merge`.
+
+    Queues hold at most queue_size entries: when the classifier falls behind,
+    the normalize queue fills up and fetchers block on it while holding their
+    fetch slot, so polling slows down instead of piling up items.
+    """
+
+    def __init__(
+        self,
+        manager,
+        merge: Callable[[List[NewsItem], List[NewsItem]], Awaitable[None]],
+        seen_ids: Optional[Set[str]] = None,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        batch_size: int = CLASSIFIER_BATCH_SIZE,
+        fetch_concurrency: int = SOURCE_FETCH_CONCURRENCY,
+    ):
+        self.manager = manager
+        self.merge = merge
+        self.seen_ids = seen_ids if seen_ids is not None else set()
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.stats_by_stage = {stage: StageStats() for stage in STAGES}
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._fetches: Set[asyncio.Task] = set()
+        self._in_flight_sources: Set[str] = set()
+        self._in_flight_ids: Set[str] = set()
+        self._fetch_slots: Optional[asyncio.Semaphore] = None
+        self._stopping = False
+        # perf_counter() of the first fetch submitted since take_burst_start()
+        self._burst_started: Optional[float] = None
+
+    async def start(self):
+        """Create the queues and start the normalize/classify/merge workers"""
+        self._stopping = False
+        self.queues = {
+            stage: asyncio.Queue(maxsize=self.queue_size)
+            for stage in ("normalize", "classify", "merge")
+        }
+        self._fetch_slots = asyncio.Semaphore(self.fetch_concurrency)
+        self._tasks = [
+            asyncio.create_task(self._normalize_worker()),
+            asyncio.create_task(self._classify_worker()),
+            asyncio.create_task(self._merge_worker()),
+        ]
+
+    async def submit(self, sources: List[BaseSource]):
+        """Start fetching the given sources (skipping ones still in flight)"""
+        for source in sources:
+            name = getattr(source, "source_name", str(source))
+            if name in self._in_flight_sources:
+                continue
+            # Waits while all fetch slots are taken (including by fetchers
+            # blocked on a full normalize queue)
+            await self._fetch_slots.acquire()
+            if self._burst_started is None:
+                self._burst_started = time.perf_counter()
+            self._in_flight_sources.add(name)
+            task = asyncio.create_task(self._fetch(source, name))
+            self._fetches.add(task)
+            task.add_done_callback(self._fetches.discard)
+
+    def take_burst_start(self) -> Optional[float]:
+        """
+        perf_counter() of the first fetch submitted since the last call (None
+        if nothing was submitted since); the next submit starts a new burst
+        """
+        started, self._burst_started = self._burst_started, None
+        return started
+
+    async def join(self):
+        """Wait until everything submitted so far has been merged"""
+        while self._fetches:
+            await asyncio.gather(*list(self._fetches), return_exceptions=True)
+        for stage in ("normalize", "classify", "merge"):
+            await self.queues[stage].join()
+
+    async def run(self):
+        """Poll due sources forever (until stop) and feed them to the pipeline"""
+        await self.start()
+        try:
+            while not self._stopping:
+                due = self.manager.due_sources()
+                if due:
+                    await self.submit(due)
+                await asyncio.sleep(
+                    max(MIN_POLL_SLEEP, self.manager.seconds_until_next_poll())
+                )
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        self._stopping = True
+        for task in list(self._fetches) + self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._fetches, *self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _fetch(self, source: BaseSource, name: str):
+        loop = asyncio.get_running_loop()
+        try:
+            start = time.perf_counter()
+            results = await loop.run_in_executor(
+                None, self.manager.fetch_sources, [source]
+            )
+            self.stats_by_stage["fetch"].record(time.perf_counter() - start)
+            # Empty when the source's circuit breaker refused the fetch
+            for result in results:
+                # Blocks while the normalize queue is full (backpressure)
+                await self.queues["normalize"].put(result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log_error(f"Fetch stage failed for {name}: {e}", source="Pipeline")
+        finally:
+            self._in_flight_sources.discard(name)
+            self._fetch_slots.release()
+
+    async def _normalize_worker(self):
+        queue = self.queues["normalize"]
+        while True:
+            source, items, error, requests = await queue.get()
+            try:
+                start = time.perf_counter()
+                new_items = self.manager.accept_fetch_result(
+                    source, items, error, requests
+                )
+                fresh = []
+                for item in new_items:
+                    if item.id in self.seen_ids or item.id in self._in_flight_ids:
+                        continue
+                    self._in_flight_ids.add(item.id)
+                    fresh.append(item)
+                self.stats_by_stage["normalize"].record(time.perf_counter() - start)
+                for offset in range(0, len(fresh), self.batch_size):
+                    await self.queues["classify"].put(
+                        (
+                            source.classifier_backend,
+                            fresh[offset : offset + self.batch_size],
+                        )
+                    )
+            except Exception as e:
+                log_error(f"Normalize stage failed: {e}", source="Pipeline")
+            finally:
+                queue.task_done()
+
+    async def _classify_worker(self):
+        queue = self.queues["classify"]
+        loop = asyncio.get_running_loop()
+        while True:
+            backend, batch = await queue.get()
+            try:
+                start = time.perf_counter()
+                accepted, filtered = await loop.run_in_executor(
+                    None, self.manager.classify_items, batch, backend
+                )
+                self.stats_by_stage["classify"].record(time.perf_counter() - start)
+                await self.queues["merge"].put((batch, accepted, filtered))
+            except Exception as e:
+                log_error(f"Classify stage failed: {e}", source="Pipeline")
+                self._in_flight_ids.difference_update(item.id for item in batch)
+            finally:
+                queue.task_done()
+
+    async def _merge_worker(self):
+        queue = self.queues["merge"]
+        while True:
+            batch, accepted, filtered = await queue.get()
+            try:
+                start = time.perf_counter()
+                await self.merge(accepted, filtered)
+                self.stats_by_stage["merge"].record(time.perf_counter() - start)
+                if accepted or filtered:
+                    log_info(
+                        f"Merged {len(accepted)} accepted, {len(filtered)} filtered items",
+                        source="Pipeline",
+                    )
+            except Exception as e:
+                log_error(f"Merge stage failed: {e}", source="Pipeline")
+            finally:
+                self._in_flight_ids.difference_update(item.id for item in batch)
+                queue.task_done()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per stage: queue depth in front of it, items processed, latency"""
+        report = {}
+        for stage in STAGES:
+            summary = self.stats_by_stage[stage].summary()
+            if stage == "fetch":
+                summary["in_flight"] = len(self._fetches)
+            else:
+                queue = self.queues.get(stage)
+                summary["queue_depth"] = queue.qsize() if queue else 0
+            report[stage] = summary
+        return report
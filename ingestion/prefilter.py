@@ -0,0 +1,153 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from newsfeed.config import PREFILTER_FAST_TRACK_TERMS, PREFILTER_IGNORED_LABEL_TERMS
+
+FAST_TRACK = "fast_track"
+REJECT = "reject"
+
+# PREFILTER_MODE values
+PREFILTER_OFF = "off"
+PREFILTER_REPORT = "report"
+PREFILTER_ENFORCE = "enforce"
+
+# Running counters of prefilter outcomes (deferred = no lexicon decision);
+# disagreed = lexicon decisions the model decided the other way. Only enforced
+# decisions act: skipped = rejects that never reached the model, fast_tracked =
+# items accepted on the lexicon (they are still scored by the model)
+PREFILTER_STATS = {
+    FAST_TRACK: 0,
+    REJECT: 0,
+    "deferred": 0,
+    "disagreed": 0,
+    "skipped": 0,
+    "fast_tracked": 0,
+}
+
+
+def _term_pattern(term: str) -> str:
+    """Regex for one lexicon term: case-insensitive words, optional plural"""
+    words = [re.escape(word) for word in re.split(r"[\s-]+", term.strip()) if word]
+    body = r"[\s-]+".join(words)
+    # Terms ending in punctuation (e.g. "CVE-") are prefixes, not whole words
+    if not term[-1].isalnum():
+        return r"\b" + re.escape(term)
+    return r"\b" + body + r"(?:s|es)?\b"
+
+
+def build_positive_terms(relevant_labels: Iterable[str]) -> Dict[str, str]:
+    """
+    Map lexicon term -> relevant label. Terms come from RELEVANT_LABELS
+    (split on "/", e.g. "System/Servers Down" -> "system", "servers down") plus
+    the configured fast-track terms; generic fragments such as "issue" are
+    skipped so they never bypass the model.
+    """
+    ignored = {term.lower() for term in PREFILTER_IGNORED_LABEL_TERMS}
+    terms: Dict[str, str] = {}
+    for label in relevant_labels:
+        for part in label.split("/"):
+            part = part.strip()
+            if part and part.lower() not in ignored:
+                terms[part] = label
+    terms.update(PREFILTER_FAST_TRACK_TERMS)
+    return terms
+
+
+class RulePrefilter:
+    """
+    Cheap lexical stage in front of the zero-shot classifier. All positive and
+    negative terms are compiled into one alternation with a named group per
+    term, so a single regex scan reports every lexicon hit in a text.
+
+    - only negative hits  -> REJECT (obvious noise: hiring posts, memes, launches)
+    - only positive hits  -> FAST_TRACK (strong signals such as "outage", "CVE-")
+    - both or neither     -> None, the item goes to the model
+    """
+
+    def __init__(
+        self,
+        positive_terms: Dict[str, str],
+        negative_terms: Iterable[str],
+    ):
+        self.positive_terms = dict(positive_terms)
+        self.negative_terms = list(negative_terms)
+        self._group_terms: Dict[str, Tuple[bool, str]] = {}
+        alternatives = []
+        for index, term in enumerate(self.positive_terms):
+            group = f"p{index}"
+            self._group_terms[group] = (True, term)
+            alternatives.append(f"(?P<{group}>{_term_pattern(term)})")
+        for index, term in enumerate(self.negative_terms):
+            group = f"n{index}"
+            self._group_terms[group] = (False, term)
+            alternatives.append(f"(?P<{group}>{_term_pattern(term)})")
+        self._pattern = (
+            re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        )
+
+    def matches(self, text: str) -> Tuple[List[str], List[str]]:
+        """Return (positive_terms, negative_terms) found in text"""
+        positives: List[str] = []
+        negatives: List[str] = []
+        if not text or self._pattern is None:
+            return positives, negatives
+        for match in self._pattern.finditer(text):
+            is_positive, term = self._group_terms[match.lastgroup]
+            bucket = positives if is_positive else negatives
+            if term not in bucket:
+                bucket.append(term)
+        return positives, negatives
+
+    def decide(self, text: str) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """
+        Returns (decision, relevant_label, matched_terms) where decision is
+        FAST_TRACK, REJECT or None (defer to the model).
+        """
+        positives, negatives = self.matches(text)
+        if positives and not negatives:
+            PREFILTER_STATS[FAST_TRACK] += 1
+            return FAST_TRACK, self.positive_terms[positives[0]], positives
+        if negatives and not positives:
+            PREFILTER_STATS[REJECT] += 1
+            return REJECT, None, negatives
+        PREFILTER_STATS["deferred"] += 1
+        return None, None, positives + negatives
+
+
+def summarize_prefilter(
+    decisions: List[Optional[str]],
+    y_true: List[bool],
+    mode: str = PREFILTER_ENFORCE,
+) -> dict:
+    """
+    Offline report of the prefilter on a labelled set: share of traffic that
+    would skip the model in `mode` (only enforced rejects do; fast-tracked
+    items are still scored) and how accurate the lexicon decisions were.
+    Precision of the fast track = fast-tracked items that are truly relevant;
+    precision of rejects = rejected items that are truly not relevant.
+    """
+    total = len(decisions)
+    fast_tracked = [t for d, t in zip(decisions, y_true) if d == FAST_TRACK]
+    rejected = [t for d, t in zip(decisions, y_true) if d == REJECT]
+    relevant_total = sum(1 for t in y_true if t)
+    skipped = len(rejected) if mode == PREFILTER_ENFORCE else 0
+    return {
+        "items": total,
+        "skipped": skipped,
+        "skip_rate": skipped / total if total else 0.0,
+        "fast_tracked": len(fast_tracked),
+        "rejected": len(rejected),
+        "fast_track_precision": (
+            sum(fast_tracked) / len(fast_tracked) if fast_tracked else 1.0
+        ),
+        "reject_precision": (
+            sum(1 for t in rejected if not t) / len(rejected) if rejected else 1.0
+        ),
+        # Relevant items lost by the prefilter alone (recall ceiling of the cascade)
+        "relevant_rejected": sum(1 for t in rejected if t),
+        "recall_ceiling": (
+            1 - sum(1 for t in rejected if t) / relevant_total
+            if relevant_total
+            else 1.0
+        ),
+    }
@@ -0,0 +1,184 @@
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+from newsfeed.config import ONNX_EXPORT_DIR
+from newsfeed.log_utils import log_error, log_info
+
+# ONNX Runtime export/quantization is optional (pip install optimum[onnxruntime])
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForSequenceClassification = None
+    ORTQuantizer = None
+    AutoQuantizationConfig = None
+
+# fp32 PyTorch, PyTorch dynamic int8 (Linear layers), ONNX Runtime dynamic int8
+ZERO_SHOT_BACKENDS = ("torch", "torch_int8", "onnx_int8")
+ONNX_QUANTIZED_FILE = "model_quantized.onnx"
+
+
+def onnx_available() -> bool:
+    return ORTModelForSequenceClassification is not None
+
+
+def _load_torch_int8(model_name: str, hypothesis_template: str):
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+    model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    # Dynamic int8 kernels are CPU-only
+    return pipeline(
+        "zero-shot-classification",
+        model=model,
+        tokenizer=tokenizer,
+        hypothesis_template=hypothesis_template,
+        device=-1,
+    )
+
+
+def _load_onnx_int8(model_name: str, hypothesis_template: str):
+    """
+    Export the model to ONNX and quantize it to int8 once, then reuse the
+    quantized graph from ONNX_EXPORT_DIR on later starts.
+    """
+    export_dir = os.path.join(ONNX_EXPORT_DIR, model_name.replace("/", "__"))
+    quantized_dir = export_dir + "-int8"
+    if not os.path.exists(os.path.join(quantized_dir, ONNX_QUANTIZED_FILE)):
+        log_info(
+            f"Exporting {model_name} to ONNX and quantizing to int8 (one-off)...",
+            source="Quantization",
+        )
+        ORTModelForSequenceClassification.from_pretrained(
+            model_name, export=True
+        ).save_pretrained(export_dir)
+        quantizer = ORTQuantizer.from_pretrained(export_dir)
+        quantizer.quantize(
+            save_dir=quantized_dir,
+            quantization_config=AutoQuantizationConfig.avx2(
+                is_static=False, per_channel=False
+            ),
+        )
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(quantized_dir)
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        quantized_dir, file_name=ONNX_QUANTIZED_FILE
+    )
+    tokenizer = AutoTokenizer.from_pretrained(quantized_dir)
+    return pipeline(
+        "zero-shot-classification",
+        model=model,
+        tokenizer=tokenizer,
+        hypothesis_template=hypothesis_template,
+    )
+
+
+def available_runtime(backend: str) -> str:
+    """
+    Runtime that load_zero_shot_pipeline will actually use for `backend`
+    (onnx_int8 becomes torch_int8 without optimum[onnxruntime]).
+    """
+    if backend not in ZERO_SHOT_BACKENDS:
+        raise ValueError(
+            f"Unknown zero-shot backend: {backend} (expected one of {ZERO_SHOT_BACKENDS})"
+        )
+    if backend == "onnx_int8" and not onnx_available():
+        return "torch_int8"
+    return backend
+
+
+def load_zero_shot_pipeline(
+    model_name: str, hypothesis_template: str, backend: str = "torch"
+) -> Tuple[Any, str]:
+    """
+    Build a zero-shot-classification pipeline for the requested backend and
+    return it with the runtime that was actually loaded: onnx_int8 falls back
+    to torch_int8 when optimum[onnxruntime] is missing or the ONNX export
+    fails. All backends return the regular transformers pipeline, so callers
+    get the same {"labels": [...], "scores": [...]} output whatever runs
+    underneath.
+    """
+    runtime = available_runtime(backend)
+    if runtime != backend:
+        log_error(
+            f"optimum[onnxruntime] is not installed; falling back to {runtime}.",
+            source="Quantization",
+        )
+
+    if runtime == "onnx_int8":
+        try:
+            return _load_onnx_int8(model_name, hypothesis_template), runtime
+        except Exception as e:
+            log_error(
+                f"ONNX int8 load of {model_name} failed ({e}); falling back to torch_int8.",
+                source="Quantization",
+            )
+            runtime = "torch_int8"
+    if runtime == "torch_int8":
+        return _load_torch_int8(model_name, hypothesis_template), runtime
+
+    zero_shot = pipeline(
+        "zero-shot-classification",
+        model=model_name,
+        hypothesis_template=hypothesis_template,
+        device=0 if torch.cuda.is_available() else -1,
+    )
+    return zero_shot, runtime
+
+
+def compare_backends(
+    reference,
+    candidate,
+    texts: List[str],
+    labels: List[str],
+    min_score: float,
+    decision_labels: Optional[List[str]] = None,
+) -> Dict[str, float]:
+    """
+    Accuracy-drift and latency check of a candidate classifier backend against
+    the reference one (anything with .score(texts, labels) -> score matrix):
+    per-label score drift, agreement of the accept/reject decision at
+    min_score (max over decision_labels, as in the relevance filter) and mean
+    latency per text.
+    """
+    decision_index = [
+        i for i, label in enumerate(labels) if label in (decision_labels or labels)
+    ]
+
+    def run(classifier):
+        start = time.perf_counter()
+        scores = [classifier.score([text], labels)[0] for text in texts]
+        elapsed = time.perf_counter() - start
+        return scores, elapsed / len(texts) if texts else 0.0
+
+    reference_scores, reference_latency = run(reference)
+    candidate_scores, candidate_latency = run(candidate)
+
+    drifts = [
+        abs(r - c)
+        for ref_row, cand_row in zip(reference_scores, candidate_scores)
+        for r, c in zip(ref_row, cand_row)
+    ]
+    agreements = [
+        (max(ref_row[i] for i in decision_index) >= min_score)
+        == (max(cand_row[i] for i in decision_index) >= min_score)
+        for ref_row, cand_row in zip(reference_scores, candidate_scores)
+    ]
+    return {
+        "max_abs_drift": max(drifts, default=0.0),
+        "mean_abs_drift": sum(drifts) / len(drifts) if drifts else 0.0,
+        "decision_agreement": (
+            sum(agreements) / len(agreements) if agreements else 1.0
+        ),
+        "reference_latency": reference_latency,
+        "candidate_latency": candidate_latency,
+        "speedup": (
+            reference_latency / candidate_latency if candidate_latency > 0 else 0.0
+        ),
+    }
@@ -1,59 +1,285 @@
 import logging
+from collections import deque
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
 import requests
 
+from newsfeed.config import (
+    REDDIT_CURSOR_CHECK_EVERY,
+    REDDIT_GROUP_SIZE,
+    REDDIT_MAX_PAGES,
+    REDDIT_PAGE_SIZE,
+)
 from newsfeed.models import NewsItem
 
-from .base_source import BaseSource
+from .base_source import BaseSource, commit_fetch
+from .http_client import get_http_client, loads
 
 logger = logging.getLogger(__name__)
 
+# Cursors kept per source (to rewind when a fetch was not ingested)
+CURSOR_HISTORY = 16
+
 
 class RedditSource(BaseSource):
+    """
+    Posts of one subreddit, or of a group of subreddits read as one combined
+    listing (`r/a+b+c/new.json`), from the /new listing.
+
+    Continuous fetches are incremental: the source keeps a cursor (fullname and
+    time of the newest post it returned) and asks for `before=<cursor>`, so
+    only posts newer than the cursor are downloaded and parsed. When a full page
+    comes back, more new posts may exist and the next page (newer still) is
+    requested, up to REDDIT_MAX_PAGES. Without a usable cursor the listing is
+    walked newest-first with `after` until since_timestamp is crossed.
+
+    For a group, items keep the per-subreddit source name (`reddit/<name>`) and
+    the newest post of every subreddit is tracked in `subreddit_cursors`.
+    """
+
+    base_url = "https://www.reddit.com"
+
     def __init__(self, subreddit: str, source_name: str = None):
         self.subreddit = subreddit
+        self.subreddits = subreddit.split("+")
         self.source_name = source_name or f"reddit/{subreddit}"
+        self.http = get_http_client()
+        # (fullname, created) of the newest post of recent fetches, oldest first
+        self.cursors: Deque[Tuple[str, datetime]] = deque(maxlen=CURSOR_HISTORY)
+        # Newest (fullname, created) seen per subreddit
+        self.subreddit_cursors: Dict[str, Tuple[str, datetime]] = {}
+        self._names = {name.lower(): name for name in self.subreddits}
+        self._empty_polls = 0
         logger.info(f"RedditSource initialized for subreddit: {self.subreddit}")
 
+    @classmethod
+    def group(
+        cls, subreddits: Sequence[str], group_size: int = REDDIT_GROUP_SIZE
+    ) -> List["RedditSource"]:
+        """Sources reading the subreddits in combined listings of group_size"""
+        group_size = max(1, group_size)
+        return [
+            cls("+".join(subreddits[start : start + group_size]))
+            for start in range(0, len(subreddits), group_size)
+        ]
+
+    def _item_source(self, post_data: dict) -> str:
+        if len(self.subreddits) == 1:
+            return self.source_name
+        name = str(post_data.get("subreddit", ""))
+        return f"reddit/{self._names.get(name.lower(), name)}"
+
+    def _listing(self, subreddit: Optional[str] = None, **params) -> Optional[dict]:
+        """
+        One page of the /new listing of the source (or of one of its
+        subreddits); None if unchanged since the last request
+        """
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        url = f"{self.base_url}/r/{subreddit or self.subreddit}/new.json?{query}"
+        response = self.http.get(
+            url, source_name=self.source_name, timeout=self.request_timeout
+        )
+        if response is None:
+            return None
+        return loads(response.content).get("data", {})
+
+    def _cursor_for(self, since_timestamp: datetime) -> Optional[str]:
+        """
+        Newest cursor not newer than since_timestamp. A newer cursor means the
+        posts after since_timestamp were fetched but not ingested (e.g. the
+        fetch was abandoned), so they must be fetched again.
+        """
+        for fullname, created in reversed(self.cursors):
+            if created <= since_timestamp:
+                return fullname
+        return None
+
+    def _page_forward(self, cursor: str) -> List[dict]:
+        """Posts newer than the cursor post, newest first"""
+        pages: List[List[dict]] = []
+        for _ in range(REDDIT_MAX_PAGES):
+            data = self._listing(before=cursor, limit=REDDIT_PAGE_SIZE)
+            posts = [child["data"] for child in (data or {}).get("children", [])]
+            if not posts:
+                break
+            pages.append(posts)
+            if len(posts) < REDDIT_PAGE_SIZE:
+                break
+            # Full page: a burst; continue with the posts newer than this page
+            cursor = posts[0]["name"]
+        return [post for page in reversed(pages) for post in page]
+
+    def _walk_back(
+        self, since_timestamp: Optional[datetime], posts_limit: Optional[int]
+    ) -> List[dict]:
+        """Posts newest first, following `after` until since_timestamp or posts_limit"""
+        posts: List[dict] = []
+        after = None
+        page_size = min(posts_limit or REDDIT_PAGE_SIZE, REDDIT_PAGE_SIZE)
+        for _ in range(REDDIT_MAX_PAGES):
+            params = {"limit": page_size}
+            if after:
+                params["after"] = after
+            data = self._listing(**params)
+            if not data:
+                break
+            page = [child["data"] for child in data.get("children", [])]
+            posts.extend(page)
+            after = data.get("after")
+            crossed = since_timestamp is not None and any(
+                _created(post) <= since_timestamp for post in page
+            )
+            enough = since_timestamp is None and len(posts) >= (posts_limit or 0)
+            if crossed or enough or not after:
+                break
+        return posts[:posts_limit] if since_timestamp is None else posts
+
+    def _initial_group_posts(self, posts_limit: int) -> List[dict]:
+        """
+        Up to posts_limit newest posts of every subreddit of a group. The
+        combined listing is paged until each subreddit has posts_limit posts
+        or the listing ends; subreddits still short after REDDIT_MAX_PAGES
+        pages (quiet ones grouped with busy ones) are read on their own.
+        """
+        counts = {f"reddit/{name}": 0 for name in self.subreddits}
+        kept: List[dict] = []
+
+        def keep(page: List[dict]):
+            for post in page:
+                source = self._item_source(post)
+                if counts.get(source, 0) < posts_limit:
+                    counts[source] = counts.get(source, 0) + 1
+                    kept.append(post)
+
+        after = None
+        exhausted = False
+        page_size = min(posts_limit * len(self.subreddits), REDDIT_PAGE_SIZE)
+        for _ in range(REDDIT_MAX_PAGES):
+            params = {"limit": page_size}
+            if after:
+                params["after"] = after
+            data = self._listing(**params)
+            if not data:
+                break
+            keep([child["data"] for child in data.get("children", [])])
+            after = data.get("after")
+            if not after:
+                exhausted = True
+                break
+            if all(count >= posts_limit for count in counts.values()):
+                break
+            page_size = REDDIT_PAGE_SIZE
+
+        if not exhausted:
+            for name in self.subreddits:
+                if counts[f"reddit/{name}"] >= posts_limit:
+                    continue
+                logger.info(
+                    f"Fetching initial posts of r/{name} on its own (too few in the combined listing)"
+                )
+                data = self._listing(subreddit=name, limit=posts_limit)
+                seen = {post["id"] for post in kept}
+                keep(
+                    [
+                        child["data"]
+                        for child in (data or {}).get("children", [])
+                        if child["data"]["id"] not in seen
+                    ]
+                )
+        return sorted(kept, key=_created, reverse=True)
+
+    def _has_newer_post(self, since_timestamp: datetime) -> bool:
+        """Cheap check (one post) used to detect a cursor that no longer works"""
+        data = self._listing(limit=1)
+        children = (data or {}).get("children", [])
+        return bool(children) and _created(children[0]["data"]) > since_timestamp
+
+    def _recover(self, stale: str, since_timestamp: datetime) -> List[dict]:
+        """
+        Posts newer than since_timestamp after the cursor post disappeared:
+        page forward from the newest other subreddit cursor, else walk back.
+        """
+        fallbacks = sorted(
+            (
+                cursor
+                for cursor in self.subreddit_cursors.values()
+                if cursor[0] != stale and cursor[1] <= since_timestamp
+            ),
+            key=lambda cursor: cursor[1],
+            reverse=True,
+        )
+        if fallbacks:
+            posts = self._page_forward(fallbacks[0][0])
+            if any(_created(post) > since_timestamp for post in posts):
+                return posts
+        return self._walk_back(since_timestamp, None)
+
+    def _advance_cursors(
+        self,
+        newest: Optional[Tuple[str, datetime]],
+        newest_per_subreddit: Dict[str, Tuple[str, datetime]],
+        stale: bool,
+    ):
+        """Record the newest posts a fetch returned (once its items are kept)"""
+        if stale:
+            self.cursors.clear()
+        for source, cursor in newest_per_subreddit.items():
+            current = self.subreddit_cursors.get(source)
+            if current is None or cursor[1] > current[1]:
+                self.subreddit_cursors[source] = cursor
+        if newest is not None:
+            self.cursors.append(newest)
+
     def fetch_news(
         self,
         posts_limit: Optional[int] = None,
         since_timestamp: Optional[datetime] = None,
     ) -> List[NewsItem]:
         items = []
+        stale = False
         try:
             if since_timestamp:
-                # For continuous fetch: Reddit API doesn't directly support 'since' timestamp
-                # for /new.json, so we fetch a recent batch (up to 50 posts) and filter client-side.
-                url = f"https://www.reddit.com/r/{self.subreddit}/new.json?limit=50"  # Fetch a reasonable batch
-                logger.info(
-                    f"Fetching new posts from Reddit since {since_timestamp.isoformat()}: {url}"
-                )
-            elif posts_limit is not None:
-                # For initial fetch: get a specific limit
-                url = f"https://www.reddit.com/r/{self.subreddit}/new.json?limit={posts_limit}"
-                logger.info(f"Fetching initial {posts_limit} posts from Reddit: {url}")
+                cursor = self._cursor_for(since_timestamp)
+                if cursor:
+                    logger.info(
+                        f"Fetching Reddit posts of r/{self.subreddit} newer than {cursor}"
+                    )
+                    posts = self._page_forward(cursor)
+                    if posts:
+                        self._empty_polls = 0
+                    else:
+                        # A deleted cursor post makes `before` return nothing
+                        # forever: check the newest post now and then
+                        self._empty_polls += 1
+                        if self._empty_polls % REDDIT_CURSOR_CHECK_EVERY == 0:
+                            if self._has_newer_post(since_timestamp):
+                                logger.warning(
+                                    f"Cursor {cursor} of {self.source_name} is stale"
+                                )
+                                stale = True
+                                posts = self._recover(cursor, since_timestamp)
+                else:
+                    logger.info(
+                        f"Fetching new posts from Reddit since {since_timestamp.isoformat()} (no cursor)"
+                    )
+                    posts = self._walk_back(since_timestamp, None)
             else:
-                # Fallback (shouldn't happen if manager calls correctly)
-                url = f"https://www.reddit.com/r/{self.subreddit}/new.json?limit=10"
-                logger.warning(
-                    f"Neither posts_limit nor since_timestamp provided for RedditSource. Defaulting to 10. URL: {url}"
+                # Initial fetch (fallback to 10 if the manager gives no limit)
+                posts_limit = posts_limit if posts_limit is not None else 10
+                logger.info(
+                    f"Fetching initial {posts_limit} posts from Reddit: r/{self.subreddit}"
                 )
+                if len(self.subreddits) > 1:
+                    # posts_limit per subreddit, as for separate sources
+                    posts = self._initial_group_posts(posts_limit)
+                else:
+                    posts = self._walk_back(None, posts_limit)
 
-            headers = {"User-Agent": "newsfeed-bot/0.1"}
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            fetched_count = 0
-            for post in data.get("data", {}).get("children", []):
-                post_data = post["data"]
-
-                post_utc_dt = datetime.fromtimestamp(
-                    post_data["created_utc"], tz=timezone.utc
-                )
+            newest = None
+            newest_per_subreddit: Dict[str, Tuple[str, datetime]] = {}
+            for post_data in posts:
+                post_utc_dt = _created(post_data)
 
                 # If continuous fetch, only include posts strictly newer than since_timestamp
                 if since_timestamp and post_utc_dt <= since_timestamp:
@@ -61,22 +287,36 @@ class RedditSource(BaseSource):
 
                 news_item = NewsItem(
                     id=post_data["id"],
-                    source=self.source_name,
+                    source=self._item_source(post_data),
                     title=post_data.get("title", ""),
                     body=post_data.get("selftext", ""),
                     published_at=post_utc_dt,
                 )
                 items.append(news_item)
-                fetched_count += 1
+                if "name" in post_data:
+                    cursor = (post_data["name"], post_utc_dt)
+                    if newest is None or post_utc_dt > newest[1]:
+                        newest = cursor
+                    current = newest_per_subreddit.get(news_item.source)
+                    if current is None or post_utc_dt > current[1]:
+                        newest_per_subreddit[news_item.source] = cursor
+
+            if not commit_fetch(
+                lambda: self._advance_cursors(newest, newest_per_subreddit, stale)
+            ):
+                logger.info(
+                    f"Fetch of {self.source_name} was abandoned; cursors left unchanged"
+                )
+                return []
 
             logger.info(
-                f"Successfully processed {fetched_count} items from {self.source_name} ({len(items)} passing filter)."
+                f"Successfully processed {len(posts)} posts from {self.source_name} ({len(items)} new)."
             )
             return items
 
         except requests.exceptions.RequestException as e:
             logger.error(
-                f"Error fetching from Reddit source {self.source_name} ({url}): {e}",
+                f"Error fetching from Reddit source {self.source_name}: {e}",
                 exc_info=True,
             )
             return []
@@ -85,4 +325,10 @@ class RedditSource(BaseSource):
                 f"An unexpected error occurred in Reddit source {self.source_name}: {e}",
                 exc_info=True,
             )
+            # The body was not turned into items: download it again next time
+            self.http.forget(self.source_name)
             return []
+
+
+def _created(post_data: dict) -> datetime:
+    return datetime.fromtimestamp(post_data["created_utc"], tz=timezone.utc)
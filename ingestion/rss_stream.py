@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, Optional
+from xml.etree.ElementTree import XMLPullParser
+
+
+def parse_rss_date(value: Optional[str]) -> Optional[datetime]:
+    """RFC 822 pubDate -> timezone-aware UTC datetime (None if unparsable)"""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_rss_entries(
+    chunks: Iterable[bytes],
+    since_timestamp: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, object]]:
+    """
+    Stream the <item>s of an RSS 2.0 feed from byte chunks, newest first.
+
+    Each <item> is turned into a dict (id, title, summary, published) when
+    its end tag is parsed and then cleared, so memory stays flat whatever the
+    feed size. Parsing stops at the first item published at or before
+    since_timestamp (feeds list items newest first), or after `limit` items;
+    the rest of the stream is not read. Items without a usable pubDate are
+    skipped. Raises xml.etree.ElementTree.ParseError on malformed XML, after
+    yielding the items parsed so far.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    channel = None
+    produced = 0
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            name = _local_name(element.tag)
+            if event == "start":
+                if name == "channel":
+                    channel = element
+                continue
+            if name != "item":
+                continue
+            fields = {_local_name(child.tag): child.text for child in element}
+            if channel is not None:
+                # Finished items are dropped from the tree
+                channel.remove(element)
+            element.clear()
+
+            published = parse_rss_date(fields.get("pubDate"))
+            if published is None:
+                continue
+            if since_timestamp is not None and published <= since_timestamp:
+                return
+            yield {
+                "id": fields.get("guid") or fields.get("link"),
+                "title": (fields.get("title") or "").strip(),
+                "summary": (fields.get("description") or "").strip(),
+                "published": published,
+            }
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+    parser.close()
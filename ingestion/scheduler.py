@@ -0,0 +1,194 @@
+import threading
+import time
+from typing import Callable, Collection, Dict, List, Optional, Sequence
+
+from newsfeed.config import (
+    INTERVAL,
+    POLL_BACKOFF_MAX,
+    POLL_EWMA_ALPHA,
+    POLL_MAX_INTERVAL,
+    POLL_MIN_INTERVAL,
+    POLL_REQUEST_BUDGET,
+    POLL_TARGET_ITEMS,
+    RATELIMIT_MIN_REMAINING,
+)
+
+# HTTP statuses that mean "slow down"
+BACKOFF_STATUSES = {429, 500, 502, 503, 504}
+
+
+class SourceSchedule:
+    """Polling state of one source"""
+
+    def __init__(self, interval: float, now: float):
+        self.interval = interval
+        self.next_poll = now + interval
+        self.last_poll = now
+        self.rate: Optional[float] = None  # new items per second (EWMA)
+        self.failures = 0
+        self.polls = 0
+
+
+class PollScheduler:
+    """
+    One next-poll deadline per source instead of a global INTERVAL.
+
+    - After each poll the source's post rate (new items / seconds since its
+      previous poll) is folded into an EWMA, and the next interval aims at
+      POLL_TARGET_ITEMS new items per poll, clamped to
+      [POLL_MIN_INTERVAL, POLL_MAX_INTERVAL]: busy feeds are polled more often,
+      quiet ones less. The interval at most doubles per poll, so one empty
+      poll of a busy feed does not push it to the maximum.
+    - 429/5xx responses and failed fetches back off exponentially (capped at
+      POLL_BACKOFF_MAX, at least Retry-After). When X-Ratelimit-Remaining drops
+      below RATELIMIT_MIN_REMAINING the source waits for X-Ratelimit-Reset.
+    - A token bucket of POLL_REQUEST_BUDGET requests per minute is shared by
+      all sources; due sources beyond it wait (most overdue first). Extra
+      requests made by a poll (paging) are charged after the fact.
+    """
+
+    def __init__(
+        self,
+        source_names: Sequence[str],
+        interval: float = INTERVAL,
+        min_interval: float = POLL_MIN_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+        target_items: float = POLL_TARGET_ITEMS,
+        request_budget: float = POLL_REQUEST_BUDGET,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_items = target_items
+        self.request_budget = request_budget
+        self.clock = clock
+        now = clock()
+        self.sources: Dict[str, SourceSchedule] = {
+            name: SourceSchedule(interval, now) for name in source_names
+        }
+        self._tokens = float(request_budget)
+        self._refilled_at = now
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._refilled_at
+        self._tokens = min(
+            float(self.request_budget),
+            self._tokens + elapsed * self.request_budget / 60.0,
+        )
+        self._refilled_at = now
+
+    def due(self, blocked: Collection[str] = ()) -> List[str]:
+        """
+        Sources whose deadline has passed and that fit in the request budget
+        (blocked ones, e.g. with an open circuit, are neither admitted nor charged)
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            overdue = sorted(
+                (s.next_poll, name)
+                for name, s in self.sources.items()
+                if s.next_poll <= now and name not in blocked
+            )
+            admitted = []
+            for _, name in overdue:
+                if self._tokens < 1:
+                    break
+                self._tokens -= 1
+                # Not due again while this poll is in progress; record() sets
+                # the real deadline
+                schedule = self.sources[name]
+                schedule.next_poll = now + schedule.interval
+                admitted.append(name)
+            return admitted
+
+    def seconds_until_next_poll(self, blocked: Collection[str] = ()) -> float:
+        """Time until the earliest deadline (or until the budget allows a request)"""
+        with self._lock:
+            deadlines = [
+                s.next_poll for name, s in self.sources.items() if name not in blocked
+            ]
+            if not deadlines:
+                return self.max_interval
+            now = self.clock()
+            self._refill(now)
+            wait = max(0.0, min(deadlines) - now)
+            if self._tokens < 1 and self.request_budget > 0:
+                wait = max(wait, (1 - self._tokens) * 60.0 / self.request_budget)
+            return wait
+
+    def record(
+        self,
+        source_name: str,
+        new_items: int,
+        failed: bool = False,
+        response: Optional[Dict[str, Optional[float]]] = None,
+        requests: int = 1,
+    ):
+        """Update a source's rate estimate and next deadline after a poll"""
+        with self._lock:
+            now = self.clock()
+            schedule = self.sources.setdefault(
+                source_name, SourceSchedule(self.max_interval, now)
+            )
+            # The poll itself was paid for when it was admitted
+            self._tokens -= max(0, requests - 1)
+            schedule.polls += 1
+            status = (response or {}).get("status")
+            failed = failed or status in BACKOFF_STATUSES
+            if response is not None and status is None:
+                failed = True  # no HTTP response at all
+
+            if failed:
+                schedule.failures += 1
+                delay = min(
+                    schedule.interval * 2**schedule.failures, float(POLL_BACKOFF_MAX)
+                )
+                retry_after = (response or {}).get("retry_after")
+                if retry_after:
+                    delay = max(delay, retry_after)
+            else:
+                schedule.failures = 0
+                if now > schedule.last_poll:
+                    observed = new_items / (now - schedule.last_poll)
+                    if schedule.rate is None:
+                        # Prior: the initial interval was about right
+                        schedule.rate = self.target_items / schedule.interval
+                    schedule.rate = (
+                        POLL_EWMA_ALPHA * observed
+                        + (1 - POLL_EWMA_ALPHA) * schedule.rate
+                    )
+                    target = (
+                        self.target_items / schedule.rate
+                        if schedule.rate > 0
+                        else self.max_interval
+                    )
+                    # Slow down gradually (at most x2 per poll), speed up at once
+                    schedule.interval = min(
+                        self.max_interval,
+                        2 * schedule.interval,
+                        max(self.min_interval, target),
+                    )
+                delay = schedule.interval
+                schedule.last_poll = now
+
+            remaining = (response or {}).get("ratelimit_remaining")
+            reset = (response or {}).get("ratelimit_reset")
+            if remaining is not None and reset and remaining < RATELIMIT_MIN_REMAINING:
+                delay = max(delay, reset)
+            schedule.next_poll = now + delay
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            now = self.clock()
+            return {
+                name: {
+                    "interval": s.interval,
+                    "next_poll_in": max(0.0, s.next_poll - now),
+                    "items_per_minute": (s.rate or 0.0) * 60,
+                    "failures": s.failures,
+                    "polls": s.polls,
+                }
+                for name, s in self.sources.items()
+            }
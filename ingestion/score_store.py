@@ -0,0 +1,200 @@
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Ground-truth column values
+UNKNOWN, NOT_RELEVANT, RELEVANT = -1, 0, 1
+
+
+class ScoreStore:
+    """
+    Compact store of zero-shot score vectors: one float32 row per classified
+    item (columns in `labels` order) plus an int8 ground-truth column
+    (-1 unknown, 0 not relevant, 1 relevant) and the name of the classifier
+    backend that produced the scores. Rows are keyed by item id, so
+    re-classifying an item overwrites its row. When `max_items` is reached the
+    oldest rows are dropped. Saved/loaded as a single .npz file.
+    """
+
+    def __init__(self, labels: Sequence[str], max_items: Optional[int] = None):
+        self.labels = list(labels)
+        self.max_items = max_items
+        self._scores = np.zeros((64, len(self.labels)), dtype=np.float32)
+        self._truth = np.full(64, UNKNOWN, dtype=np.int8)
+        self._ids: List[str] = []
+        self._backends: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _grow(self):
+        capacity = self._scores.shape[0] * 2
+        scores = np.zeros((capacity, len(self.labels)), dtype=np.float32)
+        scores[: len(self._ids)] = self._scores[: len(self._ids)]
+        truth = np.full(capacity, UNKNOWN, dtype=np.int8)
+        truth[: len(self._ids)] = self._truth[: len(self._ids)]
+        self._scores, self._truth = scores, truth
+
+    def _drop_oldest(self, count: int):
+        size = len(self._ids)
+        self._scores[: size - count] = self._scores[count:size]
+        self._truth[: size - count] = self._truth[count:size]
+        self._ids = self._ids[count:]
+        self._backends = self._backends[count:]
+        self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+
+    def add(
+        self,
+        item_id: str,
+        scores: Sequence[float],
+        relevant: Optional[bool] = None,
+        backend: str = "",
+    ):
+        """Store the score vector (in `labels` order) of one item and its backend"""
+        with self._lock:
+            row = self._rows.get(item_id)
+            if row is None:
+                if self.max_items and len(self._ids) >= self.max_items:
+                    # Drop a tenth at once so the shift is amortised
+                    self._drop_oldest(max(1, self.max_items // 10))
+                if len(self._ids) == self._scores.shape[0]:
+                    self._grow()
+                row = len(self._ids)
+                self._ids.append(item_id)
+                self._backends.append(backend)
+                self._rows[item_id] = row
+            self._backends[row] = backend
+            self._scores[row] = scores
+            if relevant is not None:
+                self._truth[row] = RELEVANT if relevant else NOT_RELEVANT
+
+    def set_ground_truth(self, labels: Dict[str, bool]):
+        """Attach relevant/not relevant labels to stored items (unknown ids are ignored)"""
+        with self._lock:
+            for item_id, relevant in labels.items():
+                row = self._rows.get(item_id)
+                if row is not None:
+                    self._truth[row] = RELEVANT if relevant else NOT_RELEVANT
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    @property
+    def backends(self) -> np.ndarray:
+        """Backend name of every row ("" when unknown)"""
+        return np.array(self._backends, dtype=str)
+
+    @property
+    def scores(self) -> np.ndarray:
+        """(items, labels) score matrix (a view: do not modify)"""
+        return self._scores[: len(self._ids)]
+
+    @property
+    def ground_truth(self) -> np.ndarray:
+        return self._truth[: len(self._ids)]
+
+    def _merge_ground_truth(self, path: str):
+        """
+        Keep the labels another process (e.g. show_news.py) saved to `path`
+        for rows still unlabelled here, so saving never drops them.
+        """
+        try:
+            with np.load(path) as data:
+                ids, truth = data["ids"], data["truth"]
+        except (OSError, KeyError, ValueError):
+            return
+        for item_id, value in zip(ids[truth != UNKNOWN], truth[truth != UNKNOWN]):
+            row = self._rows.get(str(item_id))
+            if row is not None and self._truth[row] == UNKNOWN:
+                self._truth[row] = value
+
+    def save(self, path: str):
+        with self._lock:
+            if os.path.exists(path):
+                self._merge_ground_truth(path)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp_path = path + ".tmp.npz"
+            np.savez_compressed(
+                tmp_path,
+                labels=np.array(self.labels),
+                ids=np.array(self._ids, dtype=str),
+                backends=np.array(self._backends, dtype=str),
+                scores=self.scores,
+                truth=self.ground_truth,
+            )
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, max_items: Optional[int] = None) -> "ScoreStore":
+        with np.load(path) as data:
+            store = cls([str(label) for label in data["labels"]], max_items=max_items)
+            # Files saved before the backend column have no "backends" array
+            backends = (
+                data["backends"] if "backends" in data else [""] * len(data["ids"])
+            )
+            for item_id, scores, truth, backend in zip(
+                data["ids"], data["scores"], data["truth"], backends
+            ):
+                store.add(
+                    str(item_id),
+                    scores,
+                    None if truth == UNKNOWN else bool(truth),
+                    str(backend),
+                )
+        return store
+
+
+def label_subset_masks(
+    labels: Sequence[str], subsets: Sequence[Sequence[str]]
+) -> np.ndarray:
+    """(subsets, labels) boolean masks selecting the labels of each subset"""
+    index = {label: i for i, label in enumerate(labels)}
+    masks = np.zeros((len(subsets), len(labels)), dtype=bool)
+    for row, subset in enumerate(subsets):
+        masks[row, [index[label] for label in subset]] = True
+    return masks
+
+
+def sweep_thresholds(
+    scores: np.ndarray,
+    y_true: np.ndarray,
+    masks: np.ndarray,
+    thresholds: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Precision/recall/F1 of the relevance decision "max score over the subset's
+    labels >= threshold" for every (label subset, threshold) pair at once.
+    scores: (items, labels), y_true: (items,) bool, masks: (subsets, labels),
+    thresholds: (thresholds,). Returns arrays of shape (subsets, thresholds).
+    """
+    y_true = np.asarray(y_true, dtype=bool)
+    # (items, subsets): best score among each subset's labels
+    masked = np.where(masks[None, :, :], scores[:, None, :], -np.inf)
+    best = masked.max(axis=2)
+    # (items, subsets, thresholds)
+    predicted = best[:, :, None] >= np.asarray(thresholds)[None, None, :]
+    positives = y_true[:, None, None]
+    tp = (predicted & positives).sum(axis=0)
+    fp = (predicted & ~positives).sum(axis=0)
+    fn = (~predicted & positives).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+        recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+        f1 = np.where(
+            precision + recall > 0,
+            2 * precision * recall / (precision + recall),
+            0.0,
+        )
+    return {
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "tp": tp,
+        "fp": fp,
+        "fn": fn,
+    }
@@ -0,0 +1,108 @@
+import re
+from typing import Iterator, List, Optional
+
+# Sentence boundary: period, exclamation or question mark followed by spaces
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?]) +")
+# Body characters scanned per token of budget (tokens average ~4 characters),
+# so a huge selftext is never scanned past what could fit in the snippet
+CHARS_PER_TOKEN_SCAN = 8
+
+# Running token counters of the texts sent to the classifier
+BATCH_TOKEN_STATS = {"items": 0, "batches": 0, "tokens": 0, "padded_tokens": 0}
+
+
+class TokenCounter:
+    """
+    Token counting/truncation with the classifier's own tokenizer, falling back
+    to whitespace-separated words when no tokenizer is available.
+    """
+
+    def __init__(self, tokenizer=None):
+        self.tokenizer = tokenizer
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.tokenizer is None:
+            return len(text.split())
+        return len(self.tokenizer.tokenize(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        if self.tokenizer is None:
+            words = text.split()
+            return text if len(words) <= max_tokens else " ".join(words[:max_tokens])
+        tokens = self.tokenizer.tokenize(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return self.tokenizer.convert_tokens_to_string(tokens[:max_tokens]).strip()
+
+
+def iter_sentences(text: str, max_chars: Optional[int] = None) -> Iterator[str]:
+    """Lazily yield the sentences of text, looking at most at max_chars characters"""
+    if not text:
+        return
+    if max_chars is not None:
+        text = text[:max_chars]
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        yield text[start : boundary.start()]
+        start = boundary.end()
+    yield text[start:]
+
+
+def build_snippet(
+    title: str,
+    body: str,
+    counter: TokenCounter,
+    max_tokens: int,
+    n_sentences: int = 2,
+) -> str:
+    """
+    Title plus the first n_sentences of the body, cut at max_tokens. The body
+    is scanned sentence by sentence and scanning stops as soon as the budget
+    or the sentence count is reached.
+    """
+    title = title or ""
+    used = counter.count(title)
+    if used > max_tokens:
+        return counter.truncate(title, max_tokens)
+
+    sentences: List[str] = []
+    scan_limit = max_tokens * CHARS_PER_TOKEN_SCAN
+    for sentence in iter_sentences(body, max_chars=scan_limit):
+        if len(sentences) >= n_sentences or used >= max_tokens:
+            break
+        tokens = counter.count(sentence)
+        if used + tokens > max_tokens:
+            sentence = counter.truncate(sentence, max_tokens - used)
+            tokens = max_tokens - used
+        sentences.append(sentence)
+        used += tokens
+
+    snippet = " ".join(sentences)
+    return title + " " + snippet if snippet else title
+
+
+def record_batch_tokens(lengths: List[int]):
+    """Account one batch: real tokens and padding up to its longest item"""
+    if not lengths:
+        return
+    BATCH_TOKEN_STATS["items"] += len(lengths)
+    BATCH_TOKEN_STATS["batches"] += 1
+    BATCH_TOKEN_STATS["tokens"] += sum(lengths)
+    BATCH_TOKEN_STATS["padded_tokens"] += max(lengths) * len(lengths) - sum(lengths)
+
+
+def get_batch_token_stats() -> dict:
+    """Tokens per item and share of padded (wasted) positions in classifier batches"""
+    stats = dict(BATCH_TOKEN_STATS)
+    total_positions = stats["tokens"] + stats["padded_tokens"]
+    stats["tokens_per_item"] = (
+        stats["tokens"] / stats["items"] if stats["items"] else 0.0
+    )
+    stats["padding_waste"] = (
+        stats["padded_tokens"] / total_positions if total_positions else 0.0
+    )
+    return stats
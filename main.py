@@ -1,21 +1,34 @@
+import asyncio
 import logging
 import os
 import time
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Set
+from typing import Dict, FrozenSet, List, Literal, Optional, Set
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 import newsfeed.log_utils as log_utils
 from newsfeed.background_tasks import BackgroundTaskManager
 from newsfeed.config import (
     ASSESS_CORRECTNESS_WITH_BIGGER_MODEL,
     ASSESS_EFFICIENCY,
+    CLASSIFIER_BACKENDS,
+    CLASSIFY_INGESTED_ITEMS,
+    FILTER_LOG_CAPACITY,
     INTERVAL,
     NEWS_SOURCES,
     NUMBER_INITIAL_POST_PER_SOURCE,
+    REDDIT_COALESCE,
+    REDDIT_GROUP_SIZE,
 )
+from newsfeed.feed_stream import FeedBroadcaster
 from newsfeed.ingestion.ars_technica_source import ArsTechnicaSource
+from newsfeed.ingestion.base_source import BaseSource
+from newsfeed.ingestion.batching_service import MicroBatchClassifier
+from newsfeed.ingestion.filtering import FILTER_LOGS
+from newsfeed.ingestion.http_client import get_http_stats
 from newsfeed.ingestion.manager import IngestionManager
 from newsfeed.ingestion.mock_source_data import MockSource
 from newsfeed.ingestion.reddit_source import RedditSource
@@ -27,6 +40,13 @@ from newsfeed.log_utils import (
     setup_run_logger,
 )
 from newsfeed.models import NewsItem
+from newsfeed.ranking import (
+    RankingIndex,
+    decode_cursor,
+    encode_cursor,
+    recency_lambda,
+)
+from newsfeed.snapshots import FeedSnapshots, etag_matches, negotiate_encoding
 
 # ----------------------------------------------------------------------
 # End of import block
@@ -96,8 +116,12 @@ app = FastAPI()
 
 app.json_encoders = {datetime: lambda dt: dt.isoformat()}
 
-# In-memory store for accepted news items and their IDs for fast deduplication
-accepted_items: List[NewsItem] = []
+# In-memory store for accepted news items (ranked by final_score) and their IDs for fast deduplication
+accepted_items = RankingIndex(recency_lambda=recency_lambda(INTERVAL))
+# Serialized /retrieve responses, rebuilt when the feed version changes
+feed_snapshots = FeedSnapshots(accepted_items)
+# Pushes newly accepted items to /stream clients
+feed_stream = FeedBroadcaster(accepted_items)
 accepted_item_ids: Set[str] = set()
 
 # In-memory store for all news items (accepted + filtered) for assessment
@@ -109,13 +133,36 @@ SOURCE_TYPE_MAP = {
     "mock": lambda cfg: MockSource(),
 }
 
-sources = []
-for src_cfg in NEWS_SOURCES:
-    src_type = src_cfg["type"]
-    if src_type in SOURCE_TYPE_MAP:
-        sources.append(SOURCE_TYPE_MAP[src_type](src_cfg))
-    else:
-        raise ValueError(f"Unknown source type: {src_type}")
+
+def build_sources(news_sources: List[Dict]) -> List[BaseSource]:
+    """
+    Sources of the NEWS_SOURCES entries. Unknown source types and classifier
+    backends fail here, at startup, rather than dropping items every cycle.
+    """
+    sources = []
+    # Subreddits read through combined listings, grouped by classifier backend
+    coalesced_subreddits: Dict[Optional[str], List[str]] = defaultdict(list)
+    for src_cfg in news_sources:
+        src_type = src_cfg["type"]
+        classifier = src_cfg.get("classifier")
+        if classifier is not None and classifier not in CLASSIFIER_BACKENDS:
+            raise ValueError(f"Unknown classifier backend: {classifier}")
+        if src_type == "reddit" and REDDIT_COALESCE:
+            coalesced_subreddits[classifier].append(src_cfg["subreddit"])
+        elif src_type in SOURCE_TYPE_MAP:
+            source = SOURCE_TYPE_MAP[src_type](src_cfg)
+            source.classifier_backend = classifier
+            sources.append(source)
+        else:
+            raise ValueError(f"Unknown source type: {src_type}")
+    for classifier, subreddits in coalesced_subreddits.items():
+        for source in RedditSource.group(subreddits, group_size=REDDIT_GROUP_SIZE):
+            source.classifier_backend = classifier
+            sources.append(source)
+    return sources
+
+
+sources = build_sources(NEWS_SOURCES)
 
 ingestion_manager = IngestionManager(
     sources=sources,
@@ -123,12 +170,16 @@ ingestion_manager = IngestionManager(
     number_initial_post_per_source=NUMBER_INITIAL_POST_PER_SOURCE,
 )
 
+# Micro-batching relevance classifier for items arriving at irregular times
+classification_service = MicroBatchClassifier()
+
 # After setting up the ingestion_manager, create the background task manager
 background_task_manager = BackgroundTaskManager(
     ingestion_manager=ingestion_manager,
     accepted_items=accepted_items,
     accepted_item_ids=accepted_item_ids,
     all_items=all_items,
+    classification_service=classification_service,
 )
 
 # Create the lifespan context
@@ -144,20 +195,53 @@ def read_root():
     return {"Hello": "World"}
 
 
+@app.get("/healthz/live")
+def liveness():
+    """The process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/healthz/ready")
+def readiness(response: Response):
+    """200 once the classifier is warmed up and the initial fetch is done, 503 before"""
+    status = background_task_manager.readiness()
+    if not status["ready"]:
+        response.status_code = 503
+    return status
+
+
 @app.get("/items/{item_id}")
 def read_item(item_id: int, q: str = None):
     print(f"Items endpoint accessed with item_id: {item_id}, q: {q}")
     return {"item_id": item_id, "q": q}
 
 
+async def classify_ingested_items(items: List[NewsItem]) -> List[NewsItem]:
+    """Run posted items through the micro-batching classifier, keep the relevant ones"""
+    decisions = await asyncio.gather(
+        *(classification_service.classify(item) for item in items)
+    )
+    relevant = []
+    for item, (binary_label, max_score, top_label, _) in zip(items, decisions):
+        item.relevance_score = max_score
+        item.top_relevant_label = top_label
+        if binary_label:
+            relevant.append(item)
+    return relevant
+
+
 @app.post("/ingest")
-def ingest_news(items: List[NewsItem]):
+async def ingest_news(items: List[NewsItem]):
     print(f"Ingest endpoint received {len(items)} items.")
     ingest_latency = None
     if ASSESS_EFFICIENCY:
         import time
 
         ingest_start = time.perf_counter()
+    if CLASSIFY_INGESTED_ITEMS:
+        items = await classify_ingested_items(
+            [item for item in items if item.id not in accepted_item_ids]
+        )
     newly_ingested_count = 0
     for item in items:
         if item.id not in accepted_item_ids:
@@ -167,7 +251,7 @@ def ingest_news(items: List[NewsItem]):
             log_accepted(item, step="ingest_news")
 
     # Use the background task manager's method
-    background_task_manager.update_recency_final_scores()
+    background_task_manager.trim_accepted_items()
 
     if ASSESS_EFFICIENCY:
         ingest_end = time.perf_counter()
@@ -190,42 +274,231 @@ def ingest_news(items: List[NewsItem]):
     return {"status": "ACK"}
 
 
-@app.get("/retrieve", response_model=List[NewsItem])
-def retrieve_news():
-    print(f"Retrieve endpoint accessed. Returning {len(accepted_items)} items.")
+def parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """`fields=id,title` -> NewsItem fields to serialize (None: all of them)"""
+    if not fields:
+        return None
+    include = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = include - set(NewsItem.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {sorted(unknown)}"
+        )
+    return include or None
+
+
+@app.get(
+    "/retrieve",
+    # Responses are built by hand (snapshot bytes, 304s): document, don't validate
+    response_class=JSONResponse,
+    responses={
+        200: {"model": List[NewsItem]},
+        304: {"description": "Feed unchanged since the ETag in If-None-Match"},
+    },
+)
+def retrieve_news(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """
+    Accepted items, best final_score first. limit: page size (all items by
+    default); cursor: the X-Next-Cursor header of the previous page (stable
+    while new items arrive); fields: comma-separated NewsItem fields to return
+    (e.g. fields=id,title,final_score to skip bodies).
+    First pages are served from a snapshot of the current feed version
+    (gzip/brotli on request); If-None-Match with its ETag gets a 304.
+    """
+    print(f"Retrieve endpoint accessed. {len(accepted_items)} items available.")
     retrieve_latency = None
     if ASSESS_EFFICIENCY:
         import time
 
         retrieve_start = time.perf_counter()
 
-    # Use the background task manager's method
-    background_task_manager.update_recency_final_scores()
+    include = parse_fields(fields)
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if after is None:
+        # First page: serialized once per feed version
+        snapshot = feed_snapshots.get(limit=limit, fields=include)
+        if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+            feed_snapshots.record_not_modified()
+            returned = 0
+            response = Response(
+                status_code=304, headers=snapshot.not_modified_headers()
+            )
+        else:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+            returned = snapshot.count
+            response = Response(
+                content=snapshot.body(encoding),
+                media_type="application/json",
+                headers=snapshot.headers(encoding),
+            )
+    else:
+        # Already ranked by final_score: only the returned page is scored
+        # and serialized
+        items, next_key = accepted_items.page(limit=limit, after=after)
+        returned = len(items)
+        response = JSONResponse(
+            content=[item.model_dump(mode="json", include=include) for item in items],
+            headers={"X-Next-Cursor": encode_cursor(next_key)} if next_key else None,
+        )
 
     if ASSESS_EFFICIENCY:
         retrieve_end = time.perf_counter()
         retrieve_latency = retrieve_end - retrieve_start
-        throughput = (
-            len(accepted_items) / retrieve_latency if retrieve_latency > 0 else 0.0
-        )
+        throughput = returned / retrieve_latency if retrieve_latency > 0 else 0.0
 
         # Log metrics on separate lines
         log_efficiency(f"Latency: {retrieve_latency:.4f} seconds", step="/retrieve")
         log_efficiency(f"Throughput: {throughput:.2f} items/s", step="/retrieve")
-        log_efficiency(f"Items returned: {len(accepted_items)} items", step="/retrieve")
+        log_efficiency(
+            f"Items returned: {returned} items (status {response.status_code})",
+            step="/retrieve",
+        )
         log_resource_usage("/retrieve")
 
-    # Return all accepted items, sorted by final_score (descending), fallback to published_at
-    return sorted(
-        accepted_items,
-        key=lambda x: (
-            x.final_score if x.final_score is not None else 0,
-            x.published_at,
-        ),
-        reverse=True,
+    return response
+
+
+@app.get("/retrieve/changes")
+def retrieve_changes(since_version: int, fields: Optional[str] = None):
+    """
+    Feed changes after since_version (the `version` of the previous response,
+    or the X-Feed-Version header of /retrieve): {"version", "full": false,
+    "added": items added (ranked), "removed": ids evicted}. Apply "removed"
+    before "added". When the change log no longer reaches back to
+    since_version, {"full": true, "added": the whole feed, "removed": []}:
+    replace the local copy.
+    """
+    include = parse_fields(fields)
+
+    changes = accepted_items.changes_since(since_version)
+    if changes is None:
+        # Reuse the serialized snapshot of the current version
+        snapshot = feed_snapshots.get(fields=include)
+        body = (
+            f'{{"version":{snapshot.version},"full":true,"removed":[],"added":'.encode()
+            + snapshot.body()
+            + b"}"
+        )
+        if ASSESS_EFFICIENCY:
+            log_efficiency(
+                f"Full snapshot for since_version={since_version}: {len(body)} bytes",
+                step="/retrieve/changes",
+            )
+        return Response(content=body, media_type="application/json")
+
+    added, removed, version = changes
+    if ASSESS_EFFICIENCY:
+        log_efficiency(
+            f"Delta since {since_version}: {len(added)} added, {len(removed)} removed",
+            step="/retrieve/changes",
+        )
+    return JSONResponse(
+        content={
+            "version": version,
+            "full": False,
+            "removed": removed,
+            "added": [item.model_dump(mode="json", include=include) for item in added],
+        }
+    )
+
+
+@app.get("/stream")
+async def stream_news(
+    request: Request,
+    label: Optional[str] = None,
+    source: Optional[str] = None,
+    since_version: Optional[int] = None,
+):
+    """
+    Server-Sent Events stream of items as they are accepted ("item" events,
+    id = feed version). `label=Outage,Vulnerability` and `source=reddit` keep
+    matching items only. since_version (or the Last-Event-ID header sent by a
+    reconnecting EventSource) replays what was accepted after that version
+    first; a "sync" event marks the end of the replay.
+    """
+    if since_version is None and request.headers.get("last-event-id"):
+        try:
+            since_version = int(request.headers["last-event-id"])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+    labels = [name.strip() for name in (label or "").split(",") if name.strip()]
+    sources = [name.strip() for name in (source or "").split(",") if name.strip()]
+    client = feed_stream.subscribe(
+        labels=labels, sources=sources, since_version=since_version
+    )
+    log_info(
+        f"/stream client connected (labels={labels}, sources={sources}, "
+        f"since_version={since_version})",
+        source="STREAM",
+    )
+    return StreamingResponse(
+        feed_stream.events(client),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+@app.get("/debug/classifier-queue")
+def classifier_queue_stats():
+    """Queue depth, batch-size histogram and wait times of the micro-batching classifier"""
+    return classification_service.stats()
+
+
+@app.get("/debug/pipeline")
+def pipeline_stats():
+    """Queue depth, processed count and latency of each ingestion pipeline stage"""
+    if background_task_manager.pipeline is None:
+        return {}
+    return background_task_manager.pipeline.stats()
+
+
+@app.get("/debug/sources")
+def source_status():
+    """Circuit breaker state, trips and cool-down of each source"""
+    return ingestion_manager.breaker_stats()
+
+
+@app.get("/debug/snapshots")
+def snapshot_stats():
+    """Feed version and /retrieve snapshot hits, rebuilds and 304s"""
+    return feed_snapshots.stats()
+
+
+@app.get("/debug/stream")
+def stream_stats():
+    """Connected /stream clients, events pushed, delivered and dropped"""
+    return feed_stream.stats()
+
+
+@app.get("/debug/http")
+def http_stats():
+    """Per-source requests, bytes downloaded, 304 rate and connection reuse"""
+    return get_http_stats()
+
+
+@app.get("/debug/filter-log")
+def filter_log(
+    since: int = Query(0, ge=0),
+    decision: Optional[Literal["pass", "filtered"]] = None,
+    limit: int = Query(500, ge=1, le=FILTER_LOG_CAPACITY),
+):
+    """
+    Filter decisions with sequence number > since (oldest first). Poll with
+    since=<next_since of the previous response> to receive only new records.
+    """
+    records, next_since = FILTER_LOGS.query(since=since, decision=decision, limit=limit)
+    return {"next_since": next_since, "records": records}
+
+
 @app.get("/retrieve-all")
 def retrieve_all_news():
     if not ASSESS_CORRECTNESS_WITH_BIGGER_MODEL:
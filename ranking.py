@@ -0,0 +1,284 @@
+import base64
+import json
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sortedcontainers import SortedList
+
+from newsfeed.config import CHANGE_LOG_SIZE, PERSISTENCE_TIME
+from newsfeed.models import NewsItem
+
+# Reference time of the static keys (keeps lambda * t small, whatever "now" is)
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+RankKey = Tuple[float, float, str]
+
+
+def recency_lambda(interval: float) -> float:
+    """Decay constant (per second) of the recency weight exp(-lambda * age)"""
+    persistence_time = PERSISTENCE_TIME * interval
+    return 1 / persistence_time if persistence_time > 0 else 0.0
+
+
+def encode_cursor(key: RankKey) -> str:
+    """Opaque pagination cursor: the rank key of the last item of a page"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> RankKey:
+    """Inverse of encode_cursor (ValueError if the cursor is malformed)"""
+    try:
+        score, published, item_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return float(score), float(published), str(item_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+class RankingIndex:
+    """
+    Accepted items ordered by final_score = relevance * exp(-lambda * age).
+
+    With one decay constant, final_score orders items exactly like the static
+    key log(relevance) + lambda * published_at: the ranking never changes as
+    time passes, so items are kept in a sorted list on that key (O(log n)
+    insert/remove) and recency_weight/final_score are only computed for the
+    items a caller actually gets back from top(). Items without a (positive)
+    relevance score rank last, newest first, as final_score 0 did.
+
+    Supports the list operations the app uses on accepted_items (append,
+    extend, clear, len, iteration best first).
+
+    `version` increases by one per item added or removed; it starts at the
+    creation time in milliseconds, so versions also increase across
+    restarts. The last change_log_size changes are kept for changes_since().
+    Listeners added with add_listener() are called with (version, item) for
+    every item added.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[NewsItem] = (),
+        recency_lambda: float = 0.0,
+        change_log_size: int = CHANGE_LOG_SIZE,
+    ) -> None:
+        self._recency_lambda = recency_lambda
+        self._keys = SortedList()
+        self._by_id: Dict[str, Tuple[RankKey, NewsItem]] = {}
+        self._lock = threading.RLock()
+        self.version = time.time_ns() // 1_000_000
+        # (version, added item or None, item id); changes_since() can answer
+        # for any version >= _log_floor
+        self._log: deque = deque()
+        self._log_size = max(0, change_log_size)
+        self._log_floor = self.version
+        self._listeners: List[Callable[[int, NewsItem], None]] = []
+        self.extend(items)
+
+    def add_listener(self, callback: Callable[[int, NewsItem], None]):
+        """
+        Call callback(version, item), item scored, for every item added. It
+        runs under the index lock, in version order: it should only hand the
+        item off.
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _record(self, item_id: str, added: Optional[NewsItem] = None):
+        """Bump the version and log one change (caller holds the lock)"""
+        self.version += 1
+        self._log.append((self.version, added, item_id))
+        while len(self._log) > self._log_size:
+            self._log_floor = self._log.popleft()[0]
+
+    def _reset_log(self):
+        """Contents changed wholesale: the log no longer covers older versions"""
+        self.version += 1
+        self._log.clear()
+        self._log_floor = self.version
+
+    def _key(self, item: NewsItem) -> RankKey:
+        published = (item.published_at - EPOCH).total_seconds()
+        relevance = item.relevance_score
+        score = (
+            math.log(relevance) + self._recency_lambda * published
+            if relevance is not None and relevance > 0
+            else -math.inf
+        )
+        return score, published, item.id
+
+    @property
+    def recency_lambda(self) -> float:
+        return self._recency_lambda
+
+    @recency_lambda.setter
+    def recency_lambda(self, value: float):
+        with self._lock:
+            if value == self._recency_lambda:
+                return
+            items = [item for _, item in self._by_id.values()]
+            self._recency_lambda = value
+            self._by_id = {item.id: (self._key(item), item) for item in items}
+            self._keys = SortedList(key for key, _ in self._by_id.values())
+            self._reset_log()
+
+    def append(self, item: NewsItem) -> bool:
+        """Insert an item (False if its id is already indexed)"""
+        with self._lock:
+            if item.id in self._by_id:
+                return False
+            key = self._key(item)
+            self._keys.add(key)
+            self._by_id[item.id] = (key, item)
+            self._record(item.id, added=item)
+            if self._listeners:
+                self._score([item], None)
+                for callback in self._listeners:
+                    callback(self.version, item)
+            return True
+
+    def extend(self, items: Iterable[NewsItem]):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item_id: str) -> Optional[NewsItem]:
+        with self._lock:
+            entry = self._by_id.pop(item_id, None)
+            if entry is None:
+                return None
+            self._keys.remove(entry[0])
+            self._record(item_id)
+            return entry[1]
+
+    def clear(self):
+        with self._lock:
+            if self._by_id:
+                self._reset_log()
+            self._keys.clear()
+            self._by_id.clear()
+
+    def trim(self, max_items: int) -> List[NewsItem]:
+        """Drop the lowest-ranked items beyond max_items; returns them"""
+        removed = []
+        with self._lock:
+            while len(self._keys) > max(0, max_items):
+                key = self._keys.pop(0)
+                removed.append(self._by_id.pop(key[2])[1])
+                self._record(key[2])
+        return removed
+
+    def _score(self, items: List[NewsItem], now: Optional[datetime]):
+        """Stamp recency_weight and final_score as of `now` on the given items"""
+        now = now or datetime.now(timezone.utc)
+        for item in items:
+            if item.relevance_score is not None:
+                age = (now - item.published_at).total_seconds()
+                item.recency_weight = math.exp(-self._recency_lambda * age)
+                item.final_score = item.relevance_score * item.recency_weight
+            else:
+                item.recency_weight = None
+                item.final_score = None
+
+    def top(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        now: Optional[datetime] = None,
+    ) -> List[NewsItem]:
+        """
+        Items ranked offset .. offset+limit (all by default), best first, with
+        recency_weight and final_score computed as of `now`.
+        """
+        with self._lock:
+            # Keys are ascending: the best `offset + limit` are at the end
+            size = len(self._keys)
+            start = 0 if limit is None else max(0, size - offset - limit)
+            keys = list(self._keys.islice(start, max(0, size - offset), reverse=True))
+            items = [self._by_id[key[2]][1] for key in keys]
+        self._score(items, now)
+        return items
+
+    def top_with_version(
+        self, now: Optional[datetime] = None
+    ) -> Tuple[List[NewsItem], int]:
+        """All items, best first and scored as of `now`, and the version they are at"""
+        with self._lock:
+            return self.top(now=now), self.version
+
+    def page(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[RankKey] = None,
+        now: Optional[datetime] = None,
+    ) -> Tuple[List[NewsItem], Optional[RankKey]]:
+        """
+        Up to `limit` items ranked below the key `after` (from the top if
+        None), best first and scored as of `now`, plus the key to pass as
+        `after` for the next page (None on the last page). Keys do not move as
+        items arrive or age, so paging never repeats an item or skips one that
+        was already indexed.
+        """
+        with self._lock:
+            end = len(self._keys) if after is None else self._keys.bisect_left(after)
+            start = 0 if limit is None else max(0, end - limit)
+            keys = list(self._keys.islice(start, end, reverse=True))
+            items = [self._by_id[key[2]][1] for key in keys]
+        self._score(items, now)
+        next_key = keys[-1] if keys and start > 0 else None
+        return items, next_key
+
+    def page_with_version(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[RankKey] = None,
+        now: Optional[datetime] = None,
+    ) -> Tuple[List[NewsItem], Optional[RankKey], int]:
+        """page() and the version it is at, read under one lock"""
+        with self._lock:
+            items, next_key = self.page(limit=limit, after=after, now=now)
+            return items, next_key, self.version
+
+    def changes_since(
+        self, version: int, now: Optional[datetime] = None
+    ) -> Optional[Tuple[List[NewsItem], List[str], int]]:
+        """
+        Net changes after `version`: (items added and still present, best
+        first and scored as of `now`; ids removed; current version). An id can
+        be in both lists when it was removed and added again: apply removals
+        first. None when the change log no longer reaches back to `version`
+        (or `version` is from the future): the caller needs a full snapshot.
+        """
+        with self._lock:
+            if version < self._log_floor or version > self.version:
+                return None
+            added: Dict[str, NewsItem] = {}
+            removed: Set[str] = set()
+            # The log is ordered by version: walk back to the first newer entry
+            for entry_version, item, item_id in reversed(self._log):
+                if entry_version <= version:
+                    break
+                if item is None:
+                    removed.add(item_id)
+                elif item_id not in added and item_id in self._by_id:
+                    added[item_id] = item
+            current = self.version
+            items = sorted(
+                added.values(), key=lambda item: self._by_id[item.id][0], reverse=True
+            )
+        self._score(items, now)
+        return items, sorted(removed), current
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, item: object) -> bool:
+        """Membership by item or by id"""
+        return (item.id if isinstance(item, NewsItem) else item) in self._by_id
+
+    def __iter__(self) -> Iterator[NewsItem]:
+        with self._lock:
+            items = [self._by_id[key[2]][1] for key in reversed(self._keys)]
+        return iter(items)
@@ -15,6 +15,7 @@ from newsfeed.ingestion.filtering import (
     RELEVANT_LABEL_SUFFIX,
     assess_with_bigger_model,
     evaluate_pipeline_vs_model,
+    save_score_store,
 )
 from newsfeed.models import NewsItem
 
@@ -94,6 +95,8 @@ if ASSESS_CORRECTNESS_WITH_BIGGER_MODEL:
         for item in news_items
     }
     model_labels = assess_with_bigger_model(news_items)
+    # The verdicts are ground truth for `evaluate_thresholds --store`
+    save_score_store()
     precision, recall, cm = evaluate_pipeline_vs_model(pipeline_labels, model_labels)
     # F1 score
     y_true = [
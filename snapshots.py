@@ -0,0 +1,191 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from newsfeed.config import FEED_SNAPSHOT_MAX_AGE, FEED_SNAPSHOT_VARIANTS
+from newsfeed.ranking import RankingIndex, encode_cursor
+
+# brotli is optional (pip install brotli); without it only gzip is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Distinguishes the ETags of this process from those of an earlier run
+BOOT_ID = os.urandom(4).hex()
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> str:
+    """Best content coding offered by the client: br, gzip or identity"""
+    offered = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            offered[name.lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if offered.get(encoding, offered.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+def variant_tag(limit: Optional[int], fields: Optional[FrozenSet[str]]) -> str:
+    """Short hash of a /retrieve query, so each (limit, fields) variant has its own ETag"""
+    query = f"{limit}|{','.join(sorted(fields)) if fields else ''}"
+    return hashlib.blake2b(query.encode(), digest_size=4).hexdigest()
+
+
+def _opaque_tag(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return _opaque_tag(etag) in {_opaque_tag(tag) for tag in if_none_match.split(",")}
+
+
+class FeedSnapshot:
+    """
+    One version of a /retrieve response, serialized once. gzip/brotli
+    variants are compressed on first request and kept with it.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        body: bytes,
+        count: int,
+        next_cursor: Optional[str],
+        variant: str = "",
+    ):
+        self.version = version
+        self.count = count
+        self.built_at = time.monotonic()
+        # Weak: the items and their ranking are fixed per version; only the
+        # decayed final_score values differ between rebuilds of a version.
+        # The variant keeps a 304 from answering a query the client never got
+        self.etag = f'W/"{BOOT_ID}-{version}-{variant}"'
+        self.next_cursor = next_cursor
+        self._bodies: Dict[str, bytes] = {"identity": body}
+        self._lock = threading.Lock()
+
+    def body(self, encoding: str = "identity") -> bytes:
+        with self._lock:
+            if encoding not in self._bodies:
+                self._bodies[encoding] = _compress(self._bodies["identity"], encoding)
+            return self._bodies[encoding]
+
+    def not_modified_headers(self) -> Dict[str, str]:
+        """Headers of a 304: the validator and caching headers of the 200"""
+        return {
+            "ETag": self.etag,
+            "X-Feed-Version": str(self.version),
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "no-cache",
+        }
+
+    def headers(self, encoding: str = "identity") -> Dict[str, str]:
+        headers = self.not_modified_headers()
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        if self.next_cursor:
+            headers["X-Next-Cursor"] = self.next_cursor
+        return headers
+
+
+class FeedSnapshots:
+    """
+    Materialized /retrieve responses per (limit, fields), rebuilt only when
+    the index version changes, or when the snapshot is older than max_age
+    seconds (refreshing the served final_score values, same ETag). Unchanged
+    polls are answered from the snapshot, or with a 304 when the client
+    sends its ETag.
+    """
+
+    def __init__(
+        self,
+        index: RankingIndex,
+        max_age: float = FEED_SNAPSHOT_MAX_AGE,
+        max_variants: int = FEED_SNAPSHOT_VARIANTS,
+    ):
+        self.index = index
+        self.max_age = max_age
+        self.max_variants = max(1, max_variants)
+        self._snapshots: "OrderedDict[Tuple, FeedSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "builds": 0, "not_modified": 0}
+
+    def get(
+        self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> FeedSnapshot:
+        """Current snapshot of the top `limit` items (all) projected to `fields`"""
+        query = (limit, fields)
+        with self._lock:
+            snapshot = self._snapshots.get(query)
+            if (
+                snapshot is not None
+                and snapshot.version == self.index.version
+                and time.monotonic() - snapshot.built_at < self.max_age
+            ):
+                self._snapshots.move_to_end(query)
+                self._stats["hits"] += 1
+                return snapshot
+
+            # The version must be the one the page was read at
+            items, next_key, version = self.index.page_with_version(limit=limit)
+            content = [
+                item.model_dump(mode="json", include=set(fields) if fields else None)
+                for item in items
+            ]
+            body = json.dumps(
+                content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+            ).encode("utf-8")
+            snapshot = FeedSnapshot(
+                version,
+                body,
+                len(items),
+                encode_cursor(next_key) if next_key else None,
+                variant_tag(limit, fields),
+            )
+            self._snapshots[query] = snapshot
+            self._snapshots.move_to_end(query)
+            while len(self._snapshots) > self.max_variants:
+                self._snapshots.popitem(last=False)
+            self._stats["builds"] += 1
+            return snapshot
+
+    def record_not_modified(self):
+        with self._lock:
+            self._stats["not_modified"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "version": self.index.version,
+                "variants": len(self._snapshots),
+            }
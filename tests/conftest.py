@@ -0,0 +1,98 @@
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+import newsfeed.ingestion.filtering as filtering
+from newsfeed.ingestion.base_source import BaseSource, commit_fetch
+from newsfeed.models import NewsItem
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_files(tmp_path_factory):
+    """Keep the classification cache and score store of test runs out of the repo's cache/"""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(
+            filtering,
+            "CLASSIFICATION_CACHE_PATH",
+            str(cache_dir / "classification_cache.sqlite3"),
+        )
+        patch.setattr(filtering, "_classification_caches", {})
+        patch.setattr(filtering, "SCORE_STORE_PATH", str(cache_dir / "score_store.npz"))
+        patch.setattr(filtering, "_score_store", None)
+        yield cache_dir
+
+
+class FakeClock:
+    """Manually advanced clock for breakers and schedulers (set or add to `now`)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSource(BaseSource):
+    """
+    Source returning `n_items` new "Outage" items per fetch, scored by the
+    stub classifier. Instead of sleeping, a fetch can run `hook(source)`
+    first (to meet a barrier or count calls), hang until `release` is set (a
+    dead endpoint), or raise (an HTTP error). `produced` is its cursor: it
+    only advances for fetches the manager did not abandon.
+    """
+
+    classifier_backend = "stub"
+
+    def __init__(self, source_name, n_items=1, hook=None, hang=False, fail=False):
+        self.source_name = source_name
+        self.n_items = n_items
+        self.hook = hook
+        self.fail = fail
+        self.calls = 0
+        self.produced = 0
+        self.release = threading.Event()
+        if not hang:
+            self.release.set()
+
+    def fetch_news(self, posts_limit=None, since_timestamp=None):
+        self.calls += 1
+        if self.hook is not None:
+            self.hook(self)
+        self.release.wait()
+        if self.fail:
+            raise RuntimeError("HTTP 500")
+        now = datetime.now(timezone.utc)
+        items = [
+            NewsItem(
+                id=f"{self.source_name}-{self.produced + i}",
+                source=self.source_name,
+                title=f"Outage {self.produced + i} at {self.source_name}",
+                body="",
+                published_at=now,
+            )
+            for i in range(self.n_items)
+        ]
+        commit_fetch(lambda: setattr(self, "produced", self.produced + self.n_items))
+        return items
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_source():
+    """FakeSource factory; hanging fetches are released when the test ends"""
+    sources = []
+
+    def make(source_name, **kwargs):
+        source = FakeSource(source_name, **kwargs)
+        sources.append(source)
+        return source
+
+    yield make
+    for source in sources:
+        source.release.set()
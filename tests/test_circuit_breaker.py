@@ -0,0 +1,158 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fastapi.testclient import TestClient
+
+from newsfeed.ingestion.ars_technica_source import ArsTechnicaSource
+from newsfeed.ingestion.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from newsfeed.ingestion.manager import IngestionManager
+from newsfeed.main import app
+
+
+def test_breaker_states_and_exponential_cooldown(fake_clock):
+    clock = fake_clock
+    breaker = CircuitBreaker(
+        "s", failure_threshold=3, cooldown=60, max_cooldown=200, clock=clock
+    )
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow() and not breaker.ready()
+
+    clock.now += 60
+    assert breaker.ready()
+    assert breaker.allow()  # the single half-open probe
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.stats()["cooldown"] == 120
+
+    clock.now += 120
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.stats()["cooldown"] == 200  # capped
+
+    clock.now += 200
+    assert breaker.allow()
+    breaker.record_success()
+    stats = breaker.stats()
+    assert stats["state"] == CLOSED
+    assert stats["cooldown"] == 60
+    assert stats["trips"] == 3
+
+
+def test_dead_source_stops_costing_cycle_latency(make_source, fake_clock):
+    dead = make_source("dead", hang=True)
+    healthy = make_source("healthy")
+    manager = IngestionManager(
+        [dead, healthy], fetch_timeout=0.2, adaptive_polling=False
+    )
+    clock = fake_clock
+    manager.breakers = {
+        name: CircuitBreaker(name, failure_threshold=2, cooldown=60, clock=clock)
+        for name in ("dead", "healthy")
+    }
+
+    due_per_cycle = []
+    for _ in range(6):
+        due = manager.due_sources()
+        due_per_cycle.append(sorted(source.source_name for source in due))
+        manager.continuous_fetch_sources(sources=due)
+    stats = manager.breaker_stats()
+    print(f"\nBreakers: {stats}")
+
+    # Two timed-out cycles trip the breaker; afterwards the dead source is not
+    # even submitted, so no cycle waits for its timeout
+    assert due_per_cycle[:2] == [["dead", "healthy"]] * 2
+    assert due_per_cycle[2:] == [["healthy"]] * 4
+    assert dead.calls == 2
+    assert healthy.calls == 6
+    assert stats["dead"]["state"] == OPEN
+    assert stats["healthy"]["state"] == CLOSED
+
+    # After the cool-down a single probe goes out; it fails, so the cool-down doubles
+    clock.now += 60
+    assert dead in manager.due_sources()
+    manager.continuous_fetch_sources(sources=[dead, healthy])
+    assert dead.calls == 3
+    assert manager.breaker_stats()["dead"]["cooldown"] == 120
+
+    # The endpoint recovers: the next probe closes the circuit
+    dead.release.set()
+    clock.now += 120
+    manager.continuous_fetch_sources(sources=manager.due_sources())
+    assert manager.breaker_stats()["dead"]["state"] == CLOSED
+    manager.stop()
+
+
+def test_cycle_budget_skips_queued_fetches(make_source):
+    # One fetch slot: the hung second source uses up the budget of the cycle
+    sources = [make_source("slow0")] + [
+        make_source(f"slow{i}", hang=True) for i in range(1, 4)
+    ]
+    manager = IngestionManager(
+        sources,
+        fetch_concurrency=1,
+        fetch_timeout=1.0,
+        cycle_budget=0.5,
+        adaptive_polling=False,
+    )
+    results = manager.fetch_sources()
+    manager.stop()
+
+    errors = [error for _, _, error, _ in results]
+    assert errors[0] is None
+    assert all(isinstance(error, TimeoutError) for error in errors[1:])
+    # The queued fetches were abandoned without running
+    assert [source.calls for source in sources] == [1, 1, 0, 0]
+    # The skipped sources never ran: no failure is charged to them
+    assert manager.breaker_stats()["slow3"]["consecutive_failures"] == 0
+
+
+class ErrorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_http_errors_swallowed_by_sources_trip_the_breaker(fake_clock):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ErrorHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    source = ArsTechnicaSource(source_name="ars-breaker-test")
+    source.feed_url = f"http://127.0.0.1:{server.server_address[1]}/rss"
+    manager = IngestionManager([source], adaptive_polling=False)
+    manager.breakers["ars-breaker-test"] = CircuitBreaker(
+        "ars-breaker-test", failure_threshold=2, cooldown=60, clock=fake_clock
+    )
+    try:
+        for _ in range(3):
+            manager.continuous_fetch_sources(sources=manager.due_sources())
+    finally:
+        manager.stop()
+        server.shutdown()
+    stats = manager.breaker_stats()["ars-breaker-test"]
+    assert stats["state"] == OPEN
+    assert stats["trips"] == 1
+    assert manager.due_sources() == []
+
+
+def test_source_status_endpoint():
+    response = TestClient(app).get("/debug/sources")
+    assert response.status_code == 200
+    for breaker in response.json().values():
+        assert breaker["state"] in (CLOSED, OPEN, HALF_OPEN)
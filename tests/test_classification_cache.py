@@ -0,0 +1,82 @@
+from newsfeed.ingestion.cache import ContentHashCache, content_hash, normalize_text
+
+
+def test_normalized_text_shares_key():
+    assert content_hash(normalize_text("AWS  outage\n in us-east-1 ")) == content_hash(
+        normalize_text("AWS outage in us-east-1")
+    )
+    assert content_hash("ab", "c") != content_hash("a", "bc")
+
+
+def test_lru_eviction_and_counters():
+    cache = ContentHashCache(namespace="test", fingerprint="v1", capacity=2)
+    cache.put("a", [0.1])
+    cache.put("b", [0.2])
+    assert cache.get("a") == [0.1]  # "a" is now most recently used
+    cache.put("c", [0.3])  # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("c") == [0.3]
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ContentHashCache(namespace="test", fingerprint="v1", path=path)
+    cache.put("key", [0.5, 0.25])
+    cache.flush()
+
+    restarted = ContentHashCache(namespace="test", fingerprint="v1", path=path)
+    assert restarted.get("key") == [0.5, 0.25]
+    assert restarted.stats()["disk_hits"] == 1
+    # Promoted into the memory tier
+    assert restarted.get("key") == [0.5, 0.25]
+    assert restarted.stats()["memory_hits"] == 1
+
+
+def test_fingerprint_change_invalidates(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    for namespace, fingerprint, value in (
+        ("test", "labels-v1", 0.9),
+        ("other", "x", 0.1),
+    ):
+        cache = ContentHashCache(
+            namespace=namespace, fingerprint=fingerprint, path=path
+        )
+        cache.put("key", [value])
+        cache.flush()
+
+    changed = ContentHashCache(namespace="test", fingerprint="labels-v2", path=path)
+    assert changed.get("key") is None
+
+    # Other namespaces are left alone
+    other = ContentHashCache(namespace="other", fingerprint="x", path=path)
+    assert other.get("key") == [0.1]
+
+
+def test_disk_tier_is_bounded_and_committed_in_batches(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ContentHashCache(
+        namespace="test", fingerprint="v1", path=path, disk_capacity=5, commit_every=4
+    )
+    for i in range(10):
+        cache.put(f"k{i}", [i])
+
+    def on_disk():
+        reader = ContentHashCache(
+            namespace="test", fingerprint="v1", capacity=0, path=path
+        )
+        return {f"k{i}" for i in range(10) if reader.get(f"k{i}") is not None}
+
+    # Two commits of 4 puts so far, trimmed to the 5 newest rows
+    assert on_disk() == {"k3", "k4", "k5", "k6", "k7"}
+    # Not yet committed, but still served
+    assert cache.get("k9") == [9]
+    cache.flush()
+    assert on_disk() == {"k5", "k6", "k7", "k8", "k9"}
+    assert cache.stats()["disk_evictions"] == 5
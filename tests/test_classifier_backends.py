@@ -0,0 +1,64 @@
+import pytest
+
+from newsfeed.ingestion.classifier_backends import get_classifier_backend
+from newsfeed.ingestion.filtering import (
+    ZERO_SHOT_LABELS,
+    zero_shot_it_relevance_filter_batch,
+)
+from newsfeed.models import NewsItem
+
+
+def test_stub_backend_returns_score_matrix():
+    stub = get_classifier_backend("stub")
+    assert stub.load()
+    matrix = stub.score(
+        ["Major outage in eu-west-1", "New keyboard review"], ZERO_SHOT_LABELS
+    )
+    assert len(matrix) == 2
+    assert all(len(row) == len(ZERO_SHOT_LABELS) for row in matrix)
+    outage_column = ZERO_SHOT_LABELS.index(
+        next(label for label in ZERO_SHOT_LABELS if label.startswith("Outage"))
+    )
+    assert matrix[0][outage_column] > matrix[1][outage_column]
+
+
+def test_filter_uses_selected_backend():
+    items = [
+        NewsItem(
+            id="backend-1",
+            source="test",
+            title="Database bug corrupts indexes",
+            body="",
+            published_at="2025-06-12T12:05:00Z",
+        ),
+        NewsItem(
+            id="backend-2",
+            source="test",
+            title="Team lunch on Friday",
+            body="",
+            published_at="2025-06-12T12:05:00Z",
+        ),
+    ]
+    decisions = zero_shot_it_relevance_filter_batch(
+        items, min_score=0.5, prefilter_mode="off", backend="stub"
+    )
+    assert [d[0] for d in decisions] == [1, 0]
+    assert decisions[0][2].startswith("Database Bug")
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        get_classifier_backend("does-not-exist")
+
+
+def test_unknown_source_backend_fails_at_startup():
+    from newsfeed.main import build_sources
+
+    sources = build_sources([{"type": "mock", "classifier": "stub"}])
+    assert [source.classifier_backend for source in sources] == ["stub"]
+    for src_cfg in (
+        {"type": "mock", "classifier": "bart-typo"},
+        {"type": "reddit", "subreddit": "sysadmin", "classifier": "bart-typo"},
+    ):
+        with pytest.raises(ValueError, match="bart-typo"):
+            build_sources([src_cfg])
@@ -0,0 +1,103 @@
+import threading
+
+from newsfeed.ingestion.manager import IngestionManager
+
+
+class InFlight:
+    """Fetch hook counting the fetches running at once"""
+
+    def __init__(self, barrier=None):
+        self.barrier = barrier
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, source):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait(timeout=5)
+        finally:
+            with self._lock:
+                self.current -= 1
+
+
+def test_sources_are_fetched_concurrently(make_source):
+    # All six fetches must be in flight together to get past the barrier
+    in_flight = InFlight(threading.Barrier(6))
+    sources = [make_source(f"slow-{i}", hook=in_flight) for i in range(6)]
+    manager = IngestionManager(sources=sources, fetch_concurrency=6, fetch_timeout=10)
+    accepted, filtered = manager.initial_fetch_sources(store_filtered=True)
+    manager.stop()
+    print(f"\nPeak concurrent fetches: {in_flight.peak}")
+
+    assert len(accepted) + len(filtered) == 6
+    assert set(manager.last_fetched_timestamps) == {s.source_name for s in sources}
+    assert in_flight.peak == 6
+
+
+def test_concurrency_limit_is_respected(make_source):
+    # Fetches meet in pairs: two waves of two with a limit of 2
+    in_flight = InFlight(threading.Barrier(2))
+    sources = [make_source(f"limited-{i}", hook=in_flight) for i in range(4)]
+    manager = IngestionManager(sources=sources, fetch_concurrency=2, fetch_timeout=10)
+    accepted = manager.initial_fetch_sources()
+    manager.stop()
+
+    assert len(accepted) == 4
+    assert in_flight.peak == 2
+
+
+def test_slow_or_failing_source_does_not_block_the_cycle(make_source):
+    fast = make_source("fast")
+    hung = make_source("hung", hang=True)
+    broken = make_source("broken", fail=True)
+    manager = IngestionManager(
+        sources=[fast, hung, broken], fetch_concurrency=3, fetch_timeout=0.5
+    )
+    accepted, filtered = manager.continuous_fetch_sources(store_filtered=True)
+    manager.stop()
+
+    # The cycle returned while the hung fetch is still blocked
+    assert hung.calls == 1 and not hung.release.is_set()
+    assert [item.source for item in accepted + filtered] == ["fast"]
+    # The skipped sources keep their cursor and are retried next cycle
+    assert set(manager.last_fetched_timestamps) == {"fast"}
+
+
+def test_abandoned_fetch_neither_advances_state_nor_holds_a_slot(make_source):
+    hung = make_source("hung", hang=True)
+    fast = make_source("fast")
+    manager = IngestionManager(
+        sources=[hung, fast], fetch_concurrency=1, fetch_timeout=0.2
+    )
+    manager.continuous_fetch_sources()
+    # The abandoned thread is still blocked, yet the single slot is free again
+    accepted, filtered = manager.continuous_fetch_sources(store_filtered=True)
+    assert [item.source for item in accepted + filtered] == ["fast"]
+    assert fast.calls == 2 and hung.calls == 2
+
+    # The hung fetches return late: their items were dropped, so the cursor
+    # stays put and the next fetch returns them again
+    hung.release.set()
+    for future in list(manager._abandoned_futures):
+        future.result(timeout=5)
+    assert hung.produced == 0
+    accepted, filtered = manager.continuous_fetch_sources(store_filtered=True)
+    manager.stop()
+    assert "hung-0" in [item.id for item in accepted + filtered]
+
+
+def test_abandoned_threads_are_capped(make_source):
+    hung = make_source("hung", hang=True)
+    fast = make_source("fast")
+    manager = IngestionManager(
+        sources=[hung, fast], fetch_concurrency=1, fetch_timeout=0.2, max_abandoned=0
+    )
+    results = manager.fetch_sources()
+    manager.stop()
+    # No spare thread: the blocked fetch keeps the only one
+    assert isinstance(results[1][2], TimeoutError)
+    assert fast.calls == 0
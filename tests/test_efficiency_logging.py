@@ -1,6 +1,13 @@
+import asyncio
+from datetime import datetime, timezone
+
 from fastapi.testclient import TestClient
 
+import newsfeed.background_tasks as background_tasks
+from newsfeed.background_tasks import BackgroundTaskManager
+from newsfeed.ingestion.manager import IngestionManager
 from newsfeed.main import app
+from newsfeed.models import NewsItem
 
 client = TestClient(app)
 
@@ -41,3 +48,48 @@ def test_retrieve_all():
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list) or (isinstance(data, dict) and "error" in data)
+
+
+def test_pipelined_merge_burst_logs_latency_and_throughput(monkeypatch, make_source):
+    lines = []
+    monkeypatch.setattr(
+        background_tasks, "log_efficiency", lambda msg, step: lines.append(msg)
+    )
+    monkeypatch.setattr(background_tasks, "log_resource_usage", lambda step: None)
+    source = make_source("burst")
+    manager = BackgroundTaskManager(
+        ingestion_manager=IngestionManager(sources=[source], adaptive_polling=False),
+        accepted_items=[],
+        accepted_item_ids=set(),
+    )
+    items = [
+        NewsItem(
+            id=f"merge-{i}",
+            source="burst",
+            title=f"Outage {i}",
+            body="",
+            published_at=datetime.now(timezone.utc),
+            relevance_score=0.5,
+        )
+        for i in range(3)
+    ]
+
+    async def run():
+        await manager.pipeline.start()
+        # A burst: the fetched item goes through the pipeline into merge_items
+        await manager.pipeline.submit([source])
+        await manager.pipeline.join()
+        # Another one, merged directly
+        await manager.merge_items(items, [])
+        await manager.pipeline.stop()
+
+    asyncio.run(run())
+    manager.ingestion_manager.stop()
+    assert manager.initial_fetch_done
+    # Each burst ends with the merge queue empty and gets the serial cycle's lines
+    assert [line for line in lines if line.startswith("Items processed")] == [
+        "Items processed: 1 new items",
+        "Items processed: 3 new items",
+    ]
+    assert sum(line.startswith("Latency: ") for line in lines) == 2
+    assert sum(line.startswith("Throughput: ") for line in lines) == 2
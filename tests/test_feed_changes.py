@@ -0,0 +1,128 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from newsfeed.config import MAX_ITEMS
+from newsfeed.main import (
+    accepted_item_ids,
+    accepted_items,
+    app,
+    background_task_manager,
+)
+from newsfeed.models import NewsItem
+from newsfeed.ranking import RankingIndex
+
+client = TestClient(app)
+NOW = datetime.now(timezone.utc)
+
+
+def make_item(i, relevance=None):
+    return NewsItem(
+        id=f"delta-{i}",
+        source="test",
+        title=f"Outage report {i}",
+        body="Service degraded in several regions. " * 50,
+        published_at=NOW - timedelta(minutes=i % 500),
+        relevance_score=relevance if relevance is not None else 0.3 + (i % 11) / 20,
+    )
+
+
+def add(items):
+    for item in items:
+        if accepted_items.append(item):
+            accepted_item_ids.add(item.id)
+    background_task_manager.trim_accepted_items()
+
+
+@pytest.fixture(autouse=True)
+def store():
+    accepted_items.clear()
+    accepted_item_ids.clear()
+    add(make_item(i) for i in range(MAX_ITEMS))
+    yield
+    accepted_items.clear()
+    accepted_item_ids.clear()
+
+
+def current_version():
+    return int(client.get("/retrieve").headers["X-Feed-Version"])
+
+
+def test_delta_has_added_items_and_evicted_ids():
+    version = current_version()
+    lowest = [item.id for item in accepted_items.top(offset=MAX_ITEMS - 3)]
+    add(make_item(1000 + i, relevance=0.99) for i in range(3))
+
+    body = client.get("/retrieve/changes", params={"since_version": version}).json()
+    assert body["full"] is False
+    assert body["version"] == version + 6  # 3 added + 3 evicted
+    assert [item["id"] for item in body["added"]] == [
+        f"delta-{1000 + i}" for i in range(3)
+    ]
+    assert all(item["final_score"] is not None for item in body["added"])
+    assert sorted(body["removed"]) == sorted(lowest)
+
+    # Nothing new since the latest version
+    body = client.get(
+        "/retrieve/changes", params={"since_version": body["version"]}
+    ).json()
+    assert body["added"] == [] and body["removed"] == [] and not body["full"]
+
+
+def test_client_replaying_deltas_matches_the_feed():
+    rng = random.Random(0)
+    response = client.get("/retrieve")
+    local = {item["id"] for item in response.json()}
+    version = int(response.headers["X-Feed-Version"])
+    next_id = 2000
+    for _ in range(20):
+        burst = rng.randint(0, 8)
+        add(make_item(next_id + i) for i in range(burst))
+        next_id += burst
+        body = client.get(
+            "/retrieve/changes", params={"since_version": version, "fields": "id"}
+        ).json()
+        assert not body["full"]
+        local -= set(body["removed"])
+        local |= {item["id"] for item in body["added"]}
+        version = body["version"]
+        assert local == {item.id for item in accepted_items}
+
+
+def test_old_or_unknown_versions_get_a_full_snapshot():
+    for since in (0, current_version() + 10):
+        body = client.get("/retrieve/changes", params={"since_version": since}).json()
+        assert body["full"] is True
+        assert body["removed"] == []
+        assert [item["id"] for item in body["added"]] == [
+            item["id"] for item in client.get("/retrieve").json()
+        ]
+        assert body["version"] == current_version()
+
+
+def test_change_log_is_bounded():
+    index = RankingIndex(change_log_size=10)
+    start = index.version
+    for i in range(25):
+        index.append(make_item(i))
+    assert len(index._log) == 10
+    assert index.changes_since(start) is None
+    assert index.changes_since(index.version - 11) is None
+    added, removed, version = index.changes_since(index.version - 10)
+    assert len(added) == 10 and removed == [] and version == index.version
+
+
+def test_delta_bandwidth_is_proportional_to_churn():
+    version = current_version()
+    full_bytes = len(client.get("/retrieve").content)
+    add(make_item(3000 + i, relevance=0.99) for i in range(2))
+    delta_bytes = len(
+        client.get("/retrieve/changes", params={"since_version": version}).content
+    )
+    print(
+        f"\nPoll after 2 new items: full feed {full_bytes / 1024:.1f}KiB, "
+        f"delta {delta_bytes / 1024:.1f}KiB"
+    )
+    assert delta_bytes < full_bytes / 20
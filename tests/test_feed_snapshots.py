@@ -0,0 +1,172 @@
+import gzip
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from newsfeed.main import accepted_item_ids, accepted_items, app, feed_snapshots
+from newsfeed.models import NewsItem
+from newsfeed.ranking import RankingIndex
+from newsfeed.snapshots import FeedSnapshots, etag_matches, negotiate_encoding
+
+client = TestClient(app)
+NOW = datetime.now(timezone.utc)
+
+
+def make_item(i):
+    return NewsItem(
+        id=f"snap-{i}",
+        source="test",
+        title=f"Outage report {i}",
+        body="Service degraded in several regions. " * 100,
+        published_at=NOW - timedelta(minutes=i),
+        relevance_score=0.5 + (i % 7) / 20,
+    )
+
+
+@pytest.fixture(autouse=True)
+def store():
+    accepted_items.clear()
+    accepted_item_ids.clear()
+    accepted_items.extend(make_item(i) for i in range(100))
+    yield
+    accepted_items.clear()
+
+
+def test_unchanged_feed_answers_304_and_is_serialized_once():
+    builds = feed_snapshots.stats()["builds"]
+    first = client.get("/retrieve")
+    etag = first.headers["ETag"]
+    version = int(first.headers["X-Feed-Version"])
+    assert len(first.json()) == 100
+
+    for _ in range(20):
+        response = client.get("/retrieve", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        # A 304 carries the caching headers of the 200 it stands for
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["X-Feed-Version"] == str(version)
+    assert client.get("/retrieve").json() == first.json()
+    assert feed_snapshots.stats()["builds"] == builds + 1
+
+    accepted_items.append(make_item(1000))
+    response = client.get("/retrieve", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert int(response.headers["X-Feed-Version"]) == version + 1
+    assert len(response.json()) == 101
+
+
+class RacingIndex(RankingIndex):
+    """Index whose page() runs while another thread appends an item"""
+
+    def page(self, *args, **kwargs):
+        self.writer = threading.Thread(target=self.append, args=(make_item(len(self)),))
+        self.writer.start()
+        # Blocked by the index lock when the page is read under it
+        self.writer.join(timeout=0.2)
+        return super().page(*args, **kwargs)
+
+
+def test_snapshot_version_matches_its_body_under_appends():
+    index = RacingIndex()
+    index.extend(make_item(i) for i in range(5))
+    snapshot = FeedSnapshots(index).get()
+    index.writer.join()
+    # The item appended during the build is in the next version, not this body
+    assert len(json.loads(snapshot.body())) == 5
+    assert index.version == snapshot.version + 1
+
+
+def test_each_query_variant_has_its_own_etag():
+    full = client.get("/retrieve")
+    limited = client.get("/retrieve", params={"limit": 10})
+    projected = client.get("/retrieve", params={"fields": "id,title"})
+    etags = {r.headers["ETag"] for r in (full, limited, projected)}
+    assert len(etags) == 3
+    # Same feed version, different bodies
+    assert len({r.headers["X-Feed-Version"] for r in (full, limited, projected)}) == 1
+
+    # The full feed's validator does not revalidate a limited page
+    response = client.get(
+        "/retrieve",
+        params={"limit": 10},
+        headers={"If-None-Match": full.headers["ETag"]},
+    )
+    assert response.status_code == 200
+    response = client.get(
+        "/retrieve",
+        params={"limit": 10},
+        headers={"If-None-Match": limited.headers["ETag"]},
+    )
+    assert response.status_code == 304
+
+
+def test_precompressed_gzip_matches_identity():
+    plain = client.get("/retrieve", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/retrieve", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in plain.headers
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.headers["Vary"] == "Accept-Encoding"
+    assert zipped.json() == plain.json()
+
+    snapshot = feed_snapshots.get()
+    assert gzip.decompress(snapshot.body("gzip")) == snapshot.body()
+    # Compressed once per version
+    assert snapshot.body("gzip") is snapshot.body("gzip")
+    print(
+        f"\nSnapshot: {len(snapshot.body()) / 1024:.0f}KiB, "
+        f"gzip {len(snapshot.body('gzip')) / 1024:.1f}KiB"
+    )
+    assert len(snapshot.body("gzip")) < len(snapshot.body()) / 5
+
+
+def test_precompressed_brotli():
+    brotli = pytest.importorskip("brotli")
+    response = client.get("/retrieve", headers={"Accept-Encoding": "br, gzip"})
+    assert response.headers["Content-Encoding"] == "br"
+    snapshot = feed_snapshots.get()
+    assert brotli.decompress(snapshot.body("br")) == snapshot.body()
+
+
+def test_encoding_negotiation_and_etag_comparison():
+    assert negotiate_encoding(None) == "identity"
+    assert negotiate_encoding("gzip;q=0, deflate") == "identity"
+    assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("*") in ("br", "gzip")
+    assert etag_matches('"a", W/"b"', 'W/"b"')
+    assert etag_matches("*", 'W/"b"')
+    assert not etag_matches('"a"', 'W/"b"')
+
+
+def test_polling_cost_unchanged_vs_changing_feed():
+    polls = 50
+    etag = client.get("/retrieve").headers["ETag"]
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        client.get("/retrieve", headers={"If-None-Match": etag})
+    not_modified = (time.perf_counter() - start) / polls
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        client.get("/retrieve")
+    cached = (time.perf_counter() - start) / polls
+
+    start = time.perf_counter()
+    for i in range(polls):
+        # A new version before every poll: serialized from scratch each time
+        accepted_items.append(make_item(2000 + i))
+        client.get("/retrieve")
+    rebuilt = (time.perf_counter() - start) / polls
+
+    print(
+        f"\nPer poll: 304 {not_modified * 1000:.2f}ms, cached snapshot "
+        f"{cached * 1000:.2f}ms, rebuilt {rebuilt * 1000:.2f}ms"
+    )
+    assert not_modified < rebuilt / 2
+    assert cached < rebuilt
@@ -0,0 +1,289 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from newsfeed.feed_stream import DISCONNECT, FeedBroadcaster
+from newsfeed.models import NewsItem
+from newsfeed.ranking import RankingIndex
+
+NOW = datetime.now(timezone.utc)
+SUFFIX = " (critical and urgent for a IT manager of a company)"
+
+
+def make_item(i, label="Outage", source="reddit/sysadmin"):
+    return NewsItem(
+        id=f"stream-{i}",
+        source=source,
+        title=f"{label} report {i}",
+        body="Service degraded in several regions. " * 20,
+        published_at=NOW - timedelta(minutes=i % 100),
+        relevance_score=0.5 + (i % 7) / 20,
+        top_relevant_label=label + SUFFIX,
+    )
+
+
+def parse_events(data: bytes):
+    """(event, id, data) of every complete SSE message in `data`"""
+    events = []
+    for block in data.decode().split("\n\n"):
+        fields = {}
+        for line in block.split("\n"):
+            if line and not line.startswith(":"):
+                name, _, value = line.partition(": ")
+                fields[name] = value
+        if "event" in fields:
+            events.append(
+                (fields["event"], fields.get("id"), json.loads(fields["data"]))
+            )
+    return events
+
+
+async def read_until(broadcaster, client, count, event="item"):
+    """Events of a client up to its `count`-th `event` event"""
+    received = []
+    stream = broadcaster.events(client)
+    try:
+        async for chunk in stream:
+            received.extend(parse_events(chunk))
+            if sum(1 for e in received if e[0] == event) >= count:
+                return received
+    finally:
+        await stream.aclose()
+    return received
+
+
+def test_filters_and_live_push():
+    index = RankingIndex()
+    broadcaster = FeedBroadcaster(index)
+
+    async def run():
+        clients = {
+            "all": broadcaster.subscribe(),
+            "outage": broadcaster.subscribe(labels=["outage"]),
+            "vulnerability": broadcaster.subscribe(labels=["Vulnerability"]),
+            "ars": broadcaster.subscribe(sources=["ars_technica"]),
+            "reddit": broadcaster.subscribe(sources=["reddit"]),
+        }
+        expected = {"all": 6, "outage": 3, "vulnerability": 3, "ars": 2, "reddit": 4}
+        readers = {
+            name: asyncio.create_task(read_until(broadcaster, client, expected[name]))
+            for name, client in clients.items()
+        }
+        await asyncio.sleep(0)
+        for i in range(6):
+            index.append(
+                make_item(
+                    i,
+                    label="Outage" if i % 2 else "Vulnerability",
+                    source="ars_technica" if i % 3 == 0 else f"reddit/r{i}",
+                )
+            )
+        return {name: await task for name, task in readers.items()}
+
+    received = asyncio.run(run())
+    items = {
+        name: [(int(e[1]), e[2]) for e in events if e[0] == "item"]
+        for name, events in received.items()
+    }
+    assert [item["id"] for _, item in items["all"]] == [f"stream-{i}" for i in range(6)]
+    versions = [version for version, _ in items["all"]]
+    assert versions == sorted(versions) and versions[-1] == index.version
+    assert all(item["final_score"] is not None for _, item in items["all"])
+    assert {item["id"] for _, item in items["outage"]} == {
+        "stream-1",
+        "stream-3",
+        "stream-5",
+    }
+    assert {item["id"] for _, item in items["vulnerability"]} == {
+        "stream-0",
+        "stream-2",
+        "stream-4",
+    }
+    assert {item["id"] for _, item in items["ars"]} == {"stream-0", "stream-3"}
+    assert len(items["reddit"]) == 4
+    # Each stream starts with a sync event carrying the version it starts from
+    assert all(events[0][0] == "sync" for events in received.values())
+    assert broadcaster.stats()["clients"] == 0
+
+
+def test_resume_from_version():
+    index = RankingIndex(change_log_size=20)
+    broadcaster = FeedBroadcaster(index)
+    index.extend(make_item(i) for i in range(5))
+    since = index.version
+    index.extend(
+        make_item(i, label="Vulnerability" if i == 6 else "Outage") for i in range(5, 8)
+    )
+
+    async def run():
+        resumed = broadcaster.subscribe(since_version=since)
+        filtered = broadcaster.subscribe(labels=["outage"], since_version=since)
+        too_old = broadcaster.subscribe(since_version=since - 100)
+        return [
+            await read_until(broadcaster, client, 1, event="sync")
+            for client in (resumed, filtered, too_old)
+        ]
+
+    resumed, filtered, too_old = asyncio.run(run())
+    assert {e[2]["id"] for e in resumed if e[0] == "item"} == {
+        "stream-5",
+        "stream-6",
+        "stream-7",
+    }
+    assert resumed[-1] == (
+        "sync",
+        str(index.version),
+        {"version": index.version, "replayed": 3},
+    )
+    assert {e[2]["id"] for e in filtered if e[0] == "item"} == {
+        "stream-5",
+        "stream-7",
+    }
+    assert too_old[0] == ("reset", None, {"version": index.version})
+    assert len([e for e in too_old if e[0] == "item"]) == 8
+
+
+def test_slow_consumer_drop_policies():
+    async def run(drop_policy):
+        index = RankingIndex()
+        broadcaster = FeedBroadcaster(index, buffer_size=10, drop_policy=drop_policy)
+        client = broadcaster.subscribe()
+        # The client reads nothing while 25 items are accepted
+        index.extend(make_item(i) for i in range(25))
+        await asyncio.sleep(0)
+        buffered = len(client.buffer)
+        events = []
+        stream = broadcaster.events(client)
+        try:
+            events.extend(parse_events(await stream.__anext__()))
+            if not client.closed:
+                events.extend(parse_events(await stream.__anext__()))
+        except StopAsyncIteration:
+            pass
+        finally:
+            await stream.aclose()
+        return buffered, events, broadcaster.stats()
+
+    buffered, events, stats = asyncio.run(run("drop_oldest"))
+    assert buffered == 10
+    assert events[1] == ("dropped", None, {"dropped": 15})
+    assert [e[2]["id"] for e in events[2:]] == [f"stream-{i}" for i in range(15, 25)]
+    assert stats["dropped"] == 15 and stats["disconnected"] == 0
+
+    buffered, events, stats = asyncio.run(run(DISCONNECT))
+    assert buffered == 0
+    assert [e[0] for e in events] == ["sync"]
+    assert stats["disconnected"] == 1 and stats["clients"] == 0
+
+
+def test_fan_out_cost_stays_flat():
+    items_per_run = 200
+
+    async def run(n_clients):
+        index = RankingIndex()
+        broadcaster = FeedBroadcaster(index, buffer_size=items_per_run)
+        clients = [broadcaster.subscribe() for _ in range(n_clients)]
+
+        async def consume(client):
+            received = 0
+            async for chunk in broadcaster.events(client):
+                received += chunk.count(b"event: item")
+                if received >= items_per_run:
+                    break
+
+        readers = [asyncio.create_task(consume(client)) for client in clients]
+        await asyncio.sleep(0)
+        items = [make_item(i) for i in range(items_per_run)]
+
+        start = time.perf_counter()
+        for item in items:
+            index.append(item)
+        accept = (time.perf_counter() - start) / items_per_run
+        await asyncio.gather(*readers)
+        deliver = (time.perf_counter() - start) / (items_per_run * n_clients)
+        return accept, deliver
+
+    results = {n: asyncio.run(run(n)) for n in (1, 10, 100, 1000)}
+    print()
+    for n, (accept, deliver) in results.items():
+        print(
+            f"{n:5d} clients: accept {accept * 1e6:6.1f}us/item, "
+            f"fan-out + delivery {deliver * 1e6:6.2f}us/item/client"
+        )
+    # Accepting an item does not depend on the number of clients ...
+    assert results[1000][0] < 3 * results[1][0]
+    # ... and the fan-out costs the same per client
+    assert results[1000][1] < 3 * results[10][1]
+
+
+def test_stream_endpoint_over_http():
+    import uvicorn
+
+    from newsfeed.main import accepted_item_ids, accepted_items, app
+
+    accepted_items.clear()
+    accepted_item_ids.clear()
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, lifespan="off", log_level="warning"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    url = f"http://127.0.0.1:{port}/stream"
+
+    def sse_events(response):
+        data = b""
+        for chunk in response.iter_content(chunk_size=None):
+            head, sep, data = (data + chunk).rpartition(b"\n\n")
+            yield from parse_events(head + sep)
+
+    def read_events(stream, count, event="item"):
+        events = []
+        for received in stream:
+            events.append(received)
+            if sum(1 for e in events if e[0] == event) >= count:
+                break
+        return events
+
+    try:
+        for _ in range(100):
+            if server.started:
+                break
+            time.sleep(0.05)
+
+        with requests.get(
+            url, params={"label": "outage"}, stream=True, timeout=10
+        ) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            stream = sse_events(response)
+            read_events(stream, 1, event="sync")
+            start = time.perf_counter()
+            accepted_items.append(make_item(100, label="Vulnerability"))
+            accepted_items.append(make_item(101, label="Outage"))
+            events = read_events(stream, 1)
+            latency = time.perf_counter() - start
+        assert [e[2]["id"] for e in events] == ["stream-101"]
+        last_event_id = events[-1][1]
+        print(f"\nAccepted -> received over HTTP: {latency * 1000:.1f}ms")
+
+        # Accepted while disconnected: replayed on reconnect
+        accepted_items.append(make_item(102, label="Outage"))
+        with requests.get(
+            url,
+            params={"label": "outage"},
+            headers={"Last-Event-ID": last_event_id},
+            stream=True,
+            timeout=10,
+        ) as response:
+            events = read_events(sse_events(response), 1, event="sync")
+        assert [e[2]["id"] for e in events if e[0] == "item"] == ["stream-102"]
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        accepted_items.clear()
+        accepted_item_ids.clear()
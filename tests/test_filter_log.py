@@ -0,0 +1,83 @@
+import json
+import tracemalloc
+
+from fastapi.testclient import TestClient
+
+from newsfeed.ingestion.filter_log import FilterLog
+from newsfeed.ingestion.filtering import ZERO_SHOT_LABELS
+from newsfeed.main import app
+
+
+def make_entry(i: int) -> dict:
+    scores = [(label, (i + j) % 10 / 10) for j, label in enumerate(ZERO_SHOT_LABELS)]
+    return {
+        "filter": "zero_shot",
+        "id": f"item-{i}",
+        "stage": "title+body2",
+        "decision": "pass" if i % 2 else "filtered",
+        "log": f"[PASS] item-{i}: a long log message " * 3,
+        "top_relevant_label": ZERO_SHOT_LABELS[0],
+        "top_relevant_score": 0.5,
+        "all_scores": scores,
+    }
+
+
+def test_ring_buffer_is_bounded_and_keeps_newest():
+    log = FilterLog(labels=ZERO_SHOT_LABELS, capacity=100)
+    for i in range(250):
+        log.append(make_entry(i))
+    assert len(log) == 100
+    records, next_since = log.query()
+    assert [r["id"] for r in records] == [f"item-{i}" for i in range(150, 250)]
+    assert next_since == 250
+    assert records[-1]["all_scores"][ZERO_SHOT_LABELS[1]] == (249 + 1) % 10 / 10
+
+
+def test_query_since_and_decision():
+    log = FilterLog(labels=ZERO_SHOT_LABELS, capacity=100)
+    for i in range(10):
+        log.append(make_entry(i))
+    records, next_since = log.query(since=6)
+    assert [r["seq"] for r in records] == [7, 8, 9, 10]
+    records, _ = log.query(decision="pass")
+    assert all(r["decision"] == "pass" for r in records) and len(records) == 5
+    records, next_since = log.query(limit=3)
+    assert len(records) == 3 and next_since == 3
+    log.clear()
+    assert len(log) == 0 and log.query(since=next_since)[0] == []
+
+
+def test_memory_stays_flat_with_traffic():
+    log = FilterLog(labels=ZERO_SHOT_LABELS, capacity=1000)
+    for i in range(1000):
+        log.append(make_entry(i))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(5000):
+        log.append(make_entry(i))
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"\nMemory growth after 5000 more records: {growth / 1024:.1f} KiB")
+    assert growth < 200 * 1024
+
+
+def test_spill_to_rotating_file(tmp_path):
+    path = tmp_path / "filter_log.jsonl"
+    log = FilterLog(labels=ZERO_SHOT_LABELS, capacity=10, spill_path=str(path))
+    for i in range(20):
+        log.append(make_entry(i))
+    lines = path.read_text().splitlines()
+    assert len(lines) == 20
+    assert json.loads(lines[0])["log"].startswith("[PASS] item-0")
+
+
+def test_filter_log_endpoint():
+    client = TestClient(app)
+    response = client.get("/debug/filter-log", params={"decision": "filtered"})
+    assert response.status_code == 200
+    body = response.json()
+    assert "next_since" in body
+    assert all(r["decision"] == "filtered" for r in body["records"])
+    assert client.get("/debug/filter-log", params={"decision": "x"}).status_code == 422
+    for params in ({"limit": 0}, {"limit": -1}, {"limit": 10**9}, {"since": -1}):
+        assert client.get("/debug/filter-log", params=params).status_code == 422
@@ -4,7 +4,12 @@ from collections import Counter
 
 import pytest
 
-from newsfeed.ingestion.filtering import zero_shot_it_relevance_filter
+from newsfeed.ingestion.filtering import (
+    get_classification_cache,
+    get_zero_shot_classifier,
+    zero_shot_it_relevance_filter,
+    zero_shot_it_relevance_filter_batch,
+)
 from newsfeed.models import NewsItem
 
 # ANSI color codes
@@ -88,3 +93,38 @@ def test_metrics():
     # Optionally, assert minimum performance
     # assert precision > 0.7
     # assert recall > 0.7
+
+
+@pytest.mark.parametrize("backend", ["stub", None])
+@pytest.mark.parametrize("batch_size", [1, 8])
+def test_batch_filter_matches_single_item_filter(batch_size, backend):
+    if get_zero_shot_classifier(backend) is None:
+        pytest.skip(f"Classifier backend {backend or 'default'} could not be loaded")
+    cache = get_classification_cache(backend)
+
+    # Prefilter and cache off: every item goes through the model both ways
+    cache.clear()
+    single = [
+        zero_shot_it_relevance_filter(
+            NewsItem(**item), min_score=0.08, prefilter_mode="off", backend=backend
+        )
+        for item in test_cases
+    ]
+    cache.clear()
+    batched = zero_shot_it_relevance_filter_batch(
+        [NewsItem(**item) for item in test_cases],
+        min_score=0.08,
+        batch_size=batch_size,
+        prefilter_mode="off",
+        backend=backend,
+    )
+
+    assert len(batched) == len(single) == len(test_cases)
+    assert any(label == 1 for label, *_ in single)
+    assert any(label == 0 for label, *_ in single)
+    for (s_label, s_score, s_top, _), (b_label, b_score, b_top, _) in zip(
+        single, batched
+    ):
+        assert s_label == b_label
+        assert s_top == b_top
+        assert s_score == pytest.approx(b_score, abs=1e-4)
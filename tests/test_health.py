@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import newsfeed.ingestion.classifier_backends as classifier_backends
+from newsfeed.background_tasks import BackgroundTaskManager
+from newsfeed.ingestion.manager import IngestionManager
+from newsfeed.ingestion.mock_source_data import MockSource
+from newsfeed.main import app
+
+client = TestClient(app)
+
+
+def test_liveness():
+    response = client.get("/healthz/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_not_ready_before_initial_fetch():
+    # No lifespan has run for this client, so the initial fetch never happened
+    response = client.get("/healthz/ready")
+    assert response.status_code == 503
+    assert response.json()["initial_fetch_done"] is False
+
+
+def test_startup_does_not_block_and_becomes_ready(monkeypatch):
+    monkeypatch.setattr(classifier_backends, "DEFAULT_CLASSIFIER_BACKEND", "stub")
+    source = MockSource()
+    manager = BackgroundTaskManager(
+        ingestion_manager=IngestionManager(sources=[source], interval=3600),
+        accepted_items=[],
+        accepted_item_ids=set(),
+    )
+    lifespan = manager.create_lifespan_context()
+
+    async def run():
+        start = time.perf_counter()
+        async with lifespan(FastAPI()):
+            startup_seconds = time.perf_counter() - start
+            deadline = time.perf_counter() + 30
+            while not manager.readiness()["ready"]:
+                assert time.perf_counter() < deadline, manager.readiness()
+                await asyncio.sleep(0.05)
+            ready_seconds = time.perf_counter() - start
+        return startup_seconds, ready_seconds
+
+    startup_seconds, ready_seconds = asyncio.run(run())
+    print(
+        f"\nStartup returned in {startup_seconds:.3f}s, ready after {ready_seconds:.3f}s"
+    )
+    assert startup_seconds < 1.0
+    assert manager.readiness()["classifiers"] == {"stub": True}
+    assert manager.accepted_items
+
+
+def test_failed_initial_fetch_is_not_reported_as_done(monkeypatch):
+    manager = BackgroundTaskManager(
+        ingestion_manager=IngestionManager(sources=[MockSource()], interval=3600),
+        accepted_items=[],
+        accepted_item_ids=set(),
+    )
+
+    async def failing_initial_fetch():
+        raise RuntimeError("all sources down")
+
+    async def no_ingestion():
+        pass
+
+    monkeypatch.setattr(manager, "initial_fetch_async", failing_initial_fetch)
+    monkeypatch.setattr(manager, "background_ingest_async", no_ingestion)
+    manager.pipeline = None
+    asyncio.run(manager.run_ingestion_async())
+    assert manager.readiness()["initial_fetch_done"] is False
+    manager.ingestion_manager.stop()
@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from newsfeed.ingestion.ars_technica_source import ArsTechnicaSource
+from newsfeed.ingestion.base_source import FetchToken, running_fetch
+from newsfeed.ingestion.http_client import HttpClient
+from newsfeed.ingestion.reddit_source import RedditSource
+from newsfeed.main import app
+
+NOW = int(time.time())
+
+LISTING = json.dumps(
+    {
+        "data": {
+            "children": [
+                {
+                    "data": {
+                        "id": f"post{i}",
+                        "title": f"Outage number {i}",
+                        "selftext": "Services are down.",
+                        "created_utc": NOW - i * 60,
+                    }
+                }
+                for i in range(50)
+            ]
+        }
+    }
+).encode()
+
+RSS = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test feed</title>
+{"".join(
+    f"<item><title>Patch {i} released</title><link>https://example.com/{i}</link>"
+    f"<guid>https://example.com/{i}</guid><description>Security fix {i}</description>"
+    f"<pubDate>{time.strftime('%a, %d %b %Y %H:%M:%S +0000', time.gmtime(NOW - i * 60))}</pubDate></item>"
+    for i in range(10)
+)}
+</channel></rss>""".encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        body, content_type = (
+            (RSS, "application/rss+xml")
+            if self.path.startswith("/rss")
+            else (LISTING, "application/json")
+        )
+        etag = f'"{hash(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_reddit_conditional_get_and_connection_reuse(server_url):
+    source = RedditSource("sysadmin", source_name="reddit/http-test")
+    source.base_url = server_url
+    source.http = HttpClient()
+
+    first = source.fetch_news(posts_limit=50)
+    assert len(first) == 50
+    for _ in range(4):
+        assert source.fetch_news(posts_limit=50) == []
+
+    stats = source.http.stats()["reddit/http-test"]
+    print(f"\nReddit HTTP stats: {stats}")
+    assert stats["requests"] == 5
+    assert stats["not_modified"] == 4
+    assert stats["not_modified_rate"] == pytest.approx(0.8)
+    assert stats["bytes"] == len(LISTING)
+    # One connection for five requests
+    assert stats["new_connections"] == 1
+    assert stats["connection_reuse_rate"] == pytest.approx(0.8)
+
+
+def test_forget_forces_a_full_download(server_url):
+    client = HttpClient()
+    url = f"{server_url}/r/x/new.json"
+    assert client.get(url, source_name="s") is not None
+    assert client.get(url, source_name="s") is None
+    client.forget("s")
+    assert client.get(url, source_name="s") is not None
+
+
+def test_abandoned_fetch_stores_no_validators(server_url):
+    client = HttpClient()
+    url = f"{server_url}/r/x/new.json"
+    token = FetchToken()
+    token.cancel()
+    with running_fetch(token):
+        assert client.get(url, source_name="s") is not None
+    # Its body was never ingested: the next fetch downloads it again
+    assert client.get(url, source_name="s") is not None
+
+
+def test_validators_of_cursor_urls_stay_bounded(server_url):
+    client = HttpClient(validator_capacity=4)
+    for i in range(50):
+        # A new `before` cursor every poll, as in incremental Reddit fetches
+        client.get(f"{server_url}/r/x/new.json?before=t3_{i}", source_name="s")
+    assert len(client._validators) == 4
+    # The most recent URLs keep their validators
+    assert (
+        client.get(f"{server_url}/r/x/new.json?before=t3_49", source_name="s") is None
+    )
+    client.forget("s")
+    assert len(client._validators) == 0
+
+
+def test_ars_feed_is_parsed_from_pooled_bytes(server_url):
+    source = ArsTechnicaSource(source_name="ars-http-test")
+    source.feed_url = f"{server_url}/rss"
+    source.http = HttpClient()
+
+    items = source.fetch_news(posts_limit=5)
+    assert [item.title for item in items] == [f"Patch {i} released" for i in range(5)]
+    # Unchanged feed: 304, nothing parsed
+    assert source.fetch_news(posts_limit=5) == []
+    assert source.http.stats()["ars-http-test"]["not_modified"] == 1
+
+
+def test_http_stats_endpoint():
+    response = TestClient(app).get("/debug/http")
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
@@ -0,0 +1,27 @@
+import time
+
+from newsfeed.ingestion.classifier_backends import get_classifier_backend
+from newsfeed.ingestion.filtering import ZERO_SHOT_LABELS
+from newsfeed.ingestion.inference_pool import InferenceWorkerPool
+
+
+def test_worker_pool_matches_in_process_scores():
+    texts = [
+        f"Outage number {i} hits the API" if i % 3 == 0 else f"Weekly digest {i}"
+        for i in range(40)
+    ]
+    expected = get_classifier_backend("stub").score(texts, ZERO_SHOT_LABELS)
+
+    pool = InferenceWorkerPool(
+        "stub", num_workers=2, threads_per_worker=1, queue_size=3
+    )
+    try:
+        start = time.perf_counter()
+        # Small shards and a short queue: exercises back-pressure and reordering
+        matrix = pool.score(texts, ZERO_SHOT_LABELS, shard_size=4)
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    print(f"\n2 workers scored {len(texts)} texts in {elapsed:.2f}s (incl. spawn)")
+    assert matrix == expected
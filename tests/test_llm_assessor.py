@@ -0,0 +1,85 @@
+import pytest
+import torch
+
+from newsfeed.ingestion.llm_assessor import (
+    NOT_RELEVANT,
+    PROMPT_PREFIX,
+    PROMPT_SUFFIX,
+    RELEVANT,
+    LLMAssessor,
+    build_article_text,
+)
+from newsfeed.models import NewsItem
+
+# Small causal LM to check the batching/prefix-cache mechanics (skipped offline)
+TINY_MODEL = "sshleifer/tiny-gpt2"
+
+ITEMS = [
+    NewsItem(
+        id="assess-1",
+        source="test",
+        title="Ransomware attack shuts down hospital systems",
+        body="Attackers encrypted servers across the network.",
+        published_at="2025-06-12T12:05:00Z",
+    ),
+    NewsItem(
+        id="assess-2",
+        source="test",
+        title="New phone colors announced",
+        body="",
+        published_at="2025-06-12T12:05:00Z",
+    ),
+    NewsItem(
+        id="assess-3",
+        source="test",
+        title="Critical vulnerability in OpenSSL",
+        body="A remote code execution flaw affects all versions. Patch now.",
+        published_at="2025-06-12T12:05:00Z",
+    ),
+]
+
+
+def test_cached_verdicts_skip_the_model(tmp_path):
+    path = str(tmp_path / "assessment.sqlite3")
+    assessor = LLMAssessor(model_name="unused/model", cache_path=path)
+    assessor.cache.put(assessor.cache_key(ITEMS[0]), RELEVANT)
+    assessor.cache.put(assessor.cache_key(ITEMS[1]), NOT_RELEVANT)
+    assessor.cache.flush()
+
+    # A fresh instance (new run) reads the verdicts back from disk
+    assessor = LLMAssessor(model_name="unused/model", cache_path=path)
+    verdicts = assessor.assess(ITEMS[:2])
+    assert verdicts == {"assess-1": RELEVANT, "assess-2": NOT_RELEVANT}
+    assert assessor.model is None
+
+
+@pytest.fixture(scope="module")
+def tiny_assessor():
+    assessor = LLMAssessor(
+        model_name=TINY_MODEL, batch_size=2, quantize_4bit=False, cache_path=None
+    )
+    if not assessor.load():
+        pytest.skip("Assessor test model unavailable")
+    return assessor
+
+
+def test_batched_prefix_cache_matches_full_prompt(tiny_assessor):
+    articles = [build_article_text(item) for item in ITEMS]
+    batched = tiny_assessor.branch_logits(articles)
+
+    tokenizer, model = tiny_assessor.tokenizer, tiny_assessor.model
+    for row, article in enumerate(articles):
+        ids = (
+            tokenizer(PROMPT_PREFIX).input_ids
+            + tokenizer(
+                PROMPT_SUFFIX.format(article=article), add_special_tokens=False
+            ).input_ids
+            + tiny_assessor._forced_ids
+        )
+        with torch.no_grad():
+            logits = model(input_ids=torch.tensor([ids])).logits[0, -1]
+        reference = logits[list(tiny_assessor._branch_ids)]
+        assert torch.allclose(batched[row], reference, atol=1e-4)
+
+    verdicts = tiny_assessor.assess(ITEMS)
+    assert set(verdicts.values()) <= {RELEVANT, NOT_RELEVANT}
@@ -0,0 +1,64 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from newsfeed.ingestion.batching_service import MicroBatchClassifier
+from newsfeed.main import app
+from newsfeed.models import NewsItem
+
+
+def make_item(i: int) -> NewsItem:
+    return NewsItem(
+        id=f"micro-{i}",
+        source="test",
+        title=f"Outage {i} takes down the API" if i % 2 else f"Team lunch {i}",
+        body="",
+        published_at="2025-06-12T12:05:00Z",
+    )
+
+
+def test_concurrent_requests_are_grouped_into_batches():
+    service = MicroBatchClassifier(max_batch_size=8, max_wait_ms=50, backend="stub")
+
+    async def run():
+        results = await asyncio.gather(
+            *(service.classify(make_item(i)) for i in range(20))
+        )
+        await service.stop()
+        return results
+
+    results = asyncio.run(run())
+    stats = service.stats()
+    print(f"\nMicro-batching stats: {stats}")
+
+    assert stats["requests"] == 20
+    assert stats["batch_size_histogram"] == {4: 1, 8: 2}
+    # Results come back to the right caller
+    assert [bool(binary_label) for binary_label, _, _, _ in results] == [
+        bool(i % 2) for i in range(20)
+    ]
+
+
+def test_lone_request_is_flushed_after_max_wait():
+    service = MicroBatchClassifier(max_batch_size=8, max_wait_ms=30, backend="stub")
+
+    async def run():
+        # Far below max_batch_size: only the max_wait deadline can flush them
+        # (the timeout only guards against a hang, it is not measured)
+        for i in range(2):
+            await asyncio.wait_for(service.classify(make_item(i)), timeout=10)
+        await service.stop()
+
+    asyncio.run(run())
+    stats = service.stats()
+    # Each lone request went out on its own, as a batch of one
+    assert stats["batch_size_histogram"] == {1: 2}
+    assert stats["queue_depth"] == 0
+
+
+def test_classifier_queue_endpoint():
+    response = TestClient(app).get("/debug/classifier-queue")
+    assert response.status_code == 200
+    body = response.json()
+    for key in ("queue_depth", "batch_size_histogram", "wait_ms"):
+        assert key in body
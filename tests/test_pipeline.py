@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from newsfeed.ingestion.manager import IngestionManager
+from newsfeed.ingestion.pipeline import IngestionPipeline
+from newsfeed.main import app
+
+
+class Counter:
+    def __init__(self):
+        self.counts = {"fetched": 0, "classified": 0}
+        self.max_lag = 0
+        self._lock = threading.Lock()
+
+    def add(self, key):
+        with self._lock:
+            self.counts[key] += 1
+            lag = self.counts["fetched"] - self.counts["classified"]
+            self.max_lag = max(self.max_lag, lag)
+
+
+def slow_classifier(manager, seconds_per_item=0.0, counter=None, on_classify=None):
+    classify = manager.classify_items
+
+    def classify_items(items, backend=None):
+        time.sleep(seconds_per_item * len(items))
+        if on_classify is not None:
+            on_classify(items)
+        if counter is not None:
+            counter.add("classified")
+        return classify(items, backend)
+
+    manager.classify_items = classify_items
+
+
+def run_pipeline(manager, sources, **kwargs):
+    merged = []
+
+    async def merge(accepted, filtered):
+        merged.extend(accepted + filtered)
+
+    pipeline = IngestionPipeline(manager, merge, **kwargs)
+
+    async def run():
+        await pipeline.start()
+        await pipeline.submit(sources)
+        await pipeline.join()
+        await pipeline.stop()
+
+    asyncio.run(run())
+    return merged, pipeline
+
+
+def test_fetching_overlaps_classification(make_source):
+    # Each fetch after the first waits until the previous source's items have
+    # been classified: only a pipeline that classifies while fetching gets
+    # through without the waits timing out
+    classified = {}
+    overlapped = []
+
+    def wait_for_previous(source):
+        index = int(source.source_name.rsplit("-", 1)[1])
+        if index > 0:
+            overlapped.append(
+                classified.setdefault(index - 1, threading.Event()).wait(timeout=5)
+            )
+
+    def mark_classified(items):
+        for name in {item.source for item in items}:
+            index = int(name.rsplit("-", 1)[1])
+            classified.setdefault(index, threading.Event()).set()
+
+    sources = [
+        make_source(f"overlap-{i}", n_items=3, hook=wait_for_previous) for i in range(4)
+    ]
+    manager = IngestionManager(sources, fetch_concurrency=1, adaptive_polling=False)
+    slow_classifier(manager, on_classify=mark_classified)
+    merged, pipeline = run_pipeline(manager, sources, fetch_concurrency=1, batch_size=3)
+    manager.stop()
+    print(f"\nStage stats: {pipeline.stats()}")
+
+    assert len(merged) == 12
+    assert overlapped == [True, True, True]
+    assert pipeline.stats()["classify"]["processed"] == 4
+
+
+def test_backpressure_bounds_work_in_flight(make_source):
+    counter = Counter()
+    sources = [
+        make_source(f"burst-{i}", hook=lambda source: counter.add("fetched"))
+        for i in range(20)
+    ]
+    manager = IngestionManager(sources, adaptive_polling=False)
+    slow_classifier(manager, seconds_per_item=0.05, counter=counter)
+    merged, pipeline = run_pipeline(manager, sources, queue_size=1, fetch_concurrency=2)
+    manager.stop()
+    print(f"\nMax fetched-but-unclassified sources: {counter.max_lag}")
+
+    assert len(merged) == 20
+    # 2 fetch slots + 1 queued + 1 normalizing + 1 queued + 1 classifying
+    assert counter.max_lag <= 6
+
+
+def test_already_seen_items_are_not_reclassified(make_source):
+    sources = [make_source("seen", n_items=4)]
+    manager = IngestionManager(sources, adaptive_polling=False)
+    merged, pipeline = run_pipeline(manager, sources, seen_ids={"seen-0", "seen-1"})
+    manager.stop()
+    assert sorted(item.id for item in merged) == ["seen-2", "seen-3"]
+
+
+def test_pipeline_stats_endpoint():
+    response = TestClient(app).get("/debug/pipeline")
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"fetch", "normalize", "classify", "merge"}
+    assert "queue_depth" in body["classify"]
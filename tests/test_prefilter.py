@@ -0,0 +1,142 @@
+import json
+import os
+
+from newsfeed.ingestion.filtering import (
+    FILTER_LOGS,
+    RULE_PREFILTER,
+    build_classifier_text,
+    get_prefilter_stats,
+    zero_shot_it_relevance_filter_batch,
+)
+from newsfeed.ingestion.prefilter import FAST_TRACK, REJECT, summarize_prefilter
+from newsfeed.models import NewsItem
+
+with open(os.path.join(os.path.dirname(__file__), "test_cases_relevant.json")) as f:
+    test_cases = json.load(f)
+
+
+def test_prefilter_rules():
+    assert RULE_PREFILTER.decide("We're hiring a junior sysadmin")[0] == REJECT
+    decision, label, terms = RULE_PREFILTER.decide("CVE-2025-1234 in OpenSSL")
+    assert decision == FAST_TRACK
+    assert label == "Vulnerability"
+    assert RULE_PREFILTER.decide("Major outages across us-east-1")[0] == FAST_TRACK
+    # Conflicting signals are left to the model
+    assert RULE_PREFILTER.decide("Hiring freeze after ransomware attack")[0] is None
+    # Generic label fragments never short-circuit
+    assert RULE_PREFILTER.decide("Small issue with the system tray icon")[0] is None
+
+
+def make_item(item_id, title):
+    return NewsItem(
+        id=item_id,
+        source="test",
+        title=title,
+        body="",
+        published_at="2025-06-12T12:05:00Z",
+    )
+
+
+def test_enforced_reject_skips_the_model_and_is_logged():
+    item = make_item("prefilter-log-1", "Top 10 mechanical keyboards")
+    (binary_label, max_score, top_label, _) = zero_shot_it_relevance_filter_batch(
+        [item], prefilter_mode="enforce", backend="stub"
+    )[0]
+    assert binary_label == 0
+    assert max_score == 0.0
+    entry = [log for log in FILTER_LOGS if log.get("id") == "prefilter-log-1"][-1]
+    assert entry["stage"] == "prefilter"
+    assert entry["decision"] == "filtered"
+
+
+def test_fast_track_keeps_the_model_score():
+    # "CVE-" fast-tracks; the stub model finds no label in the text (score 0.01)
+    def run(mode):
+        item = make_item(f"prefilter-ft-{mode}", "CVE-2025-1234 in OpenSSL")
+        return zero_shot_it_relevance_filter_batch(
+            [item], min_score=0.08, prefilter_mode=mode, backend="stub"
+        )[0]
+
+    disagreed = get_prefilter_stats()["disagreed"]
+    label, score, _, _ = run("enforce")
+    assert label == 1
+    assert score == 0.01
+
+    # Report mode: the model decides, the lexicon is only logged
+    label, score, _, _ = run("report")
+    assert label == 0
+    assert score == 0.01
+    entry = [log for log in FILTER_LOGS if log.get("id") == "prefilter-ft-report"][-1]
+    assert entry["stage"] == "title+body2"
+    assert entry["prefilter"] == "fast_track"
+    assert entry["matched_terms"] == ["CVE-"]
+    assert get_prefilter_stats()["disagreed"] == disagreed + 2
+
+
+def test_only_enforced_rejects_count_as_skipped():
+    items = [
+        make_item("prefilter-skip-1", "Top 10 mechanical keyboards"),
+        make_item("prefilter-skip-2", "CVE-2025-1234 in OpenSSL"),
+    ]
+    before = get_prefilter_stats()
+    zero_shot_it_relevance_filter_batch(items, prefilter_mode="report", backend="stub")
+    stats = get_prefilter_stats()
+    # Both items were decided by the lexicon, yet both went through the model
+    assert stats[REJECT] == before[REJECT] + 1
+    assert stats[FAST_TRACK] == before[FAST_TRACK] + 1
+    assert stats["skipped"] == before["skipped"]
+    assert stats["fast_tracked"] == before["fast_tracked"]
+    assert stats["mode"] == "report" and stats["skip_rate"] == 0
+
+    zero_shot_it_relevance_filter_batch(items, prefilter_mode="enforce", backend="stub")
+    stats = get_prefilter_stats()
+    assert stats["skipped"] == before["skipped"] + 1
+    assert stats["fast_tracked"] == before["fast_tracked"] + 1
+
+
+def test_prefilter_report_on_relevance_dataset():
+    y_true = [item["relevant"] for item in test_cases]
+    decisions = [
+        RULE_PREFILTER.decide(build_classifier_text(NewsItem(**item)))[0]
+        for item in test_cases
+    ]
+    report = summarize_prefilter(decisions, y_true)
+
+    # Cascade vs model-only on the same set
+    with_prefilter = zero_shot_it_relevance_filter_batch(
+        [NewsItem(**item) for item in test_cases], prefilter_mode="enforce"
+    )
+    model_only = zero_shot_it_relevance_filter_batch(
+        [NewsItem(**item) for item in test_cases], prefilter_mode="off"
+    )
+
+    def precision_recall(decisions):
+        y_pred = [d[0] == 1 for d in decisions]
+        tp = sum(1 for t, p in zip(y_true, y_pred) if t and p)
+        fp = sum(1 for t, p in zip(y_true, y_pred) if not t and p)
+        fn = sum(1 for t, p in zip(y_true, y_pred) if t and not p)
+        return (
+            tp / (tp + fp) if (tp + fp) else 0,
+            tp / (tp + fn) if (tp + fn) else 0,
+        )
+
+    cascade_p, cascade_r = precision_recall(with_prefilter)
+    model_p, model_r = precision_recall(model_only)
+
+    print(
+        f"\nPrefilter: {report['fast_tracked']} fast-track, {report['rejected']} "
+        f"reject of {report['items']} items; enforced, {report['skipped']} skip "
+        f"the model ({report['skip_rate']:.0%})"
+    )
+    print(
+        f"Fast-track precision: {report['fast_track_precision']:.2%}, "
+        f"reject precision: {report['reject_precision']:.2%}, "
+        f"recall ceiling: {report['recall_ceiling']:.2%}"
+    )
+    print(f"Model only:  precision {model_p:.2%}, recall {model_r:.2%}")
+    print(f"Enforced cascade: precision {cascade_p:.2%}, recall {cascade_r:.2%}")
+
+    # A report, not a benchmark: the lexicon was written against this set
+    assert report["items"] == len(test_cases)
+    assert report["skipped"] == report["rejected"]
+    assert summarize_prefilter(decisions, y_true, mode="report")["skip_rate"] == 0
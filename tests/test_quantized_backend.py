@@ -0,0 +1,90 @@
+import json
+import os
+
+import pytest
+
+import newsfeed.ingestion.classifier_backends as classifier_backends
+import newsfeed.ingestion.quantization as quantization
+from newsfeed.config import MIN_SCORE
+from newsfeed.ingestion.classifier_backends import (
+    ZeroShotPipelineBackend,
+    get_classifier_backend,
+)
+from newsfeed.ingestion.filtering import (
+    ZERO_SHOT_LABELS,
+    build_classifier_text,
+    get_classification_cache,
+    is_relevant_label,
+)
+from newsfeed.ingestion.quantization import compare_backends, onnx_available
+from newsfeed.models import NewsItem
+
+with open(os.path.join(os.path.dirname(__file__), "test_cases_relevant.json")) as f:
+    test_cases = json.load(f)
+
+
+@pytest.fixture(scope="module")
+def reference_classifier():
+    reference = get_classifier_backend("bart")
+    if not reference.load():
+        pytest.skip("Reference model unavailable")
+    return reference
+
+
+@pytest.mark.parametrize("backend", ["bart_int8", "bart_onnx"])
+def test_quantized_backend_drift_and_latency(reference_classifier, backend):
+    if backend == "bart_onnx" and not onnx_available():
+        pytest.skip("optimum[onnxruntime] not installed")
+
+    candidate = get_classifier_backend(backend)
+    assert candidate.load()
+    texts = [build_classifier_text(NewsItem(**item)) for item in test_cases]
+    report = compare_backends(
+        reference_classifier,
+        candidate,
+        texts,
+        ZERO_SHOT_LABELS,
+        min_score=MIN_SCORE,
+        decision_labels=[
+            label for label in ZERO_SHOT_LABELS if is_relevant_label(label)
+        ],
+    )
+
+    print(
+        f"\n[{backend}] max |drift|={report['max_abs_drift']:.4f}, "
+        f"mean |drift|={report['mean_abs_drift']:.4f}, "
+        f"decision agreement={report['decision_agreement']:.2%}"
+    )
+    print(
+        f"[{backend}] latency/item: fp32 {report['reference_latency'] * 1000:.1f} ms, "
+        f"{backend} {report['candidate_latency'] * 1000:.1f} ms "
+        f"(speedup x{report['speedup']:.2f})"
+    )
+
+    assert report["decision_agreement"] >= 0.95
+    assert report["mean_abs_drift"] < 0.05
+
+
+def test_onnx_fallback_fingerprints_loaded_runtime(monkeypatch):
+    def failing_export(model_name, hypothesis_template):
+        raise RuntimeError("export failed")
+
+    class FakePipeline:
+        tokenizer = None
+
+    monkeypatch.setattr(quantization, "onnx_available", lambda: True)
+    monkeypatch.setattr(quantization, "_load_onnx_int8", failing_export)
+    monkeypatch.setattr(quantization, "_load_torch_int8", lambda *args: FakePipeline())
+    onnx = ZeroShotPipelineBackend("onnx-fallback", "test/model", runtime="onnx_int8")
+    torch_int8 = ZeroShotPipelineBackend(
+        "torch-int8", "test/model", runtime="torch_int8"
+    )
+    assert onnx.fingerprint != torch_int8.fingerprint
+
+    monkeypatch.setitem(classifier_backends._backends, "onnx-fallback", onnx)
+    stale_cache = get_classification_cache("onnx-fallback")
+    assert onnx.load()
+    assert onnx.loaded_runtime == "torch_int8"
+    assert onnx.fingerprint == torch_int8.fingerprint
+    # Scores cached from now on are keyed by the runtime that produces them
+    assert get_classification_cache("onnx-fallback") is not stale_cache
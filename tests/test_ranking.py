@@ -0,0 +1,112 @@
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from newsfeed.models import NewsItem
+from newsfeed.ranking import RankingIndex, recency_lambda
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+LAMBDA = recency_lambda(30)
+
+
+def make_items(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        NewsItem(
+            id=f"item-{i}",
+            source="test",
+            title=f"Item {i}",
+            published_at=NOW - timedelta(seconds=rng.uniform(0, 90 * 86400)),
+            relevance_score=rng.choice([None, rng.uniform(0.05, 1.0)]),
+        )
+        for i in range(n)
+    ]
+
+
+def rescore_and_sort(items, now):
+    """What /retrieve used to do: decay every item, then sort"""
+    for item in items:
+        if item.relevance_score is not None:
+            age = (now - item.published_at).total_seconds()
+            item.recency_weight = math.exp(-LAMBDA * age)
+            item.final_score = item.relevance_score * item.recency_weight
+        else:
+            item.recency_weight = None
+            item.final_score = None
+    return sorted(
+        items,
+        key=lambda x: (
+            x.final_score if x.final_score is not None else 0,
+            x.published_at,
+        ),
+        reverse=True,
+    )
+
+
+@pytest.mark.parametrize("days_later", [0, 1, 30, 365])
+def test_static_order_matches_decayed_scores(days_later):
+    items = make_items(500)
+    index = RankingIndex(items, recency_lambda=LAMBDA)
+    now = NOW + timedelta(days=days_later)
+    ranked = index.top(now=now)
+    expected = rescore_and_sort(list(items), now)
+    assert [item.id for item in ranked] == [item.id for item in expected]
+    scores = [item.final_score or 0 for item in ranked]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_top_pages_and_scores_only_returned_items():
+    items = make_items(50)
+    index = RankingIndex(items, recency_lambda=LAMBDA)
+    for item in items:
+        item.final_score = None
+    full = [item.id for item in index]
+    page = index.top(limit=10, offset=5, now=NOW)
+    assert [item.id for item in page] == full[5:15]
+    assert sum(item.final_score is not None for item in items) == sum(
+        item.relevance_score is not None for item in page
+    )
+    assert index.top(limit=10, offset=45) == index.top(offset=45)
+    assert index.top(limit=10, offset=60) == []
+
+
+def test_trim_drops_lowest_ranked_and_dedupes():
+    items = make_items(200)
+    index = RankingIndex(items, recency_lambda=LAMBDA)
+    assert not index.append(items[0])
+    best = [item.id for item in index.top(limit=100, now=NOW)]
+    removed = index.trim(100)
+    assert len(index) == 100 and len(removed) == 100
+    assert [item.id for item in index] == best
+    assert items[0] in index or items[0] in removed
+
+
+def test_retrieve_cost_does_not_grow_with_store_size():
+    timings = {}
+    for n in (1_000, 50_000):
+        items = make_items(n, seed=n)
+        start = time.perf_counter()
+        index = RankingIndex(recency_lambda=LAMBDA)
+        for item in items:
+            index.append(item)
+        insert = (time.perf_counter() - start) / n
+
+        start = time.perf_counter()
+        rescore_and_sort(items, NOW)
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            index.top(limit=20, now=NOW)
+        top = (time.perf_counter() - start) / 10
+        timings[n] = top
+        print(
+            f"\n{n} items: insert {insert * 1e6:.1f}us/item, "
+            f"rescore+sort {full * 1000:.1f}ms, top-20 {top * 1000:.3f}ms"
+        )
+        assert top < full / 10
+    # 50x more items: top-k stays within a small factor
+    assert timings[50_000] < timings[1_000] * 10
@@ -0,0 +1,243 @@
+import json
+import time
+from urllib.parse import parse_qs, urlparse
+
+from newsfeed.config import REDDIT_MAX_PAGES
+from newsfeed.ingestion.base_source import FetchToken, running_fetch
+from newsfeed.ingestion.reddit_source import RedditSource
+
+START = int(time.time()) - 100000
+
+
+class FakeResponse:
+    def __init__(self, payload: dict):
+        self.content = json.dumps(payload).encode()
+
+
+class FakeReddit:
+    """In-memory /new listing with Reddit's before/after/limit semantics"""
+
+    def __init__(self):
+        self.posts = []  # newest first
+        self.published = 0
+        self.requests = []
+        self.posts_served = 0
+
+    def publish(self, count: int, subreddits=("sysadmin",)):
+        for i in range(count):
+            self.published += 1
+            n = self.published
+            self.posts.insert(
+                0,
+                {
+                    "id": f"p{n}",
+                    "name": f"t3_p{n}",
+                    "title": f"Post {n}",
+                    "selftext": "",
+                    "subreddit": subreddits[i % len(subreddits)],
+                    "created_utc": START + n,
+                },
+            )
+
+    def get(self, url, source_name, timeout=None):
+        query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+        self.requests.append(query)
+        limit = int(query.get("limit", 25))
+        # Combined listing of r/a+b+c
+        listed = urlparse(url).path.split("/")[2].lower().split("+")
+        posts = [post for post in self.posts if post["subreddit"].lower() in listed]
+        names = [post["name"] for post in posts]
+        if "before" in query:
+            if query["before"] not in names:
+                page, more = [], False
+            else:
+                newer = posts[: names.index(query["before"])]
+                page, more = newer[-limit:], len(newer) > limit
+        else:
+            start = names.index(query["after"]) + 1 if "after" in query else 0
+            page = posts[start : start + limit]
+            more = start + limit < len(posts)
+        self.posts_served += len(page)
+        return FakeResponse(
+            {
+                "data": {
+                    "children": [{"data": post} for post in page],
+                    "after": page[-1]["name"] if page and more else None,
+                }
+            }
+        )
+
+    def forget(self, source_name):
+        pass
+
+
+def make_source(subreddit="sysadmin", source_name="reddit/cursor-test"):
+    source = RedditSource(subreddit, source_name=source_name)
+    source.http = FakeReddit()
+    return source, source.http
+
+
+def newest(items):
+    return max(item.published_at for item in items)
+
+
+def test_continuous_fetch_downloads_only_new_posts():
+    source, reddit = make_source()
+    reddit.publish(200)
+    initial = source.fetch_news(posts_limit=5)
+    assert [item.id for item in initial] == ["p200", "p199", "p198", "p197", "p196"]
+
+    reddit.publish(3)
+    reddit.posts_served = 0
+    new = source.fetch_news(since_timestamp=newest(initial))
+    assert sorted(item.id for item in new) == ["p201", "p202", "p203"]
+    # Only the three new posts were downloaded, via the cursor
+    assert reddit.posts_served == 3
+    assert reddit.requests[-1]["before"] == "t3_p200"
+
+    # Nothing new: an empty page
+    reddit.posts_served = 0
+    assert source.fetch_news(since_timestamp=newest(new)) == []
+    assert reddit.posts_served == 0
+
+
+def test_burst_is_paged_without_missing_posts():
+    source, reddit = make_source()
+    reddit.publish(10)
+    initial = source.fetch_news(posts_limit=5)
+
+    reddit.publish(250)
+    new = source.fetch_news(since_timestamp=newest(initial))
+    print(f"\nBurst of 250 posts fetched in {len(reddit.requests) - 1} requests")
+    assert len(new) == 250
+    assert len({item.id for item in new}) == 250
+    assert [item.id for item in new[:2]] == ["p260", "p259"]
+
+
+def test_unconsumed_fetch_is_fetched_again():
+    source, reddit = make_source()
+    reddit.publish(20)
+    initial = source.fetch_news(posts_limit=5)
+    since = newest(initial)
+    reddit.publish(4)
+    first = source.fetch_news(since_timestamp=since)
+    # The manager did not advance since_timestamp (e.g. the fetch timed out)
+    again = source.fetch_news(since_timestamp=since)
+    assert sorted(item.id for item in again) == sorted(item.id for item in first)
+
+
+def test_abandoned_fetch_leaves_cursors_alone():
+    source, reddit = make_source(subreddit="sysadmin+outages")
+    reddit.publish(10, subreddits=("sysadmin", "outages"))
+    initial = source.fetch_news(posts_limit=5)
+    cursors, subreddit_cursors = list(source.cursors), dict(source.subreddit_cursors)
+    reddit.publish(4, subreddits=("sysadmin", "outages"))
+
+    # The manager gave up on the fetch while it was still running
+    token = FetchToken()
+    token.cancel()
+    with running_fetch(token):
+        assert source.fetch_news(since_timestamp=newest(initial)) == []
+    assert list(source.cursors) == cursors
+    assert source.subreddit_cursors == subreddit_cursors
+
+    new = source.fetch_news(since_timestamp=newest(initial))
+    assert sorted(item.id for item in new) == ["p11", "p12", "p13", "p14"]
+
+
+def test_stale_cursor_falls_back_to_walking_the_listing():
+    source, reddit = make_source()
+    reddit.publish(20)
+    initial = source.fetch_news(posts_limit=5)
+    since = newest(initial)
+    # The cursor post is deleted: `before` now returns nothing
+    reddit.posts = [post for post in reddit.posts if post["name"] != "t3_p20"]
+    reddit.publish(2)
+
+    results = [source.fetch_news(since_timestamp=since) for _ in range(5)]
+    assert all(result == [] for result in results[:4])
+    assert sorted(item.id for item in results[4]) == ["p21", "p22"]
+
+    # Incremental again from the new cursor
+    reddit.publish(1)
+    later = source.fetch_news(since_timestamp=newest(results[4]))
+    assert [item.id for item in later] == ["p23"]
+    assert reddit.requests[-1]["before"] == "t3_p22"
+
+
+def test_subreddits_are_grouped_into_combined_listings():
+    subreddits = [f"sub{i}" for i in range(100)]
+    groups = RedditSource.group(subreddits, group_size=25)
+    assert len(groups) == 4
+    assert groups[1].subreddit == "+".join(subreddits[25:50])
+    assert groups[1].source_name == "reddit/" + groups[1].subreddit
+
+
+def test_combined_listing_is_split_per_subreddit():
+    names = ("Sysadmin", "outages", "cybersecurity")
+    source, reddit = make_source("+".join(names), source_name=None)
+    # Reddit reports the canonical case of the subreddit name
+    reddit.publish(30, subreddits=("sysadmin", "outages", "cybersecurity"))
+
+    initial = source.fetch_news(posts_limit=2)
+    assert len(reddit.requests) == 1
+    by_source = {}
+    for item in initial:
+        by_source.setdefault(item.source, []).append(item.id)
+    assert set(by_source) == {
+        "reddit/Sysadmin",
+        "reddit/outages",
+        "reddit/cybersecurity",
+    }
+    assert all(len(ids) == 2 for ids in by_source.values())
+
+    reddit.publish(6, subreddits=("outages", "cybersecurity"))
+    new = source.fetch_news(since_timestamp=max(i.published_at for i in initial))
+    # One request for the whole group, only the new posts downloaded
+    assert len(reddit.requests) == 2 and reddit.requests[-1]["before"] == "t3_p30"
+    assert {item.source for item in new} == {"reddit/outages", "reddit/cybersecurity"}
+    assert len(new) == 6
+    assert source.subreddit_cursors["reddit/outages"][0] == "t3_p35"
+    assert source.subreddit_cursors["reddit/Sysadmin"][0] == "t3_p28"
+
+
+def test_initial_fetch_of_a_group_reaches_quiet_subreddits():
+    source, reddit = make_source("busy+quiet+empty", source_name=None)
+    reddit.publish(3, subreddits=("quiet",))
+    reddit.publish(1000, subreddits=("busy",))
+
+    initial = source.fetch_news(posts_limit=5)
+    by_source = {}
+    for item in initial:
+        by_source.setdefault(item.source, []).append(item.id)
+    # The quiet posts are buried under the busy ones in the combined listing
+    assert len(by_source["reddit/busy"]) == 5
+    assert by_source["reddit/quiet"] == ["p3", "p2", "p1"]
+    assert "reddit/empty" not in by_source
+    # Read on their own once the combined pages run out
+    assert len(reddit.requests) == REDDIT_MAX_PAGES + 2
+
+
+def test_initial_fetch_of_a_group_stops_when_the_listing_ends():
+    source, reddit = make_source("a+b", source_name=None)
+    reddit.publish(1, subreddits=("a",))
+    reddit.publish(30, subreddits=("b",))
+
+    sources = [item.source for item in source.fetch_news(posts_limit=5)]
+    assert (sources.count("reddit/a"), sources.count("reddit/b")) == (1, 5)
+    # The whole combined listing was read: no per-subreddit request
+    assert len(reddit.requests) == 2
+
+
+def test_deleted_cursor_recovers_from_another_subreddit_cursor():
+    source, reddit = make_source("a+b", source_name=None)
+    reddit.publish(10, subreddits=("a", "b"))
+    initial = source.fetch_news(posts_limit=5)
+    since = max(item.published_at for item in initial)
+    reddit.posts = [post for post in reddit.posts if post["name"] != "t3_p10"]
+    reddit.publish(3, subreddits=("a", "b"))
+
+    results = [source.fetch_news(since_timestamp=since) for _ in range(5)]
+    assert sorted(item.id for item in results[4]) == ["p11", "p12", "p13"]
+    # Paged forward from r/a's cursor (t3_p9) instead of walking from the top
+    assert reddit.requests[-1]["before"] == "t3_p9"
@@ -0,0 +1,98 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from newsfeed.main import accepted_item_ids, accepted_items, app
+from newsfeed.models import NewsItem
+
+client = TestClient(app)
+NOW = datetime.now(timezone.utc)
+
+
+def make_item(i, relevance=None, body_size=200):
+    return NewsItem(
+        id=f"page-{i}",
+        source="test",
+        title=f"Outage report {i}",
+        body="Service degraded in several regions. " * (body_size // 36 + 1),
+        published_at=NOW - timedelta(minutes=i),
+        relevance_score=relevance if relevance is not None else 0.5 + (i % 7) / 20,
+    )
+
+
+@pytest.fixture(autouse=True)
+def store():
+    accepted_items.clear()
+    accepted_item_ids.clear()
+    for i in range(50):
+        item = make_item(i)
+        accepted_items.append(item)
+        accepted_item_ids.add(item.id)
+    yield
+    accepted_items.clear()
+    accepted_item_ids.clear()
+
+
+def test_default_returns_everything_ranked():
+    response = client.get("/retrieve")
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    scores = [item["final_score"] for item in response.json()]
+    assert len(scores) == 50
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_cursor_pagination_is_stable_while_items_arrive():
+    seen = []
+    response = client.get("/retrieve", params={"limit": 20})
+    first_page = [item["id"] for item in response.json()]
+    seen.extend(first_page)
+    cursor = response.headers["X-Next-Cursor"]
+
+    # A new top item arrives between pages
+    accepted_items.append(make_item(999, relevance=1.0))
+
+    while cursor:
+        response = client.get("/retrieve", params={"limit": 20, "cursor": cursor})
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+
+    assert len(seen) == len(set(seen)) == 50
+    assert "page-999" not in seen
+    full = [item["id"] for item in client.get("/retrieve").json()]
+    assert full[0] == "page-999"
+    assert full[1:21] == first_page
+
+
+def test_field_projection_and_bad_parameters():
+    response = client.get("/retrieve", params={"limit": 3, "fields": "id,title"})
+    assert response.status_code == 200
+    assert [set(item) for item in response.json()] == [{"id", "title"}] * 3
+
+    assert client.get("/retrieve", params={"fields": "id,secret"}).status_code == 400
+    assert client.get("/retrieve", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/retrieve", params={"limit": 0}).status_code == 422
+
+
+def test_dashboard_top20_costs_less_than_full_retrieve():
+    accepted_items.clear()
+    for i in range(500):
+        accepted_items.append(make_item(i, body_size=4000))
+
+    def measure(params):
+        start = time.perf_counter()
+        for _ in range(5):
+            response = client.get("/retrieve", params=params)
+        return (time.perf_counter() - start) / 5, len(response.content)
+
+    full_time, full_bytes = measure({})
+    top_time, top_bytes = measure({"limit": 20, "fields": "id,title,final_score"})
+    print(
+        f"\nFull /retrieve: {full_time * 1000:.1f}ms, {full_bytes / 1024:.0f}KiB | "
+        f"top-20 without bodies: {top_time * 1000:.1f}ms, {top_bytes / 1024:.1f}KiB"
+    )
+    assert top_bytes < full_bytes / 100
+    assert top_time < full_time
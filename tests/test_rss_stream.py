@@ -0,0 +1,160 @@
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from xml.etree.ElementTree import ParseError
+
+import feedparser
+import pytest
+
+from newsfeed.ingestion.ars_technica_source import ArsTechnicaSource
+from newsfeed.ingestion.rss_stream import iter_rss_entries, parse_rss_date
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+# Ars Technica's feed carries the full article in content:encoded
+ARTICLE = "<p>" + "The outage affected several regions. " * 400 + "</p>"
+
+
+def make_feed(n_items=25):
+    """An Ars-like RSS 2.0 feed, newest item first"""
+    items = "".join(
+        f"""<item>
+<title>Security update {i} released</title>
+<link>https://arstechnica.com/security/2026/10/update-{i}/</link>
+<dc:creator><![CDATA[Reporter {i}]]></dc:creator>
+<pubDate>{(NOW - timedelta(minutes=30 * i)).strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate>
+<category><![CDATA[Security]]></category>
+<guid isPermaLink="false">https://arstechnica.com/?p={1000 + i}</guid>
+<description><![CDATA[Patch {i} fixes a critical vulnerability.]]></description>
+<content:encoded><![CDATA[{ARTICLE}]]></content:encoded>
+</item>"""
+        for i in range(n_items)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel><title>Ars Technica - All content</title>
+<link>https://arstechnica.com</link>
+<description>Serving the Technologist since 1998.</description>
+{items}
+</channel></rss>""".encode()
+
+
+def chunked(data, size=16 * 1024):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+def feedparser_entries(feed, since):
+    entries = []
+    for entry in feedparser.parse(feed).entries:
+        published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+        if published > since:
+            entries.append((entry.id, entry.title, entry.summary, published))
+    return entries
+
+
+def measure(parse):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = parse()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def test_stream_matches_feedparser():
+    feed = make_feed()
+    streamed = [
+        (e["id"], e["title"], e["summary"], e["published"])
+        for e in iter_rss_entries(chunked(feed))
+    ]
+    assert len(streamed) == 25
+    assert streamed == feedparser_entries(feed, NOW - timedelta(days=30))
+
+
+def test_stops_at_last_seen_entry_without_reading_the_rest():
+    feed = make_feed()
+    consumed = []
+
+    def chunks():
+        for chunk in chunked(feed):
+            consumed.append(len(chunk))
+            yield chunk
+
+    since = NOW - timedelta(minutes=30 * 3)
+    entries = list(iter_rss_entries(chunks(), since_timestamp=since))
+    assert [e["title"] for e in entries] == [
+        f"Security update {i} released" for i in range(3)
+    ]
+    # Stopped after the 4th item, well before the end of the feed
+    assert sum(consumed) < len(feed) / 4
+
+
+def test_limit_and_dates():
+    entries = list(iter_rss_entries(chunked(make_feed()), limit=5))
+    assert len(entries) == 5
+    assert entries[0]["published"] == NOW
+    assert parse_rss_date("Sat, 18 Oct 2026 14:00:00 +0200") == NOW
+    assert parse_rss_date("not a date") is None
+
+
+def test_malformed_feed_yields_entries_before_the_error():
+    feed = make_feed(5)
+    broken = feed[: feed.index(b"<item>", feed.index(b"update 2"))] + b"<item><oops"
+    entries = []
+    with pytest.raises(ParseError):
+        for entry in iter_rss_entries([broken, b"</item></channel>"]):
+            entries.append(entry)
+    assert len(entries) == 3
+
+
+class FakeHttp:
+    """Serves one feed body in small chunks, as the shared HTTP client would"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def get(self, url, source_name, timeout=None, stream=False):
+        return self
+
+    def iter_content(self, response, source_name):
+        yield from chunked(self.body, size=1024)
+
+    def forget(self, source_name):
+        pass
+
+
+def test_entity_in_feed_falls_back_to_feedparser():
+    # HTML entities are valid for feedparser but a ParseError for ElementTree
+    feed = make_feed(5).replace(
+        b"<title>Security update 3 released</title>",
+        b"<title>Security&nbsp;update 3 released</title>",
+    )
+    source = ArsTechnicaSource(source_name="ars-entity-test", streaming=True)
+    source.http = FakeHttp(feed)
+    items = source.fetch_news(
+        since_timestamp=NOW - timedelta(minutes=30 * 4, seconds=1)
+    )
+    # Every new entry is returned, including those after the entity
+    assert len(items) == 5
+    assert items[3].title == "Security\xa0update 3 released"
+
+
+def test_streaming_parse_is_faster_and_smaller_than_feedparser():
+    feed = make_feed()
+    # Steady state: only the two newest items are new since the last poll
+    since = NOW - timedelta(minutes=30 * 2)
+
+    expected, full_time, full_peak = measure(lambda: feedparser_entries(feed, since))
+    entries, stream_time, stream_peak = measure(
+        lambda: list(iter_rss_entries(chunked(feed), since_timestamp=since))
+    )
+    print(
+        f"\nfeedparser: {full_time * 1000:.1f}ms, peak {full_peak / 1024:.0f}KiB | "
+        f"streaming: {stream_time * 1000:.1f}ms, peak {stream_peak / 1024:.0f}KiB "
+        f"(feed {len(feed) / 1024:.0f}KiB)"
+    )
+    assert [e["id"] for e in entries] == [e[0] for e in expected]
+    assert stream_time < full_time
+    assert stream_peak < full_peak
@@ -0,0 +1,123 @@
+import pytest
+
+from newsfeed.ingestion.manager import IngestionManager
+from newsfeed.ingestion.scheduler import PollScheduler
+
+
+@pytest.fixture
+def make_scheduler(fake_clock):
+    def make(names, **kwargs):
+        options = dict(
+            interval=30,
+            min_interval=10,
+            max_interval=300,
+            target_items=3,
+            clock=fake_clock,
+        )
+        options.update(kwargs)
+        return PollScheduler(names, **options), fake_clock
+
+    return make
+
+
+def test_busy_feeds_are_polled_more_often_than_quiet_ones(make_scheduler):
+    scheduler, clock = make_scheduler(["busy", "quiet"], request_budget=1000)
+    for _ in range(10):
+        clock.now += 30
+        scheduler.record("busy", new_items=12)  # 24 items/min
+        scheduler.record("quiet", new_items=0)
+    stats = scheduler.stats()
+    assert stats["busy"]["interval"] == 10
+    assert stats["quiet"]["interval"] == 300
+
+
+def test_adaptive_polling_spends_fewer_requests(make_scheduler):
+    # One hour: a busy subreddit (12 posts/min) and nine quiet feeds (1 post/hour)
+    rates = {"busy": 12 / 60, **{f"quiet{i}": 1 / 3600 for i in range(9)}}
+    scheduler, clock = make_scheduler(list(rates), request_budget=1000)
+    pending = {name: 0.0 for name in rates}
+    last_poll = {name: clock.now for name in rates}
+    polls = 0
+    busy_delays = []
+    for _ in range(3600):
+        clock.now += 1
+        for name in rates:
+            pending[name] += rates[name]
+        for name in scheduler.due():
+            polls += 1
+            new_items = int(pending[name])
+            pending[name] -= new_items
+            if name == "busy":
+                busy_delays.append(clock.now - last_poll[name])
+            last_poll[name] = clock.now
+            scheduler.record(name, new_items=new_items)
+    fixed_polls = 10 * 3600 // 30
+    print(f"\nAdaptive: {polls} polls vs fixed 30s interval: {fixed_polls}")
+    assert polls < fixed_polls / 3
+    # After its first poll, the busy feed is polled more often than every 30s
+    assert max(busy_delays[1:]) < 30
+
+
+def test_backoff_on_429_and_recovery(make_scheduler):
+    scheduler, clock = make_scheduler(["reddit"], request_budget=1000)
+    clock.now += 30
+    scheduler.record("reddit", 0, response={"status": 429, "retry_after": None})
+    first = scheduler.stats()["reddit"]["next_poll_in"]
+    clock.now += first
+    scheduler.record("reddit", 0, response={"status": 503})
+    second = scheduler.stats()["reddit"]["next_poll_in"]
+    assert second == 2 * first
+    clock.now += second
+    scheduler.record("reddit", 0, response={"status": 429, "retry_after": 900})
+    assert scheduler.stats()["reddit"]["next_poll_in"] == 900
+
+    clock.now += 900
+    scheduler.record("reddit", 6, response={"status": 200})
+    stats = scheduler.stats()["reddit"]
+    assert stats["failures"] == 0
+    assert stats["next_poll_in"] <= 300
+
+
+def test_rate_limit_headers_defer_until_reset(make_scheduler):
+    scheduler, clock = make_scheduler(["reddit"], request_budget=1000)
+    clock.now += 30
+    scheduler.record(
+        "reddit",
+        30,
+        response={"status": 200, "ratelimit_remaining": 2, "ratelimit_reset": 240},
+    )
+    assert scheduler.stats()["reddit"]["next_poll_in"] == 240
+
+
+def test_global_request_budget(make_scheduler):
+    names = [f"source{i}" for i in range(10)]
+    scheduler, clock = make_scheduler(names, request_budget=4)
+    clock.now += 30
+    assert len(scheduler.due()) == 4
+    assert scheduler.due() == []
+    # One token every 15s
+    assert scheduler.seconds_until_next_poll() == 15
+    clock.now += 15
+    assert len(scheduler.due()) == 1
+    # Paging requests are charged too
+    scheduler.record("source0", 200, requests=3)
+    clock.now += 30
+    assert len(scheduler.due()) == 0
+
+
+def test_manager_polls_only_due_sources(make_source, fake_clock):
+    sources = [make_source("a"), make_source("b")]
+    manager = IngestionManager(sources=sources, interval=30, adaptive_polling=True)
+    clock = fake_clock
+    manager.scheduler = PollScheduler(["a", "b"], interval=30, clock=clock)
+    assert manager.due_sources() == []
+    assert manager.seconds_until_next_poll() == 30
+
+    clock.now += 30
+    manager.scheduler.sources["b"].next_poll += 60
+    due = manager.due_sources()
+    assert [s.source_name for s in due] == ["a"]
+    manager.continuous_fetch_sources(sources=due)
+    manager.stop()
+    assert (sources[0].calls, sources[1].calls) == (1, 0)
+    assert manager.scheduler.stats()["a"]["polls"] == 1
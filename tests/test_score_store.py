@@ -0,0 +1,157 @@
+import time
+
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+import newsfeed.evaluate_thresholds as evaluate_thresholds
+import newsfeed.ingestion.filtering as filtering
+from newsfeed.config import DEFAULT_CLASSIFIER_BACKEND
+from newsfeed.evaluate_thresholds import (
+    DEFAULT_DATASET,
+    candidate_subsets,
+    labelled_rows,
+    missing_labels,
+    store_from_dataset,
+)
+from newsfeed.ingestion.filtering import (
+    ZERO_SHOT_LABELS,
+    assess_with_bigger_model,
+    save_score_store,
+    zero_shot_it_relevance_filter_batch,
+)
+from newsfeed.ingestion.score_store import (
+    ScoreStore,
+    label_subset_masks,
+    sweep_thresholds,
+)
+from newsfeed.models import NewsItem
+
+LABELS = ["a", "b", "c", "d"]
+
+
+def test_store_roundtrip_update_and_bound(tmp_path):
+    store = ScoreStore(LABELS, max_items=100)
+    for i in range(150):
+        store.add(f"item-{i}", [i / 150, 0.1, 0.2, 0.3], relevant=i % 2 == 0)
+    store.add("item-149", [0.0, 0.0, 0.0, 1.0])  # update keeps the row and label
+    assert len(store) <= 100
+    assert store.ids[-1] == "item-149"
+    assert store.scores[-1].tolist() == [0.0, 0.0, 0.0, 1.0]
+
+    path = str(tmp_path / "scores.npz")
+    store.save(path)
+    loaded = ScoreStore.load(path)
+    assert loaded.labels == LABELS
+    assert loaded.ids == store.ids
+    np.testing.assert_array_equal(loaded.scores, store.scores)
+    np.testing.assert_array_equal(loaded.ground_truth, store.ground_truth)
+
+
+def test_backend_column_and_labels_from_another_process(tmp_path):
+    path = str(tmp_path / "scores.npz")
+    server = ScoreStore(LABELS)
+    server.add("item-1", [0.9, 0.1, 0.1, 0.1], backend="bart")
+    server.add("item-2", [0.1, 0.1, 0.1, 0.9], backend="stub")
+    server.add("item-3", [0.1, 0.8, 0.1, 0.1], backend="bart")
+    server.save(path)
+
+    # e.g. show_news.py attaching LLM verdicts to the saved rows
+    client = ScoreStore.load(path)
+    client.set_ground_truth({"item-1": True, "item-2": False, "item-3": False})
+    client.save(path)
+
+    # The server's next save keeps those labels
+    server.save(path)
+    loaded = ScoreStore.load(path)
+    assert loaded.backends.tolist() == ["bart", "stub", "bart"]
+    assert loaded.ground_truth.tolist() == [1, 0, 0]
+    assert labelled_rows(loaded, "bart").tolist() == [True, False, True]
+    assert labelled_rows(loaded, "stub").tolist() == [False, True, False]
+
+
+def test_llm_verdicts_become_ground_truth(monkeypatch):
+    class FakeAssessor:
+        def assess(self, items):
+            return {
+                item.id: (
+                    "RELEVANT" if "outage" in item.title.lower() else "NOT_RELEVANT"
+                )
+                for item in items
+            }
+
+    items = [
+        NewsItem(
+            id=f"truth-{i}",
+            source="test",
+            title=title,
+            body="",
+            published_at="2025-06-12T12:05:00Z",
+        )
+        for i, title in enumerate(["Major outage in eu-west-1", "Team lunch"])
+    ]
+    monkeypatch.setattr(filtering, "get_llm_assessor", lambda: FakeAssessor())
+    zero_shot_it_relevance_filter_batch(items, prefilter_mode="off", backend="stub")
+    assess_with_bigger_model(items)
+    save_score_store()
+
+    store = ScoreStore.load(filtering.SCORE_STORE_PATH)
+    rows = [store.ids.index(item.id) for item in items]
+    assert store.labels == ZERO_SHOT_LABELS
+    assert store.ground_truth[rows].tolist() == [1, 0]
+    assert store.backends[rows].tolist() == ["stub", "stub"]
+
+
+def test_sweep_matches_sklearn():
+    rng = np.random.default_rng(0)
+    scores = rng.random((200, len(LABELS)), dtype=np.float32)
+    y_true = rng.random(200) < 0.4
+    subsets = [["a", "b"], ["c"], LABELS]
+    thresholds = np.array([0.2, 0.5, 0.8, 0.95])
+    metrics = sweep_thresholds(
+        scores, y_true, label_subset_masks(LABELS, subsets), thresholds
+    )
+    for s, subset in enumerate(subsets):
+        columns = [LABELS.index(label) for label in subset]
+        for t, threshold in enumerate(thresholds):
+            y_pred = scores[:, columns].max(axis=1) >= threshold
+            assert np.isclose(
+                metrics["precision"][s, t], precision_score(y_true, y_pred)
+            )
+            assert np.isclose(metrics["recall"][s, t], recall_score(y_true, y_pred))
+            assert np.isclose(metrics["f1"][s, t], f1_score(y_true, y_pred))
+
+
+def test_sweep_on_dataset_needs_no_inference():
+    store = store_from_dataset(DEFAULT_DATASET, backend="stub")
+    subsets = candidate_subsets()
+    masks = label_subset_masks(store.labels, [labels for _, labels in subsets])
+    thresholds = np.arange(0.01, 1.0, 0.01)
+
+    start = time.perf_counter()
+    metrics = sweep_thresholds(store.scores, store.ground_truth == 1, masks, thresholds)
+    elapsed = time.perf_counter() - start
+    print(
+        f"\nSwept {len(subsets)} label sets x {len(thresholds)} thresholds "
+        f"on {len(store)} items in {elapsed * 1000:.1f} ms"
+    )
+    assert metrics["f1"].shape == (len(subsets), len(thresholds))
+    assert elapsed < 1.0
+
+
+def test_store_saved_with_other_labels_is_reported(tmp_path, monkeypatch, capsys):
+    subsets = candidate_subsets()
+    assert missing_labels(ScoreStore(ZERO_SHOT_LABELS), subsets) == []
+    # A store saved before the first (relevant) label was renamed in config
+    renamed = ["Renamed label"] + ZERO_SHOT_LABELS[1:]
+    store = ScoreStore(renamed)
+    store.add("old-1", [0.1] * len(renamed), True, backend=DEFAULT_CLASSIFIER_BACKEND)
+    assert missing_labels(store, subsets) == [ZERO_SHOT_LABELS[0]]
+
+    path = str(tmp_path / "old_labels.npz")
+    store.save(path)
+    monkeypatch.setattr("sys.argv", ["evaluate_thresholds", "--store", path])
+    with pytest.raises(SystemExit) as exit_info:
+        evaluate_thresholds.main()
+    assert exit_info.value.code == 1
+    assert "Outage" in capsys.readouterr().out
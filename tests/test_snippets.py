@@ -0,0 +1,145 @@
+import re
+
+import pytest
+
+import newsfeed.ingestion.classifier_backends as classifier_backends
+from newsfeed.config import CLASSIFIER_SNIPPET_MAX_TOKENS
+from newsfeed.ingestion.classifier_backends import (
+    ZeroShotPipelineBackend,
+    get_classifier_backend,
+)
+from newsfeed.ingestion.filtering import (
+    build_classifier_text,
+    get_classification_cache,
+    get_first_n_sentences,
+    zero_shot_it_relevance_filter_batch,
+)
+from newsfeed.ingestion.snippets import (
+    BATCH_TOKEN_STATS,
+    CHARS_PER_TOKEN_SCAN,
+    TokenCounter,
+    build_snippet,
+    get_batch_token_stats,
+)
+from newsfeed.models import NewsItem
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "One. Two! Three? Four.",
+        "No boundary at all",
+        "Trailing space.  Double  space. Done",
+        "",
+    ],
+)
+def test_first_n_sentences_matches_full_split(text):
+    expected = " ".join(re.split(r"(?<=[.!?]) +", text)[:2]) if text else ""
+    assert get_first_n_sentences(text, n=2) == expected
+
+
+def test_snippet_stops_at_token_budget():
+    counter = TokenCounter()  # whitespace words
+    body = "word " * 50 + ". Second sentence."
+    snippet = build_snippet("Outage in eu-west-1", body, counter, max_tokens=20)
+    assert counter.count(snippet) == 20
+    assert snippet.startswith("Outage in eu-west-1 word")
+
+
+class RecordedBody(str):
+    """Body recording the slices taken of it"""
+
+    def __new__(cls, value):
+        body = super().__new__(cls, value)
+        body.reads = []
+        return body
+
+    def __getitem__(self, key):
+        self.reads.append(key)
+        return super().__getitem__(key)
+
+
+class RecordingCounter(TokenCounter):
+    """Word counter recording the length of every text it counts"""
+
+    def __init__(self):
+        super().__init__()
+        self.counted = []
+
+    def count(self, text):
+        self.counted.append(len(text))
+        return super().count(text)
+
+
+def test_snippet_does_not_scan_huge_body():
+    counter = RecordingCounter()
+    body = RecordedBody("x" * 5_000_000)  # one giant "sentence" without punctuation
+    snippet = build_snippet("Title", body, counter, max_tokens=32)
+    scan_limit = 32 * CHARS_PER_TOKEN_SCAN
+    # The body is only read through its bounded prefix ...
+    assert body.reads == [slice(None, scan_limit, None)]
+    # ... so no text longer than that is ever tokenized
+    assert max(counter.counted) <= scan_limit
+    assert snippet == "Title " + "x" * scan_limit
+
+
+def test_unloaded_backend_never_fetches_tokenizer(monkeypatch):
+    fetched = []
+
+    def from_pretrained(model_name):
+        fetched.append(model_name)
+        raise OSError("no network in the ingest loop")
+
+    monkeypatch.setattr(
+        classifier_backends.AutoTokenizer, "from_pretrained", from_pretrained
+    )
+    backend = ZeroShotPipelineBackend("unloaded", "test/model")
+    monkeypatch.setitem(classifier_backends._backends, "unloaded", backend)
+    item = NewsItem(
+        id="tokenizer-1",
+        source="test",
+        title="Outage in eu-west-1",
+        body="word " * 500,
+        published_at="2025-06-12T12:05:00Z",
+    )
+    text = build_classifier_text(item, backend="unloaded")
+    assert fetched == []
+    # Cut by words until the pipeline brings the model's tokenizer
+    assert len(text.split()) == CLASSIFIER_SNIPPET_MAX_TOKENS
+
+
+def test_length_bucketing_reduces_padding():
+    lengths = [3, 60, 4, 55, 5, 58, 3, 62]
+    items = [
+        NewsItem(
+            id=f"bucket-{i}",
+            source="test",
+            title=f"Item {i} " + "word " * n,
+            body="",
+            published_at="2025-06-12T12:05:00Z",
+        )
+        for i, n in enumerate(lengths)
+    ]
+    counter = TokenCounter(get_classifier_backend("stub").tokenizer)
+    token_counts = [counter.count(item.title.strip()) for item in items]
+    # Padding of the arrival order, two items per batch
+    unsorted_padding = sum(
+        max(token_counts[i : i + 2]) * 2 - sum(token_counts[i : i + 2])
+        for i in range(0, len(token_counts), 2)
+    )
+
+    # Start from a cold cache so every item goes through a batch
+    get_classification_cache("stub").clear()
+    for key in BATCH_TOKEN_STATS:
+        BATCH_TOKEN_STATS[key] = 0
+    zero_shot_it_relevance_filter_batch(
+        items, batch_size=2, prefilter_mode="off", backend="stub"
+    )
+    stats = get_batch_token_stats()
+    print(
+        f"\nTokens/item {stats['tokens_per_item']:.1f}, padding waste "
+        f"{stats['padding_waste']:.1%} (arrival order: {unsorted_padding} padded tokens, "
+        f"bucketed: {stats['padded_tokens']})"
+    )
+    assert stats["items"] == len(items)
+    assert stats["padded_tokens"] < unsorted_padding